@@ -0,0 +1,36 @@
+"""Unit conversions per second through `Unit`, `Measurement` and `MeasurementArray`.
+
+Run with `python benchmarks/bench_convert.py`.
+"""
+import timeit
+from typing import Dict
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement, MeasurementArray
+from hole_pad_calc.unit import Unit
+
+NUMBER = 100_000
+ARRAY_SIZE = 100_000
+
+
+def per_second(statement, number: int, items: int = 1) -> float:
+    """Best-of-five throughput of `statement` in conversions per second."""
+    best = min(timeit.repeat(statement, number=number, repeat=5))
+    return number * items / best
+
+
+def run() -> Dict[str, float]:
+    mm = Unit("mm")
+    measurement = Measurement(1.27, "mm")
+    array = MeasurementArray(np.linspace(0.1, 5.0, ARRAY_SIZE), "mm")
+    return {
+        "Unit.convert": per_second(lambda: mm.convert(1.27, "mil"), NUMBER),
+        "Measurement.convert": per_second(lambda: measurement.convert("mil"), NUMBER),
+        "MeasurementArray.convert": per_second(lambda: array.convert("mil"), 20, ARRAY_SIZE),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<28} {value:>16,.0f} /s")
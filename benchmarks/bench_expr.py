@@ -0,0 +1,52 @@
+"""Eager versus lazy `(a + b) * c - d` on measurements and measurement arrays.
+
+Run with `python benchmarks/bench_expr.py`.
+"""
+import timeit
+from typing import Dict
+
+import numpy as np
+
+from hole_pad_calc.expr import lazy
+from hole_pad_calc.measurement import Measurement, MeasurementArray
+
+ARRAY_SIZE = 1_000_000
+
+
+def best(statement, number: int) -> float:
+    """Best-of-five seconds per run of `statement`."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number
+
+
+def run(size: int = ARRAY_SIZE) -> Dict[str, float]:
+    a, b, c, d = Measurement(1.0, "in"), Measurement(2.0, "mm"), Measurement(3.0, "mil"), Measurement(0.5, "in")
+    la, lb, lc, ld = lazy(a, b, c, d)
+    values = np.linspace(0.1, 3.0, size)
+    x, y, z = MeasurementArray(values, "mm"), MeasurementArray(values / 25.4, "in"), MeasurementArray(values, "mm")
+    lx, ly, lz = lazy(x, y, z)
+    accumulator = MeasurementArray(np.zeros(size), "mm")
+
+    def accumulate_eager() -> None:
+        total = MeasurementArray(np.zeros(size), "mm")
+        for _ in range(10):
+            total = total + z
+
+    def accumulate_in_place() -> None:
+        accumulator.values[:] = 0.0
+        total = accumulator
+        for _ in range(10):
+            total += z
+
+    return {
+        "scalar eager (us)": best(lambda: (a + b) * c - d, 20_000) * 1e6,
+        "scalar lazy (us)": best(lambda: ((la + lb) * lc - ld).evaluate(), 20_000) * 1e6,
+        "array eager (ms)": best(lambda: (x + y) * z - y, 10) * 1e3,
+        "array lazy (ms)": best(lambda: ((lx + ly) * lz - ly).evaluate(), 10) * 1e3,
+        "10 x array + (ms)": best(accumulate_eager, 5) * 1e3,
+        "10 x array += (ms)": best(accumulate_in_place, 5) * 1e3,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<22} {value:>10.2f}")
@@ -0,0 +1,53 @@
+"""Cold import time of the calculation core.
+
+Run with `python benchmarks/bench_import.py`. Each sample imports
+`hole_pad_calc.rect_calc` in a fresh interpreter with `-X importtime`. The
+exit status is 1 if the median import, excluding numpy, exceeds `BUDGET_US`.
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+MODULE = "hole_pad_calc.rect_calc"
+SAMPLES = 7
+# Cold import budget for the calculation core, excluding numpy. Importing
+# rich and rich_gradient alone costs more than this.
+BUDGET_US = 40_000
+
+
+def import_times(module: str = MODULE) -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module `module` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times.setdefault(name.strip(), int(cumulative))
+    return times
+
+
+def own_import_time(module: str = MODULE) -> int:
+    """Cold import time of `module` in microseconds, excluding numpy."""
+    times = import_times(module)
+    return times[module] - times.get("numpy", 0)
+
+
+if __name__ == "__main__":
+    samples = [import_times() for _ in range(SAMPLES)]
+    total = statistics.median(s[MODULE] for s in samples)
+    numpy = statistics.median(s.get("numpy", 0) for s in samples)
+    own = statistics.median(s[MODULE] - s.get("numpy", 0) for s in samples)
+    rich = any(name.startswith("rich") for s in samples for name in s)
+    print(f"import {MODULE:<24} {total / 1000:>8.1f} ms")
+    print(f"  of which numpy              {numpy / 1000:>8.1f} ms")
+    print(f"  excluding numpy             {own / 1000:>8.1f} ms")
+    print(f"  rich imported               {rich!s:>8}")
+    print(f"  budget                      {BUDGET_US / 1000:>8.1f} ms")
+    sys.exit(1 if own > BUDGET_US or rich else 0)
@@ -0,0 +1,54 @@
+"""Per-object memory and construction cost of `Unit` and `Measurement`.
+
+Run with `python benchmarks/bench_objects.py`.
+"""
+import gc
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+from hole_pad_calc.measurement import Measurement
+from hole_pad_calc.unit import Unit
+
+COUNT = 100_000
+
+
+def bytes_per_object(factory: Callable[[int], object], count: int = COUNT) -> float:
+    """Average traced allocation size of one object built by `factory`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list holding the objects.
+    size -= keep.__sizeof__()
+    return size / count
+
+
+def nanoseconds_per_call(statement: Callable[[], object], number: int = COUNT) -> float:
+    """Best-of-five average cost of one call to `statement`."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def run() -> Dict[str, float]:
+    mm = Unit("mm")
+    a = Measurement(1.0, "in")
+    b = Measurement(25.4, "mm")
+    results = {
+        "Unit bytes": bytes_per_object(lambda i: Unit("mm")),
+        "Measurement bytes": bytes_per_object(lambda i: Measurement(float(i), "mm")),
+        "Unit('mm') ns": nanoseconds_per_call(lambda: Unit("mm")),
+        "Measurement(v, 'mm') ns": nanoseconds_per_call(lambda: Measurement(1.5, "mm")),
+        "Measurement(v, Unit) ns": nanoseconds_per_call(lambda: Measurement(1.5, mm)),
+        "Measurement._make(v, Unit) ns": nanoseconds_per_call(lambda: Measurement._make(1.5, mm)),
+        "Measurement + Measurement ns": nanoseconds_per_call(lambda: a + b),
+        "Measurement.convert ns": nanoseconds_per_call(lambda: b.convert("in")),
+    }
+    return results
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<32} {value:>10.1f}")
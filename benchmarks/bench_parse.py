@@ -0,0 +1,38 @@
+"""Dimension literals parsed per second, row by row and as a column.
+
+Run with `python benchmarks/bench_parse.py`.
+"""
+import timeit
+from typing import Dict, List
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement
+
+ROWS = 1_000_000
+UNITS = ("mm", " mil", " in", "")
+
+
+def column(rows: int = ROWS) -> List[str]:
+    """`rows` literals in every unit spelling, e.g. "1.27mm", "40.5 mil" and a bare "0.05"."""
+    values = np.round(np.random.default_rng(1).uniform(0.1, 100.0, rows), 3).tolist()
+    return [f"{value}{UNITS[index % len(UNITS)]}" for index, value in enumerate(values)]
+
+
+def per_second(statement, rows: int) -> float:
+    """Best-of-three throughput of `statement` in rows per second."""
+    return rows / min(timeit.repeat(statement, number=1, repeat=3))
+
+
+def run(rows: int = ROWS) -> Dict[str, float]:
+    texts = column(rows)
+    return {
+        "Measurement.parse per row": per_second(lambda: [Measurement.parse(text) for text in texts], rows),
+        "Measurement.parse_many": per_second(lambda: Measurement.parse_many(texts), rows),
+        "parse_many + convert": per_second(lambda: Measurement.parse_many(texts).convert("mm"), rows),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name:<28} {value:>16,.0f} /s")
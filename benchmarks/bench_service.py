@@ -0,0 +1,58 @@
+"""Requests per second and latency of the calculation service, with and without micro-batching.
+
+Clients keep `CONNECTIONS` HTTP connections open and send pin requests back
+to back. Run with `python benchmarks/bench_service.py`.
+"""
+import asyncio
+import json
+from time import perf_counter
+from typing import Dict
+
+from hole_pad_calc.service import Service
+
+CONNECTIONS = 64
+REQUESTS = 20_000
+
+
+async def _connection(port: int, requests: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps({"length": 1.27, "width": 0.64, "unit": "mm"}).encode()
+    request = b"POST /pin HTTP/1.1\r\nHost: bench\r\nContent-Length: %d\r\n\r\n" % len(body) + body
+    for _ in range(requests):
+        writer.write(request)
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+    writer.close()
+
+
+async def _run(max_batch: int, max_delay: float) -> Dict[str, float]:
+    async with Service(max_batch=max_batch, max_delay=max_delay) as service:
+        server = await service.listen(port=0)
+        port = server.sockets[0].getsockname()[1]
+        started = perf_counter()
+        await asyncio.gather(*(_connection(port, REQUESTS // CONNECTIONS) for _ in range(CONNECTIONS)))
+        elapsed = perf_counter() - started
+        server.close()
+        await server.wait_closed()
+        stats = service.stats()
+    latency = stats.latency_ms["POST /pin"]
+    return {
+        "requests/s": stats.requests / elapsed,
+        "p50 ms": latency["p50"],
+        "p99 ms": latency["p99"],
+        "rows/batch": stats.mean_batch_rows,
+    }
+
+
+def run() -> Dict[str, Dict[str, float]]:
+    return {
+        "one request per batch": asyncio.run(_run(1, 0.0)),
+        "micro-batched": asyncio.run(_run(65_536, 0.0)),
+        "micro-batched, 1 ms": asyncio.run(_run(65_536, 0.001)),
+    }
+
+
+if __name__ == "__main__":
+    for name, results in run().items():
+        print(f"{name:<24}" + "".join(f"{key:>12} {value:>10,.2f}" for key, value in results.items()))
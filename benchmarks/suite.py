@@ -0,0 +1,212 @@
+"""Benchmark suite for the `Measurement`, `Unit` and `RectCalc` hot paths.
+
+Every case is timed at several batch sizes and reported in nanoseconds per
+item. Results are saved as JSON; `compare` flags cases that got slower than a
+stored baseline.
+
+    python benchmarks/suite.py run -o results.json
+    python benchmarks/suite.py compare benchmarks/baseline.json results.json
+
+`compare` exits with status 1 if any case regressed by more than `--threshold`.
+"""
+import argparse
+import io
+import json
+import platform
+import sys
+import timeit
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement
+from hole_pad_calc.rect_calc import RectCalc
+from hole_pad_calc.unit import Unit
+
+SIZES = (1, 100, 10_000)
+THRESHOLD = 0.10
+
+Case = Callable[[int], Callable[[], object]]
+
+
+def _values(n: int) -> List[float]:
+    return np.linspace(0.1, 3.0, n).tolist()
+
+
+def measurement_add(n: int) -> Callable[[], object]:
+    left = [Measurement(v, "mm") for v in _values(n)]
+    right = [Measurement(v / 25.4, "in") for v in _values(n)]
+    return lambda: [a + b for a, b in zip(left, right)]
+
+
+def measurement_mul(n: int) -> Callable[[], object]:
+    measurements = [Measurement(v, "mm") for v in _values(n)]
+    return lambda: [m * 2 for m in measurements]
+
+
+def unit_convert(n: int) -> Callable[[], object]:
+    mm = Unit("mm")
+    values = _values(n)
+    return lambda: [mm.convert(v, "mil") for v in values]
+
+
+def measurement_convert(n: int) -> Callable[[], object]:
+    measurements = [Measurement(v, "mm") for v in _values(n)]
+    return lambda: [m.convert("mil") for m in measurements]
+
+
+def _mixed(n: int) -> List[Measurement]:
+    units = ("mm", "in", "mil")
+    scales = (1.0, 1 / 25.4, 1000 / 25.4)
+    return [Measurement(v * scales[i % 3], units[i % 3]) for i, v in enumerate(_values(n))]
+
+
+def measurement_sort(n: int) -> Callable[[], object]:
+    measurements = _mixed(n)
+    return lambda: sorted(measurements, key=attrgetter("key"))
+
+
+def measurement_dedup(n: int) -> Callable[[], object]:
+    measurements = _mixed(n)
+    return lambda: set(measurements)
+
+
+def rect_from_pin(n: int) -> Callable[[], object]:
+    pins = [(Measurement(v, "mm"), Measurement(v / 2, "mm")) for v in _values(n)]
+    return lambda: [RectCalc(length, width) for length, width in pins]
+
+
+def rect_from_hole(n: int) -> Callable[[], object]:
+    holes = [Measurement(0.02 + v / 100, "in") for v in _values(n)]
+    return lambda: [RectCalc(hole=hole) for hole in holes]
+
+
+def rect_batch(n: int) -> Callable[[], object]:
+    lengths = np.linspace(0.1, 3.0, n)
+    return lambda: RectCalc.batch(lengths, lengths / 2, unit="mm")
+
+
+def rich_render(n: int) -> Callable[[], object]:
+    from rich.console import Console
+
+    console = Console(file=io.StringIO(), width=100, color_system="truecolor", force_terminal=True)
+    calcs = [RectCalc(Measurement(v, "mm"), Measurement(v / 2, "mm")) for v in _values(n)]
+
+    def render() -> None:
+        console.file = io.StringIO()
+        for calc in calcs:
+            console.print(calc)
+
+    return render
+
+
+def plain_render(n: int) -> Callable[[], object]:
+    from hole_pad_calc.render import write_plain
+
+    batch = RectCalc.batch(np.linspace(0.1, 3.0, n), np.linspace(0.05, 1.5, n), unit="mm")
+    return lambda: write_plain(batch, io.StringIO())
+
+
+CASES: Dict[str, Case] = {
+    "Measurement + Measurement": measurement_add,
+    "Measurement * int": measurement_mul,
+    "Unit.convert": unit_convert,
+    "Measurement.convert": measurement_convert,
+    "sorted(Measurement)": measurement_sort,
+    "set(Measurement)": measurement_dedup,
+    "RectCalc(length, width)": rect_from_pin,
+    "RectCalc(hole=...)": rect_from_hole,
+    "RectCalc.batch": rect_batch,
+    "RectCalc.__rich__": rich_render,
+    "render.write_plain": plain_render,
+}
+# Rendering is orders of magnitude slower than the math; cap its batch size.
+MAX_SIZE = {"RectCalc.__rich__": 100}
+
+
+def nanoseconds_per_item(statement: Callable[[], object], items: int, repeat: int = 5) -> float:
+    """Best-of-`repeat` cost per item, with each repeat running for at least 0.05 s."""
+    timer = timeit.Timer(statement)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number / items * 1e9
+
+
+def run(sizes: Sequence[int] = SIZES, cases: Optional[Sequence[str]] = None, repeat: int = 5) -> Dict[str, object]:
+    """Time every case at every size.
+
+    Returns:
+        dict: JSON-serialisable results with environment metadata; `results`
+            maps case name to `{size: ns_per_item}`.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for name in cases or CASES:
+        results[name] = {}
+        for size in sizes:
+            if size > MAX_SIZE.get(name, size):
+                continue
+            results[name][str(size)] = round(nanoseconds_per_item(CASES[name](size), size, repeat), 1)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "sizes": list(sizes),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object], threshold: float = THRESHOLD) -> List[str]:
+    """Print a comparison table and return the cases slower than `baseline` by more than `threshold`."""
+    regressions = []
+    print(f"{'case':<28} {'size':>6} {'baseline ns':>12} {'current ns':>12} {'change':>8}")
+    for name, sizes in current["results"].items():
+        for size, value in sizes.items():
+            reference = baseline["results"].get(name, {}).get(size)
+            if reference is None:
+                print(f"{name:<28} {size:>6} {'-':>12} {value:>12.1f} {'new':>8}")
+                continue
+            change = value / reference - 1
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name} @ {size}")
+            print(f"{name:<28} {size:>6} {reference:>12.1f} {value:>12.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Hot-path benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks and save JSON results.")
+    run_parser.add_argument("-o", "--output", help="JSON file to write. Defaults to stdout.")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    run_parser.add_argument("--case", action="append", choices=list(CASES), help="Only run this case (repeatable).")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    compare_parser = commands.add_parser("compare", help="Flag regressions against a baseline.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed slowdown, e.g. 0.1 for 10%%.")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        text = json.dumps(run(args.sizes, args.case, args.repeat), indent=2) + "\n"
+        if args.output:
+            with open(args.output, "w") as file:
+                file.write(text)
+        else:
+            sys.stdout.write(text)
+        return 0
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
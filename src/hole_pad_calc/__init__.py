@@ -1,5 +1,37 @@
-from rich.console import Console
-from rich.traceback import install as tr_install
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-console = Console()
-tr_install(console=console)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+# Stage hooks, see hole_pad_calc.trace. They live here so the instrumented
+# modules need no extra import; the list is only ever mutated in place.
+_hooks: List[Callable[[str, float, Dict[str, object]], None]] = []
+
+
+def _emit(stage: str, seconds: float, **data: object) -> None:
+    for hook in tuple(_hooks):
+        hook(stage, seconds, data)
+
+
+def get_console() -> "Console":
+    """Return the shared rich console, creating it on first use.
+
+    rich is only imported here, so the calculation core can be imported
+    without it. The rich traceback hook is installed alongside the console.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        from rich.traceback import install as tr_install
+
+        _console = Console()
+        tr_install(console=_console)
+    return _console
+
+
+def __getattr__(name: str) -> "Console":
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
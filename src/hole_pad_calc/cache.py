@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _scale(quantum: float) -> float:
+    """`1 / quantum`, snapped to the integer it misses by rounding error.
+
+    1 / 0.00001 is 99999.99999999999; snapping it keeps quantized values the
+    correctly rounded decimals `convert()` produces.
+    """
+    if quantum <= 0:
+        raise ValueError(f"quantum must be positive. Got {quantum}.")
+    scale = 1 / quantum
+    if abs(scale - round(scale)) < 1e-6:
+        scale = float(round(scale))
+    return scale
+
+
+class RectCache:
+    """Bounded LRU cache for `RectCalc` results.
+
+    Inputs are normalised to inches the way `Measurement.convert("in")` does.
+    By default the key is the exact inch value, so cached results are identical
+    to uncached ones. With a `quantum`, every input in the same multiple of it
+    shares one entry, calculated for the grid point itself whichever input
+    arrives first. The derived values then differ from an uncached calculation
+    by up to about half a quantum.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached results. Defaults to 4096.
+        quantum (float, optional): Quantization step in inches. Pass
+            `RectCalc.TOLERANCE` to coalesce pins within 1 mil. Defaults to
+            None, which keys on exact values.
+    """
+
+    def __init__(self, maxsize: int = 4096, quantum: Optional[float] = None) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1. Got {maxsize}.")
+        self.maxsize: int = maxsize
+        self.quantum: Optional[float] = quantum
+        self._scale: Optional[float] = None if quantum is None else _scale(quantum)
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def key(self, value: float) -> Hashable:
+        """Key of an input of `value` inches: the value itself, or its quantum index."""
+        return value if self._scale is None else round(value * self._scale)
+
+    def value(self, key: Hashable) -> float:
+        """Inch value a `key` result stands for: the input itself, or its grid point."""
+        return key if self._scale is None else key / self._scale
+
+    def quantize(self, value: float) -> int:
+        """Index of the quantum containing `value` (in inches). Needs a `quantum`."""
+        return round(value * self._scale)
+
+    def snap(self, index: int) -> float:
+        """Inch value of a quantum index returned by `quantize`."""
+        return index / self._scale
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for `key`, computing and storing it on a miss."""
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            value = data[key] = compute()
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        data.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
@@ -0,0 +1,578 @@
+import argparse
+import asyncio
+import csv
+import math
+import os
+import sys
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc.drills import DrillInventory, DrillUsage
+from hole_pad_calc.parallel import WorkerStats, apply_rules, ordered_map, rule_constants, summarize
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.render import PAGE_ROWS, print_rich, write_plain
+from hole_pad_calc.shapes import SHAPES, kernel
+from hole_pad_calc.service import HOST, MAX_BATCH, MAX_DELAY, PORT, serve
+from hole_pad_calc.store import ResultStore, write_store
+from hole_pad_calc.sweep import axis, sweep, write_csv, write_npy
+from hole_pad_calc.tolerance import DISTRIBUTIONS, monte_carlo
+from hole_pad_calc.unit import UNITS, convert_array
+
+class PinRow(NamedTuple):
+    """One parsed input row. `mode` is "pin", "checked" (pin plus hole) or "hole".
+
+    `shape` names a kernel in `hole_pad_calc.shapes.SHAPES`.
+    """
+    line: int
+    fields: List[str]
+    mode: str
+    unit: str
+    length: float
+    width: float
+    hole: float
+    shape: str = "rect"
+
+
+class RowError(NamedTuple):
+    line: int
+    fields: List[str]
+    message: str
+
+
+def _number(row: Dict[str, str], column: str) -> Optional[float]:
+    text = (row.get(column) or "").strip()
+    if not text:
+        return None
+    try:
+        value = float(text)
+    except ValueError:
+        raise ValueError(f"{column} is not a number: {text!r}") from None
+    if not math.isfinite(value) or value <= 0:
+        raise ValueError(f"{column} must be a positive number, got {text!r}")
+    return value
+
+
+def parse_rows(
+    reader: Iterable[List[str]], header: Sequence[str], default_unit: str, start: int = 2
+) -> Iterator[Union[PinRow, RowError]]:
+    """Parse raw CSV rows into `PinRow`s, or `RowError`s for malformed rows.
+
+    `start` is the line number of the first row (the header is line 1).
+    """
+    for line, fields in enumerate(reader, start=start):
+        if not fields:
+            continue
+        try:
+            if len(fields) != len(header):
+                raise ValueError(f"expected {len(header)} fields, got {len(fields)}")
+            row = dict(zip(header, fields))
+            unit = (row.get("unit") or "").strip() or default_unit
+            if unit not in UNITS:
+                raise ValueError(f"unit must be 'in', 'mm', or 'mil', got {unit!r}")
+            shape = (row.get("shape") or "").strip().lower() or "rect"
+            if shape not in SHAPES:
+                raise ValueError(f"shape must be one of {', '.join(SHAPES)}, got {shape!r}")
+            length, width, hole = (_number(row, column) for column in ("length", "width", "hole"))
+            if length is None and width is None:
+                if hole is None:
+                    raise ValueError("length and/or width or hole must be provided")
+                yield PinRow(line, fields, "hole", unit, 0.0, 0.0, hole, shape)
+            else:
+                length = width if length is None else length
+                width = length if width is None else width
+                # Like RectCalc, a hole is only checked when both pin dimensions are given.
+                checked = hole is not None and bool(row.get("length", "").strip() and row.get("width", "").strip())
+                yield PinRow(line, fields, "checked" if checked else "pin", unit, length, width, hole or 0.0, shape)
+        except ValueError as error:
+            yield RowError(line, fields, str(error))
+
+
+def _calculate(
+    rows: List[PinRow], backend: str, drills: Optional[DrillInventory] = None
+) -> Tuple[List[PinRow], RectBatch, Dict[int, str]]:
+    """Calculate one group of rows sharing unit, mode and shape as a single batch.
+
+    Provided holes and, with `drills`, drillability are checked as masks first,
+    so only the good rows are kept. Returns them, their batch and the errors
+    of the others by line.
+    """
+    unit, mode, shape = rows[0].unit, rows[0].mode, rows[0].shape
+    if shape != "rect":
+        if mode != "pin":
+            raise ValueError(f"a hole column is only supported for rect pins, not {shape}")
+        batch = kernel(shape).batch([r.length for r in rows], [r.width for r in rows], unit=unit, backend=backend)
+    elif mode == "hole":
+        batch = RectCalc.batch(holes=[r.hole for r in rows], unit=unit, backend=backend)
+    else:
+        batch = RectCalc.batch([r.length for r in rows], [r.width for r in rows], unit=unit, backend=backend)
+    errors: Dict[int, str] = {}
+    if mode == "checked":
+        mismatch = RectCalc.hole_mismatch(batch.hole_size, [r.hole for r in rows], unit, backend=backend)
+        for index in np.flatnonzero(mismatch).tolist():
+            errors[rows[index].line] = (
+                f"Provided hole size is not consistent with calculated hole size {float(batch.hole_size[index])} in."
+            )
+    good = np.ones(len(rows), dtype=bool)
+    if drills is not None:
+        good = drills.fits(batch.hole_size)
+        for index in np.flatnonzero(~good).tolist():
+            errors.setdefault(
+                rows[index].line,
+                f"Hole {float(batch.hole_size[index])} in is larger than the largest drill, {drills.sizes[-1]} in.",
+            )
+    if errors:
+        good &= np.array([row.line not in errors for row in rows])
+        rows = [row for row, keep in zip(rows, good.tolist()) if keep]
+        batch = RectBatch(*(column[good] for column in batch))
+    return rows, batch if drills is None else drills.apply(batch), errors
+
+
+def calculate_chunk(
+    chunk: List[Union[PinRow, RowError]],
+    backend: str,
+    output_unit: str,
+    drills: Optional[DrillInventory] = None,
+    usage: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[int, List[str], Optional[Tuple[float, float, float]], Optional[str]]]:
+    """Calculate one chunk of parsed rows, yielding `(line, fields, results, error)` in input order.
+
+    Rows are grouped by unit, mode and shape so each group is a single
+    vectorized `RectCalc.batch` or shape kernel call. Rows with an inconsistent
+    hole or, with `drills`, a hole larger than every drill are reported and the
+    rest of their group is still calculated as one batch. Only if a group
+    fails for another reason are its rows retried one by one.
+
+    With `drills`, holes are snapped to the inventory and, if `usage` is given,
+    the holes per drill are added to it.
+    """
+    results: Dict[int, Tuple[Optional[Tuple[float, float, float]], Optional[str]]] = {}
+    groups: Dict[Tuple[str, str, str], List[PinRow]] = {}
+    for item in chunk:
+        if isinstance(item, RowError):
+            results[item.line] = (None, item.message)
+        else:
+            groups.setdefault((item.unit, item.mode, item.shape), []).append(item)
+    for rows in groups.values():
+        try:
+            batches = [_calculate(rows, backend, drills)]
+        except ValueError:
+            batches = []
+            for row in rows:
+                try:
+                    batches.append(_calculate([row], backend, drills))
+                except ValueError as error:
+                    results[row.line] = (None, str(error))
+        for batch_rows, batch, errors in batches:
+            for line, message in errors.items():
+                results[line] = (None, message)
+            if usage is not None:
+                usage += drills.counts(batch.hole_size)
+            columns = [convert_array(column, "in", output_unit) for column in (batch.hypo, batch.hole_size, batch.pad_size)]
+            for row, values in zip(batch_rows, np.stack(columns, axis=1).tolist()):
+                results[row.line] = (tuple(values), None)
+    for item in chunk:
+        yield (item.line, item.fields, *results[item.line])
+
+
+def chunked(iterable: Iterable[object], size: int) -> Iterator[List[object]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ChunkResult(NamedTuple):
+    """Output rows and error messages for one chunk, with the worker timing.
+
+    `usage` holds the holes per drill when a drill inventory is used.
+    """
+    rows: List[List[str]]
+    errors: List[str]
+    pid: int
+    seconds: float
+    usage: Optional[np.ndarray] = None
+
+
+def process_chunk(
+    numbered: Tuple[int, List[List[str]]],
+    *,
+    header: Sequence[str],
+    unit: str,
+    output_unit: str,
+    backend: str,
+    drills: Optional[DrillInventory] = None,
+) -> ChunkResult:
+    """Parse and calculate one chunk of raw CSV rows starting at the given line number."""
+    began = perf_counter()
+    start, raw = numbered
+    output, errors = [], []
+    usage = None if drills is None else np.zeros(len(drills), dtype=np.int64)
+    rows = list(parse_rows(raw, header, unit, start))
+    for line, fields, values, error in calculate_chunk(rows, backend, output_unit, drills, usage):
+        if error is not None:
+            errors.append(f"line {line}: {error}")
+            # Malformed rows may be short; pad them so the result columns line up.
+            output.append(fields + [""] * (max(len(header) - len(fields), 0) + 3))
+        else:
+            output.append(fields + [repr(value) for value in values])
+    return ChunkResult(output, errors, os.getpid(), perf_counter() - began, usage)
+
+
+def run_batch(
+    source: TextIO,
+    destination: TextIO,
+    errors: TextIO,
+    *,
+    delimiter: str = ",",
+    unit: str = "in",
+    output_unit: str = "in",
+    backend: str = "float",
+    chunk_size: int = 10_000,
+    workers: int = 1,
+    stats: Optional[List[WorkerStats]] = None,
+    drills: Optional[DrillInventory] = None,
+    usage: Optional[List[DrillUsage]] = None,
+) -> int:
+    """Stream pins from `source` to `destination`, one chunk at a time.
+
+    With `workers` > 1 chunks are parsed and calculated in worker processes
+    while this process reads and writes; output order is unchanged and only a
+    few chunks per worker are held in memory.
+
+    Args:
+        stats (list, optional): If given, per-worker `WorkerStats` are appended to it.
+        drills (DrillInventory, optional): Snap holes to these drills and recompute the pads.
+        usage (list, optional): If given with `drills`, a `DrillUsage` per drill,
+            in `output_unit`, is appended to it.
+
+    Returns:
+        int: Number of rows that could not be calculated.
+    """
+    reader = csv.reader(source, delimiter=delimiter)
+    header = [column.strip().lower() for column in next(reader, [])]
+    if not {"length", "width", "hole"} & set(header):
+        raise ValueError(f"Input needs a length, width or hole column. Got {header}.")
+    writer = csv.writer(destination, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(header + [f"hypo_{output_unit}", f"hole_{output_unit}", f"pad_{output_unit}"])
+    chunks = ((2 + index * chunk_size, raw) for index, raw in enumerate(chunked(reader, chunk_size)))
+    process = partial(
+        process_chunk,
+        header=header,
+        unit=unit,
+        output_unit=output_unit,
+        backend=RectCalc._backend(backend),
+        drills=drills,
+    )
+    if workers > 1:
+        results = ordered_map(process, chunks, workers, initializer=apply_rules, initargs=(rule_constants(),))
+    else:
+        results = map(process, chunks)
+    failed = 0
+    timings = []
+    counts = None if drills is None else np.zeros(len(drills), dtype=np.int64)
+    for result in results:
+        if counts is not None:
+            counts += result.usage
+        failed += len(result.errors)
+        for message in result.errors:
+            errors.write(message + "\n")
+        writer.writerows(result.rows)
+        timings.append((result.pid, len(result.rows), result.seconds))
+    if stats is not None:
+        stats.extend(summarize(timings))
+    if usage is not None and drills is not None:
+        usage.extend(drills.usage(counts, output_unit))
+    return failed
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def _count(text: str) -> int:
+    """A positive integer, also written as a float such as 1e7."""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got {text!r}") from None
+    if value != int(value):
+        raise argparse.ArgumentTypeError(f"must be a whole number, got {text}")
+    return _positive_int(str(int(value)))
+
+
+STORE_SUFFIXES = {".npy": "npy", ".hpcs": "store"}
+
+
+def _axis(text: str) -> np.ndarray:
+    """Parse START:STOP:STEP (inclusive) or a comma-separated list of values."""
+    try:
+        if ":" in text:
+            start, stop, step = (float(part) for part in text.split(":"))
+            return axis(start, stop, step)
+        return np.array([float(part) for part in text.split(",")])
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"expected START:STOP:STEP or a list of values ({error})") from None
+
+
+def _open(path: str, mode: str, default: TextIO) -> TextIO:
+    return default if path == "-" else open(path, mode, newline="")
+
+
+def batch_command(args: argparse.Namespace) -> int:
+    delimiter = args.delimiter
+    if delimiter is None:
+        delimiter = "\t" if args.input.endswith((".tsv", ".tab")) else ","
+    source = _open(args.input, "r", sys.stdin)
+    destination = _open(args.output, "w", sys.stdout)
+    stats: List[WorkerStats] = []
+    usage: List[DrillUsage] = []
+    drills = None if args.drills is None else DrillInventory.load(args.drills, args.drill_unit)
+    try:
+        failed = run_batch(
+            source,
+            destination,
+            sys.stderr,
+            delimiter=delimiter,
+            unit=args.unit,
+            output_unit=args.output_unit,
+            backend=args.backend,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            stats=stats,
+            drills=drills,
+            usage=usage,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+    if args.workers > 1:
+        for worker in stats:
+            print(
+                f"worker {worker.pid}: {worker.rows} rows in {worker.chunks} chunks, "
+                f"{worker.rows_per_second:,.0f} rows/s",
+                file=sys.stderr,
+            )
+    for drill in usage:
+        print(f"drill {drill.drill:g} {args.output_unit}: {drill.count} hole(s)", file=sys.stderr)
+    if failed:
+        print(f"{failed} row(s) could not be calculated.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def sweep_command(args: argparse.Namespace) -> int:
+    widths = args.length if args.width is None else args.width
+    result = sweep(args.length, widths, unit=args.unit, backend=args.backend)
+    output_unit = args.output_unit or args.unit
+    file_format = args.format or STORE_SUFFIXES.get(Path(args.output).suffix, "csv")
+    if file_format != "csv" and args.output == "-":
+        raise SystemExit(f"hole-pad-calc sweep: {file_format} output needs a file name (-o).")
+    if file_format == "npy":
+        write_npy(result, args.output, output_unit)
+        return 0
+    if file_format == "store":
+        write_store(args.output, result.batch(), output_unit, args.backend)
+        return 0
+    delimiter = "\t" if args.output.endswith((".tsv", ".tab")) else ","
+    destination = _open(args.output, "w", sys.stdout)
+    try:
+        write_csv(result, destination, output_unit, delimiter)
+    finally:
+        if destination is not sys.stdout:
+            destination.close()
+    return 0
+
+
+def tolerance_command(args: argparse.Namespace) -> int:
+    report = monte_carlo(
+        args.length,
+        args.width,
+        tolerance=args.tolerance,
+        width_tolerance=args.width_tolerance,
+        hole_tolerance=args.hole_tolerance,
+        unit=args.unit,
+        distribution=args.distribution,
+        samples=args.samples,
+        seed=args.seed,
+        workers=args.workers,
+        backend=args.backend,
+    )
+    unit = report.unit
+    print(f"samples            {report.samples:,}")
+    print(f"hole               {report.hole:.4f} {unit}")
+    print(f"nominal clearance  {report.nominal_clearance:.4f} {unit}")
+    print(f"mean clearance     {report.mean:.4f} {unit}")
+    print(f"std                {report.std:.4f} {unit}")
+    print(f"min / max          {report.min:.4f} / {report.max:.4f} {unit}")
+    for q, value in report.percentiles.items():
+        print(f"{f'p{q:g}':<19}{value:.4f} {unit}")
+    print(f"interference       {report.interference:.6%}")
+    return 0
+
+
+def show_command(args: argparse.Namespace) -> int:
+    units = args.units or list(UNITS)
+    file_format = args.format or ("rich" if sys.stdout.isatty() and args.output == "-" else "plain")
+    with ResultStore(args.store) as store:
+        if file_format == "rich":
+            print_rich(store.chunks(), unit=store.unit, units=units, page_rows=args.page_rows, pause=args.pause)
+            return 0
+        destination = _open(args.output, "w", sys.stdout)
+        try:
+            write_plain(store.chunks(), destination, unit=store.unit, units=units)
+        finally:
+            if destination is not sys.stdout:
+                destination.close()
+    return 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    print(f"Serving on http://{args.host}:{args.port} (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        asyncio.run(
+            serve(args.host, args.port, max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000, backend=args.backend)
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="hole-pad-calc", description="Hole and pad calculator.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser(
+        "batch",
+        help="Calculate holes and pads for a CSV/TSV file of pins.",
+        description=(
+            "Read rows with length/width (or hole) and an optional unit column, and write "
+            "them back with hypotenuse, hole and pad columns. Malformed rows are reported "
+            "on stderr and written with empty results."
+        ),
+    )
+    batch.add_argument("input", help="Input CSV/TSV file, or - for stdin.")
+    batch.add_argument("-o", "--output", default="-", help="Output file, or - for stdout (default).")
+    batch.add_argument("--delimiter", help="Field delimiter. Defaults to tab for .tsv files, else comma.")
+    batch.add_argument("--unit", choices=UNITS, default="in", help="Unit for rows without a unit column.")
+    batch.add_argument("--output-unit", choices=UNITS, default="in", help="Unit of the result columns.")
+    batch.add_argument("--backend", choices=RectCalc.BACKENDS, default=RectCalc.BACKEND)
+    batch.add_argument("--chunk-size", type=_positive_int, default=10_000, help="Rows calculated per vectorized batch.")
+    batch.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="Worker processes for parsing and calculation. Per-worker throughput is reported on stderr.",
+    )
+    batch.add_argument(
+        "--drills",
+        help="Drill inventory file, one size per line. Holes snap up to the next stocked drill "
+        "and drill usage is reported on stderr.",
+    )
+    batch.add_argument("--drill-unit", choices=UNITS, default="in", help="Unit for inventory lines without a unit.")
+    batch.set_defaults(handler=batch_command)
+
+    grid = commands.add_parser(
+        "sweep",
+        help="Tabulate holes and pads over a grid of pin lengths and widths.",
+        description=(
+            "Evaluate every length and width combination at once and write one row per "
+            "pin as CSV, or the whole grid as a structured .npy array."
+        ),
+    )
+    grid.add_argument("--length", type=_axis, required=True, help="START:STOP:STEP (inclusive) or a list, e.g. 10:60:0.5.")
+    grid.add_argument("--width", type=_axis, help="Same format as --length. Defaults to the length axis.")
+    grid.add_argument("--unit", choices=UNITS, default="in", help="Unit of the length and width axes.")
+    grid.add_argument("--output-unit", choices=UNITS, help="Unit of every output column. Defaults to --unit.")
+    grid.add_argument("--backend", choices=RectCalc.BACKENDS, default=RectCalc.BACKEND)
+    grid.add_argument("-o", "--output", default="-", help="Output file, or - for stdout (default).")
+    grid.add_argument(
+        "--format",
+        choices=("csv", "npy", "store"),
+        help="Defaults to npy for .npy files, store for .hpcs files (see hole_pad_calc.store), else csv.",
+    )
+    grid.set_defaults(handler=sweep_command)
+
+    spread = commands.add_parser(
+        "tolerance",
+        help="Monte Carlo clearance between toleranced pins and their nominal hole.",
+        description=(
+            "Size the hole from the nominal pin, sample pin lengths and widths from their "
+            "tolerances, and report clearance statistics and the interference rate."
+        ),
+    )
+    spread.add_argument("--length", type=float, required=True, help="Nominal pin length.")
+    spread.add_argument("--width", type=float, help="Nominal pin width. Defaults to --length.")
+    spread.add_argument("--tolerance", type=float, required=True, help="± tolerance on the length.")
+    spread.add_argument("--width-tolerance", type=float, help="± tolerance on the width. Defaults to --tolerance.")
+    spread.add_argument("--hole-tolerance", type=float, default=0.0, help="± tolerance on the finished hole.")
+    spread.add_argument("--unit", choices=UNITS, default="in", help="Unit of every size, tolerance and result.")
+    spread.add_argument(
+        "--distribution",
+        choices=DISTRIBUTIONS,
+        default="normal",
+        help="normal: tolerances are 3 sigma (default). uniform: flat over ± tolerance.",
+    )
+    spread.add_argument("--samples", type=_count, default=10_000_000, help="Sampled parts, e.g. 1e7 (default).")
+    spread.add_argument("--seed", type=int, help="Seed for a reproducible run.")
+    spread.add_argument("--workers", type=_positive_int, default=1, help="Worker processes.")
+    spread.add_argument("--backend", choices=RectCalc.BACKENDS, default=RectCalc.BACKEND)
+    spread.set_defaults(handler=tolerance_command)
+
+    show = commands.add_parser(
+        "show",
+        help="Print a result store as a table.",
+        description=(
+            "Stream the rows of a result store (see hole_pad_calc.store) as fixed-width "
+            "text, with every dimension in inches, mm and mils."
+        ),
+    )
+    show.add_argument("store", help="Result store file, e.g. from sweep -o grid.hpcs.")
+    show.add_argument("--units", choices=UNITS, nargs="+", help="Units to show. Defaults to all three.")
+    show.add_argument("-o", "--output", default="-", help="Output file, or - for stdout (default).")
+    show.add_argument(
+        "--format",
+        choices=("plain", "rich"),
+        help="rich: colored pages on a terminal. Defaults to rich when stdout is a terminal, else plain.",
+    )
+    show.add_argument("--page-rows", type=_positive_int, default=PAGE_ROWS, help="Rows per rich page.")
+    show.add_argument("--pause", action="store_true", help="Wait for Enter after each rich page.")
+    show.set_defaults(handler=show_command)
+
+    service = commands.add_parser(
+        "serve",
+        help="Run a local HTTP/JSON calculation service.",
+        description=(
+            "Answer POST /pin and POST /hole with hole and pad sizes. Concurrent requests "
+            "are calculated together in micro-batches. GET /stats reports latency "
+            "percentiles, queue depth and batch sizes."
+        ),
+    )
+    service.add_argument("--host", default=HOST, help=f"Address to bind. Defaults to {HOST}.")
+    service.add_argument("--port", type=int, default=PORT, help=f"Defaults to {PORT}.")
+    service.add_argument("--max-batch", type=_positive_int, default=MAX_BATCH, help="Most rows per batch.")
+    service.add_argument(
+        "--max-delay-ms",
+        type=float,
+        default=MAX_DELAY * 1000,
+        help="Milliseconds to wait for more requests before calculating a batch.",
+    )
+    service.add_argument("--backend", choices=RectCalc.BACKENDS, default=RectCalc.BACKEND)
+    service.set_defaults(handler=serve_command)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,159 @@
+"""Drill inventory: snap calculated holes to the drill bits the fab stocks.
+
+`RectCalc` rounds holes to whole mils. A `DrillInventory` then moves each hole
+up to the smallest stocked drill at least as large, and recomputes the pad
+from that drill. The inventory is a sorted array of sizes in integer
+nanometres. An exact match is never missed because of float rounding.
+Scalars are located with `bisect` and arrays with `np.searchsorted`.
+
+Inventory files hold one drill per line, optionally followed by a unit. Blank
+lines and `#` comments are ignored:
+
+    # stocked bits
+    0.020
+    0.7 mm
+    31 mil
+"""
+from bisect import bisect_left
+from pathlib import Path
+from typing import List, NamedTuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc import fixed
+from hole_pad_calc.measurement import FixedMeasurement, Measurement
+from hole_pad_calc.rect_calc import INCHES, RectBatch, RectCalc
+from hole_pad_calc.unit import NANOMETRES, UNIT_INDEX, UNITS, _invalid_unit, from_nanometres, to_nanometres
+
+_NM_PER_INCH = NANOMETRES[UNIT_INDEX["in"]]
+
+
+class DrillUsage(NamedTuple):
+    """How many holes were drilled with one bit. `drill` is in the unit asked for."""
+    drill: float
+    count: int
+
+
+class DrillInventory:
+    """Sorted set of stocked drill sizes.
+
+    Args:
+        sizes (array-like): Drill diameters in `unit`. Duplicates are merged.
+        unit (str, optional): Unit of `sizes`. Defaults to 'in'.
+    """
+
+    def __init__(self, sizes: ArrayLike, unit: str = "in") -> None:
+        if unit not in UNIT_INDEX:
+            raise _invalid_unit(unit)
+        self._index(fixed.to_nanometres_array(np.asarray(sizes, dtype=np.float64).ravel(), unit), unit)
+
+    def _index(self, nanometres: np.ndarray, unit: str) -> None:
+        nanometres = np.unique(nanometres)
+        if len(nanometres) == 0:
+            raise ValueError("A drill inventory needs at least one drill.")
+        if nanometres[0] <= 0:
+            raise ValueError(f"Drill sizes must be positive. Got {from_nanometres(int(nanometres[0]), unit)} {unit}.")
+        self.nanometres: np.ndarray = nanometres
+        self.sizes: np.ndarray = nanometres / _NM_PER_INCH
+        self._keys: List[int] = nanometres.tolist()
+
+    @classmethod
+    def load(cls, path: Union[str, Path], unit: str = "in") -> "DrillInventory":
+        """Read an inventory file. `unit` applies to lines without their own unit."""
+        if unit not in UNIT_INDEX:
+            raise _invalid_unit(unit)
+        sizes = []
+        with open(path) as file:
+            for line, text in enumerate(file, start=1):
+                fields = text.split("#", 1)[0].replace(",", " ").split()
+                if not fields:
+                    continue
+                try:
+                    if len(fields) > 2 or (len(fields) == 2 and fields[1] not in UNITS):
+                        raise ValueError(f"expected a size and an optional unit, got {text.strip()!r}")
+                    sizes.append(to_nanometres(float(fields[0]), fields[1] if len(fields) == 2 else unit))
+                except ValueError as error:
+                    raise ValueError(f"{path}, line {line}: {error}") from None
+        inventory = cls.__new__(cls)
+        inventory._index(np.array(sizes, dtype=np.int64), unit)
+        return inventory
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"DrillInventory({len(self)} drills, {self.sizes[0]}-{self.sizes[-1]} in)"
+
+    def index(self, holes: ArrayLike, unit: str = "in") -> np.ndarray:
+        """Position in `sizes` of the drill for each hole.
+
+        Raises:
+            ValueError: If a hole is larger than the largest drill.
+        """
+        holes_nm = fixed.to_nanometres_array(np.asarray(holes, dtype=np.float64), unit)
+        positions = np.searchsorted(self.nanometres, holes_nm, side="left")
+        over = positions == len(self._keys)
+        if np.any(over):
+            index = int(np.flatnonzero(over)[0])
+            raise ValueError(
+                f"Hole at index {index} ({from_nanometres(int(holes_nm.flat[index]), unit)} {unit}) "
+                f"is larger than the largest drill, {self.sizes[-1]} in."
+            )
+        return positions
+
+    def fits(self, holes: ArrayLike, unit: str = "in") -> np.ndarray:
+        """Whether each hole can be drilled, i.e. is no larger than the largest drill."""
+        return fixed.to_nanometres_array(np.asarray(holes, dtype=np.float64), unit) <= self.nanometres[-1]
+
+    def snap(self, hole: Measurement) -> Measurement:
+        """The smallest drill at least as large as `hole`, in inches."""
+        hole_nm = hole.nanometres
+        position = bisect_left(self._keys, hole_nm)
+        if position == len(self._keys):
+            raise ValueError(f"Hole {hole} is larger than the largest drill, {self.sizes[-1]} in.")
+        if isinstance(hole, FixedMeasurement):
+            return FixedMeasurement.from_nanometres(self._keys[position], INCHES)
+        return Measurement._make(self._keys[position] / _NM_PER_INCH, INCHES)
+
+    def snap_array(self, holes: ArrayLike, unit: str = "in") -> np.ndarray:
+        """Snap every hole to its drill. The result is in inches with the shape of `holes`."""
+        return self.sizes[self.index(holes, unit)]
+
+    def apply(self, result: Union[RectCalc, RectBatch]) -> RectBatch:
+        """Replace the holes of `result` with drills and recompute the pads from them.
+
+        A `RectCalc` gives a `RectBatch` of floats, like one row of a batch. All
+        values are in inches.
+        """
+        if isinstance(result, RectCalc):
+            drill = self.snap(result.hole_size)
+            if isinstance(drill, FixedMeasurement):
+                pad_nm = fixed.pad(
+                    drill.nanometres, to_nanometres(RectCalc.ANNULAR_RING, "in"), to_nanometres(RectCalc.ALLOWANCE, "in")
+                )
+                pad = from_nanometres(pad_nm, "in")
+            else:
+                pad = drill.value + RectCalc.ANNULAR_RING + RectCalc.ALLOWANCE
+            return RectBatch(
+                result.length.convert("in").value,
+                result.width.convert("in").value,
+                result.hypo.convert("in").value,
+                drill.value,
+                pad,
+            )
+        hole_size = self.snap_array(result.hole_size)
+        pad_size = hole_size + RectCalc.ANNULAR_RING + RectCalc.ALLOWANCE
+        return result._replace(hole_size=hole_size, pad_size=pad_size)
+
+    def counts(self, holes: ArrayLike, unit: str = "in") -> np.ndarray:
+        """Number of holes drilled with each drill, aligned with `sizes`.
+
+        Counts from several chunks can simply be added before calling `usage`.
+        """
+        return np.bincount(self.index(holes, unit).ravel(), minlength=len(self._keys))
+
+    def usage(self, counts: ArrayLike, unit: str = "in") -> List[DrillUsage]:
+        """Per-drill usage, smallest drill first. Unused drills have a count of 0."""
+        scale = NANOMETRES[UNIT_INDEX[unit]]
+        return [DrillUsage(nm / scale, int(count)) for nm, count in zip(self._keys, np.asarray(counts).tolist())]
@@ -0,0 +1,224 @@
+"""Lazy arithmetic on measurements, evaluated in one pass.
+
+Every operator on a `Measurement` or `MeasurementArray` builds a new object,
+and converts the right operand whenever the units differ. `lazy` wraps
+operands in expression leaves instead. Arithmetic on them builds a tree, and
+`evaluate` computes it in one pass:
+
+    a, b, c, d = lazy(a, b, c, d)
+    ((a + b) * c - d).evaluate()
+
+Units follow the eager rules, so results are identical to eager arithmetic.
+Each node takes the unit of its leftmost measurement. That unit is worked out
+once, when the tree is built. Each leaf is converted once, and a
+parenthesized subexpression once, if its unit differs. Array expressions
+write every step into one output buffer. Only right-nested subexpressions
+allocate a temporary. The left spine of the tree, which `acc = acc + x` loops
+build, is evaluated iteratively, so long accumulations do not hit the
+recursion limit.
+
+This pays off for arrays, where it saves the temporaries. For scalar
+measurements, building and walking the tree costs more than the objects it
+saves, so eager arithmetic stays faster.
+"""
+import operator
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement, MeasurementArray
+from hole_pad_calc.unit import Unit, convert_array, convert_value
+
+Value = Union[int, float, np.ndarray, Measurement, MeasurementArray]
+
+# Scalar and array implementation, and error wording, per operator symbol.
+OPERATORS: Dict[str, Tuple[object, np.ufunc, str]] = {
+    "+": (operator.add, np.add, "add"),
+    "-": (operator.sub, np.subtract, "subtract"),
+    "*": (operator.mul, np.multiply, "multiply"),
+    "/": (operator.truediv, np.true_divide, "divide"),
+    "//": (operator.floordiv, np.floor_divide, "floor divide"),
+}
+
+
+class Expr:
+    """Node of a lazy expression.
+
+    `unit` is the unit of the result, or None for a bare number. `vector` is
+    true if any leaf is an array.
+    """
+
+    __slots__ = ("unit", "vector")
+
+    def _binary(self, symbol: str, other: Union["Expr", Value], reflected: bool = False) -> "BinOp":
+        other = _leaf(other, OPERATORS[symbol][2])
+        return BinOp(symbol, other, self) if reflected else BinOp(symbol, self, other)
+
+    def __add__(self, other: Union["Expr", Value]) -> "BinOp":
+        return self._binary("+", other)
+
+    def __sub__(self, other: Union["Expr", Value]) -> "BinOp":
+        return self._binary("-", other)
+
+    def __mul__(self, other: Union["Expr", Value]) -> "BinOp":
+        return self._binary("*", other)
+
+    def __truediv__(self, other: Union["Expr", Value]) -> "BinOp":
+        return self._binary("/", other)
+
+    def __floordiv__(self, other: Union["Expr", Value]) -> "BinOp":
+        return self._binary("//", other)
+
+    def __radd__(self, other: Value) -> "BinOp":
+        return self._binary("+", other, reflected=True)
+
+    def __rsub__(self, other: Value) -> "BinOp":
+        return self._binary("-", other, reflected=True)
+
+    def __rmul__(self, other: Value) -> "BinOp":
+        return self._binary("*", other, reflected=True)
+
+    def __rtruediv__(self, other: Value) -> "BinOp":
+        return self._binary("/", other, reflected=True)
+
+    def __rfloordiv__(self, other: Value) -> "BinOp":
+        return self._binary("//", other, reflected=True)
+
+    def leaves(self) -> List["Leaf"]:
+        """Every leaf, left to right."""
+        found, stack = [], [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BinOp):
+                stack.append(node.right)
+                stack.append(node.left)
+            else:
+                found.append(node)
+        return found
+
+    def evaluate(self) -> Union[Measurement, MeasurementArray]:
+        """Compute the expression.
+
+        Returns:
+            Measurement or MeasurementArray: A `MeasurementArray` if any leaf is
+                an array, in the unit of the leftmost measurement
+        """
+        if self.unit is None:
+            raise ValueError("Cannot evaluate an expression without a Measurement or MeasurementArray.")
+        unit = Unit._INSTANCES[self.unit]
+        if not self.vector:
+            return Measurement._make(float(_run(self, self.unit, None, {})), unit)
+        shapes = [leaf.array.shape for leaf in self.leaves() if leaf.vector]
+        out = np.empty(np.broadcast_shapes(*shapes), dtype=np.float64)
+        return MeasurementArray(_run(self, self.unit, out, {}), unit)
+
+
+class Leaf(Expr):
+    """A measurement, measurement array or number in an expression."""
+
+    __slots__ = ("value", "array")
+
+    def __init__(self, value: Value) -> None:
+        self.value = value
+        self.unit: Optional[str] = value.unit._unit if isinstance(value, (Measurement, MeasurementArray)) else None
+        # The values of an array leaf, for sizing the output before evaluation.
+        self.array: Optional[np.ndarray] = value.values if isinstance(value, MeasurementArray) else (
+            value if isinstance(value, np.ndarray) else None
+        )
+        self.vector = self.array is not None
+
+    def resolve(self, unit: Optional[str]) -> Union[float, np.ndarray]:
+        """The leaf's value in `unit`, as a float or float64 array. Numbers have no unit."""
+        value = self.value
+        if isinstance(value, (Measurement, MeasurementArray)):
+            value = value.convert(unit)
+            return value.value if isinstance(value, Measurement) else value.values
+        if isinstance(value, np.ndarray):
+            return value.astype(np.float64, copy=False)
+        return float(value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class BinOp(Expr):
+    """`left <symbol> right`. The result takes the unit of `left`, or of `right` if `left` is a number."""
+
+    __slots__ = ("symbol", "left", "right")
+
+    def __init__(self, symbol: str, left: Expr, right: Expr) -> None:
+        self.symbol = symbol
+        self.left = left
+        self.right = right
+        self.unit = left.unit if left.unit is not None else right.unit
+        self.vector = left.vector or right.vector
+
+    def __repr__(self) -> str:
+        return f"({self.left!r} {self.symbol} {self.right!r})"
+
+
+def _leaf(value: Union[Expr, Value], action: str) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    if isinstance(value, (int, float, Measurement, MeasurementArray)) or (
+        isinstance(value, np.ndarray) and value.dtype.kind in "iuf"
+    ):
+        return Leaf(value)
+    raise ValueError(f"Cannot {action} {type(value)} in a lazy expression.")
+
+
+def _run(
+    node: Expr, unit: Optional[str], out: Optional[np.ndarray], cache: Dict[Tuple[int, str], object]
+) -> Union[float, np.ndarray]:
+    """Evaluate `node` in `unit`, into `out` for array expressions.
+
+    `cache` holds converted leaf values by leaf and unit, so a value used
+    twice is converted once.
+    """
+    spine = []
+    while isinstance(node, BinOp):
+        spine.append(node)
+        node = node.left
+    result = _resolve(node, unit, cache)
+    for step in reversed(spine):
+        right = step.right
+        if isinstance(right, BinOp):
+            value = _run(right, right.unit, None if out is None else np.empty_like(out), cache)
+            if right.unit is not None and right.unit != unit:
+                value = convert_value(value, right.unit, unit) if out is None else convert_array(value, right.unit, unit)
+        else:
+            value = _resolve(right, unit, cache)
+        scalar, ufunc, _ = OPERATORS[step.symbol]
+        if out is None:
+            result = scalar(result, value)
+        else:
+            result = ufunc(result, value, out=out)
+    if out is not None and result is not out:
+        out[...] = result
+        result = out
+    return result
+
+
+def _resolve(leaf: "Leaf", unit: Optional[str], cache: Dict[Tuple[int, str], object]) -> Union[float, np.ndarray]:
+    key = (id(leaf.value), unit)
+    try:
+        return cache[key]
+    except KeyError:
+        cache[key] = value = leaf.resolve(unit)
+        return value
+
+
+def lazy(*values: Value) -> Union[Leaf, Tuple[Leaf, ...]]:
+    """Wrap operands as expression leaves: one leaf for one value, else a tuple.
+
+    Use it for array arithmetic; with only scalar measurements, eager
+    arithmetic is about twice as fast.
+
+    Args:
+        *values: Measurements, measurement arrays, numbers or numeric arrays
+
+    Returns:
+        Leaf or tuple of Leaf: Operands whose arithmetic builds an expression
+    """
+    leaves = tuple(_leaf(value, "use") for value in values)
+    return leaves[0] if len(leaves) == 1 else leaves
@@ -1,8 +1,102 @@
-from typing import Optional, Union
-from rich.text import Text
-from hole_pad_calc.unit import Unit
+import re
+from operator import itemgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-from hole_pad_calc import console
+import numpy as np
+from numpy.typing import ArrayLike
+from hole_pad_calc import _emit, _hooks
+from hole_pad_calc.unit import (
+    NANOMETRES,
+    UNIT_ALIASES,
+    UNIT_INDEX,
+    UNITS,
+    Unit,
+    convert_array,
+    convert_value,
+    from_nanometres,
+    to_nanometres,
+)
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+
+def _as_unit(v: Optional[Union[str, Unit]]) -> Unit:
+    """Validate and coerce a unit argument, defaulting to inches."""
+    if v is None:
+        v = 'in'
+    if isinstance(v, Unit):
+        return v
+    if isinstance(v, str):
+        unit = Unit._INSTANCES.get(v)
+        if unit is None:
+            raise ValueError(f"Unit must be 'in', 'mm', or 'mil'. Got {v}.")
+        return unit
+    raise ValueError(f"Unit must be a string or Unit object. Got {type(v)}.")
+
+
+# Dimension literal: a decimal number, optionally with an exponent, then an
+# optional unit word. `_LITERAL` matches one literal; `_COLUMN` matches one per
+# line of a newline-joined column. Quantifiers are possessive, so a malformed
+# line fails without backtracking.
+_GRAMMAR = r'[ \t]*+([-+]?+(?:\d++(?:\.\d*+)?+|\.\d++)(?:[eE][-+]?+\d++)?+)[ \t]*+([a-zA-Z"]*+)[ \t]*+'
+_LITERAL = re.compile(_GRAMMAR)
+_COLUMN = re.compile(f"^{_GRAMMAR}$", re.MULTILINE)
+_ALIAS_INDEX = {alias: UNIT_INDEX[unit] for alias, unit in UNIT_ALIASES.items()}
+# Measurements hash and sort by their size rounded to a multiple of
+# KEY_NANOMETRES, 0.00001 in. Equal keys compare equal. A conversion rounds by
+# less than one step but can cross a step boundary, so keys one step apart are
+# also equal when one measurement is the other's conversion. Such a pair
+# hashes differently; `Measurement.unique` deduplicates it.
+KEY_NANOMETRES = 254
+_KEY_SCALE = {unit: NANOMETRES[index] / KEY_NANOMETRES for unit, index in UNIT_INDEX.items()}
+# Rows quoted in a ParseError message; every failed row is still in `rows`.
+_REPORTED_ROWS = 5
+
+
+class ParseError(ValueError):
+    """Raised by `Measurement.parse_many` when rows fail to parse.
+
+    Attributes:
+        rows (list of (int, str)): Zero-based position and reason of every failed row
+    """
+
+    def __init__(self, rows: List[Tuple[int, str]], total: int) -> None:
+        self.rows = rows
+        lines = [f"Cannot parse {len(rows)} of {total} values:"]
+        lines += [f"  row {index}: {reason}" for index, reason in rows[:_REPORTED_ROWS]]
+        if len(rows) > _REPORTED_ROWS:
+            lines.append(f"  and {len(rows) - _REPORTED_ROWS} more")
+        super().__init__("\n".join(lines))
+
+
+def _parse_literal(text: str, default: int) -> Tuple[float, int]:
+    """Parse one dimension literal into its value and unit index, `default` if it has no unit."""
+    match = _LITERAL.fullmatch(text) if isinstance(text, str) else None
+    if match is None:
+        raise ValueError(f"Invalid dimension: {text!r}. Expected a number and an optional unit, e.g. '1.27 mm'.")
+    number, word = match.groups()
+    if not word:
+        return float(number), default
+    index = _ALIAS_INDEX.get(word.lower())
+    if index is None:
+        raise ValueError(f"Invalid unit: {word} in {text!r}. Must be 'in', 'mm', or 'mil'.")
+    return float(number), index
+
+
+def _unit_codes(words: List[str], default: int) -> Optional[np.ndarray]:
+    """Unit index per unit word, or None if any word is not a known unit."""
+    lookup = dict(_ALIAS_INDEX)
+    lookup[""] = default
+    try:
+        return np.fromiter(map(lookup.__getitem__, words), np.int8, len(words))
+    except KeyError:
+        pass
+    try:
+        return np.fromiter(map(lookup.__getitem__, map(str.lower, words)), np.int8, len(words))
+    except KeyError:
+        return None
 
 
 class Measurement:
@@ -13,37 +107,212 @@ class Measurement:
         unit (str or Unit, optional): Unit of the measurement. Defaults to 'in'.
     """
 
+    __slots__ = ('_value', '_unit', '_key')
+
     def __init__(self, value: Union[float, int], unit: Optional[Union[str, Unit]] = None) -> None:
-        self.unit = unit
-        self.value = value
+        if isinstance(value, int):
+            value = float(value)
+        if not isinstance(value, float):
+            raise ValueError(f"Value must be a numerical value (int or float). Got {type(value)}.")
+        self._unit: Unit = _as_unit(unit)
+        self._value: float = value
+
+    @classmethod
+    def _make(cls, value: float, unit: Unit) -> "Measurement":
+        """Build a Measurement without validation, for internal hot paths.
+
+        Args:
+            value (float): Value of the measurement. Must already be a float.
+            unit (Unit): Interned unit of the measurement.
+        """
+        self = _new_object(cls)
+        self._value = value
+        self._unit = unit
+        return self
 
     @property
     def unit(self) -> Unit:
         return self._unit
 
-    @unit.setter
-    def unit(self, v: Optional[Union[str, Unit]]) -> None:
-        if v is None:
-            v = 'in'
-        if isinstance(v, str):
-            if v not in ['in', 'mm', 'mil']:
-                raise ValueError(f"Unit must be 'in', 'mm', or 'mil'. Got {v}.")
-            v = Unit(v)
-        elif not isinstance(v, Unit):
-            raise ValueError(f"Unit must be a string or Unit object. Got {type(v)}.")
-        self._unit: Unit = v
-
     @property
     def value(self) -> float:
         return self._value
 
-    @value.setter
-    def value(self, v: Optional[Union[int, float]] = None) -> None:
-        if isinstance(v, int):
-            v = float(v)
-        if not isinstance(v, float):
-            raise ValueError(f"Value must be a numerical value (int or float). Got {type(v)}.")
-        self._value = v
+    @property
+    def nanometres(self) -> int:
+        """The value quantized to whole nanometres."""
+        return to_nanometres(self._value, self._unit._unit)
+
+    @property
+    def key(self) -> Union[int, float]:
+        """Canonical sort and hash key: the size in multiples of `KEY_NANOMETRES`.
+
+        Computed on first use and kept, so repeated comparisons are cheap.
+        Measurements with equal keys compare equal whatever their units.
+        """
+        try:
+            return self._key
+        except AttributeError:
+            self._key = key = self._canonical_key()
+            return key
+
+    def _canonical_key(self) -> Union[int, float]:
+        try:
+            return round(self._value * _KEY_SCALE[self._unit._unit])
+        except (ValueError, OverflowError):
+            # NaN and infinities have no multiple; they keep float semantics.
+            return self._value
+
+    def _converts_to(self, other: "Measurement") -> bool:
+        """Whether either measurement is the other's `convert`, rounding included."""
+        unit, other_unit = self._unit._unit, other._unit._unit
+        return unit != other_unit and (
+            convert_value(self.value, unit, other_unit) == other.value
+            or convert_value(other.value, other_unit, unit) == self.value
+        )
+
+    def _same(self, key: Union[int, float], other_key: Union[int, float], other: "Measurement") -> bool:
+        # A conversion rounds by less than one key step, so it can only land in the next one.
+        return key == other_key or (abs(key - other_key) == 1 and self._converts_to(other))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Measurement):
+            try:
+                return self._same(self._key, other._key, other)
+            except AttributeError:
+                return self._same(self.key, other.key, other)
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, Measurement):
+            return not self.__eq__(other)
+        return NotImplemented
+
+    def __lt__(self, other: "Measurement") -> bool:
+        if isinstance(other, Measurement):
+            key, other_key = self.key, other.key
+            return key < other_key and not self._same(key, other_key, other)
+        return NotImplemented
+
+    def __le__(self, other: "Measurement") -> bool:
+        if isinstance(other, Measurement):
+            key, other_key = self.key, other.key
+            return key <= other_key or self._same(key, other_key, other)
+        return NotImplemented
+
+    def __gt__(self, other: "Measurement") -> bool:
+        if isinstance(other, Measurement):
+            key, other_key = self.key, other.key
+            return key > other_key and not self._same(key, other_key, other)
+        return NotImplemented
+
+    def __ge__(self, other: "Measurement") -> bool:
+        if isinstance(other, Measurement):
+            key, other_key = self.key, other.key
+            return key >= other_key or self._same(key, other_key, other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        try:
+            return hash(self._key)
+        except AttributeError:
+            return hash(self.key)
+
+    @staticmethod
+    def unique(measurements: Iterable["Measurement"]) -> List["Measurement"]:
+        """Drop measurements equal to an earlier one, keeping the order.
+
+        Unlike `set`, this also merges a measurement with a conversion of it
+        whose key landed one step away, so mixed-unit inputs deduplicate fully.
+
+        Args:
+            measurements (iterable of Measurement): Measurements in any units
+
+        Returns:
+            list of Measurement: The first of each group of equal measurements
+        """
+        kept: List[Measurement] = []
+        by_key: Dict[Union[int, float], List[Measurement]] = {}
+        for measurement in measurements:
+            key = measurement.key
+            if not any(
+                measurement == other for step in (key - 1, key, key + 1) for other in by_key.get(step, ())
+            ):
+                by_key.setdefault(key, []).append(measurement)
+                kept.append(measurement)
+        return kept
+
+    @classmethod
+    def parse(cls, text: str, unit: Optional[Union[str, Unit]] = 'in') -> "Measurement":
+        """Parse a dimension literal such as "1.27 mm", "40mil", '0.05"' or "1e-3 in".
+
+        Unit words are case-insensitive and include the aliases in
+        `unit.UNIT_ALIASES`, e.g. "inch" and "thou".
+
+        Args:
+            text (str): Number followed by an optional unit
+            unit (str or Unit, optional): Unit of a bare number. Defaults to 'in'.
+
+        Returns:
+            Measurement: The parsed measurement, in the unit written in `text`
+        """
+        value, index = _parse_literal(text, UNIT_INDEX[_as_unit(unit)._unit])
+        return cls(value, UNITS[index])
+
+    @classmethod
+    def parse_many(
+        cls,
+        texts: Iterable[str],
+        unit: Optional[Union[str, Unit]] = 'in',
+        *,
+        errors: str = "raise",
+    ) -> "ParsedColumn":
+        """Parse a column of dimension literals straight into arrays.
+
+        The whole column is matched with one regular expression call over the
+        newline-joined text, and the numbers are converted by numpy in one
+        pass, so no `Measurement` is built per row. A column with malformed
+        rows is re-parsed row by row to find them.
+
+        Args:
+            texts (iterable of str): Literals accepted by `parse`
+            unit (str or Unit, optional): Unit of bare numbers. Defaults to 'in'.
+            errors (str, optional): "raise" to raise a `ParseError` listing every
+                bad row, or "coerce" to store NaN for them. Defaults to "raise".
+
+        Returns:
+            ParsedColumn: Values, unit indices and failed rows, in input order
+        """
+        if errors not in ("raise", "coerce"):
+            raise ValueError(f"Invalid errors: {errors}. Must be 'raise' or 'coerce'.")
+        default = UNIT_INDEX[_as_unit(unit)._unit]
+        texts = texts.tolist() if isinstance(texts, np.ndarray) else list(texts)
+        try:
+            joined = "\n".join(texts)
+        except TypeError:
+            joined = None
+        # A row holding a newline would shift every later match; such rows go row by row.
+        if joined is not None and joined.count("\n") == len(texts) - 1:
+            matches = _COLUMN.findall(joined)
+        else:
+            matches = []
+        if len(matches) == len(texts):
+            codes = _unit_codes(list(map(itemgetter(1), matches)), default)
+            if codes is not None:
+                values = np.array(list(map(itemgetter(0), matches)), dtype=np.float64)
+                return ParsedColumn(values, codes, np.empty(0, dtype=np.intp))
+        values = np.empty(len(texts), dtype=np.float64)
+        codes = np.empty(len(texts), dtype=np.int8)
+        failed = []
+        for index, text in enumerate(texts):
+            try:
+                values[index], codes[index] = _parse_literal(text, default)
+            except ValueError as error:
+                failed.append((index, str(error)))
+                values[index], codes[index] = np.nan, default
+        if failed and errors == "raise":
+            raise ParseError(failed, len(texts))
+        return ParsedColumn(values, codes, np.array([index for index, _ in failed], dtype=np.intp))
 
     @classmethod
     def __call__(cls, value: Union[float, int], unit: Optional[Union[str, Unit]] = 'in'):
@@ -63,10 +332,12 @@ class Measurement:
     def __float__(self) -> float:
         return float(self.value)
 
-    def __rich__(self) -> Text:
+    def __rich__(self) -> "Text":
         return self.rich()
 
-    def __rich__repr__(self) -> Text:
+    def __rich__repr__(self) -> "Text":
+        from rich.text import Text
+
         return Text.assemble(
             *[
                 Text("Measurement", style="bold italic #0099ff"),
@@ -78,47 +349,47 @@ class Measurement:
 
     def __add__(self, other: Union[int, float, "Measurement"]) -> 'Measurement':
         if isinstance(other, (int, float)):
-            return Measurement(value=self.value + float(other), unit=self.unit)
+            return Measurement._make(self._value + float(other), self._unit)
         elif isinstance(other, Measurement):
-            if self.unit != other.unit:
-                other = other.convert(str(self.unit))
-            return Measurement(value=self.value + other.value, unit=self.unit)
+            if self._unit is not other._unit:
+                other = other.convert(self._unit._unit)
+            return Measurement._make(self._value + other._value, self._unit)
         raise ValueError(f"Cannot add Measurement to {type(other)}.")
 
     def __sub__(self, other: Union[int, float, "Measurement"]) -> 'Measurement':
         if isinstance(other, (int, float)):
-            return Measurement(value=self.value - float(other), unit=self.unit)
+            return Measurement._make(self._value - float(other), self._unit)
         elif isinstance(other, Measurement):
-            if self.unit != other.unit:
-                other = other.convert(str(self.unit))
-            return Measurement(value=self.value - other.value, unit=self.unit)
+            if self._unit is not other._unit:
+                other = other.convert(self._unit._unit)
+            return Measurement._make(self._value - other._value, self._unit)
         raise ValueError(f"Cannot subtract Measurement from {type(other)}.")
 
     def __mul__(self, other: Union[int, float, "Measurement"]) -> 'Measurement':
         if isinstance(other, (int, float)):
-            return Measurement(value=self.value * float(other), unit=self.unit)
+            return Measurement._make(self._value * float(other), self._unit)
         elif isinstance(other, Measurement):
-            if self.unit != other.unit:
-                other = other.convert(str(self.unit))
-            return Measurement(value=self.value * other.value, unit=self.unit)
+            if self._unit is not other._unit:
+                other = other.convert(self._unit._unit)
+            return Measurement._make(self._value * other._value, self._unit)
         raise ValueError(f"Cannot multiply Measurement by {type(other)}.")
 
     def __truediv__(self, other: Union[int, float, "Measurement"]) -> 'Measurement':
         if isinstance(other, (int, float)):
-            return Measurement(value=self.value / float(other), unit=self.unit)
+            return Measurement._make(self._value / float(other), self._unit)
         elif isinstance(other, Measurement):
-            if self.unit != other.unit:
-                other = other.convert(str(self.unit))
-            return Measurement(value=self.value / other.value, unit=self.unit)
+            if self._unit is not other._unit:
+                other = other.convert(self._unit._unit)
+            return Measurement._make(self._value / other._value, self._unit)
         raise ValueError(f"Cannot divide Measurement by {type(other)}.")
 
     def __floordiv__(self, other: Union[int, float, "Measurement"]) -> 'Measurement':
         if isinstance(other, (int, float)):
-            return Measurement(value=self.value // float(other), unit=self.unit)
+            return Measurement._make(self._value // float(other), self._unit)
         elif isinstance(other, Measurement):
-            if self.unit != other.unit:
-                other = other.convert(str(self.unit))
-            return Measurement(value=self.value // other.value, unit=self.unit)
+            if self._unit is not other._unit:
+                other = other.convert(self._unit._unit)
+            return Measurement._make(self._value // other._value, self._unit)
         raise ValueError(f"Cannot floor divide Measurement by {type(other)}.")
 
     def convert(self, to: str) -> "Measurement":
@@ -130,20 +401,18 @@ class Measurement:
         Returns:
             Measurement: Converted measurement with the new unit
         """
-        CONVERSIONS = {
-            "in": {"mm": 25.4, "mil": 1000},
-            "mm": {"in": 0.0393701, "mil": 39.3701},
-            "mil": {"in": 0.001, "mm": 0.0254},
-        }
-        PLACES = {"in": 5, "mm": 4, "mil": 3}
-        if to == str(self.unit):
+        if to == self._unit._unit:
             return self
-        if to not in CONVERSIONS:
-            raise ValueError(f"Invalid unit: {to}. Must be 'in', 'mm', or 'mil'.")
-        conversion_value = self.value * CONVERSIONS[str(self.unit)][to]
-        return Measurement(value=round(conversion_value, PLACES[to]), unit=to)
+        if _hooks:
+            started = perf_counter()
+            result = Measurement._make(convert_value(self._value, self._unit._unit, to), Unit._INSTANCES[to])
+            _emit("convert", perf_counter() - started, value=self, result=result)
+            return result
+        return Measurement._make(convert_value(self._value, self._unit._unit, to), Unit._INSTANCES[to])
+
+    def rich(self) -> "Text":
+        from rich.text import Text
 
-    def rich(self) -> Text:
         PLACES = {"in": 5, "mm": 4, "mil": 3}
         return Text.assemble(
             *[
@@ -154,13 +423,276 @@ class Measurement:
         )
 
 
+_new_object = object.__new__
+
+
+class FixedMeasurement(Measurement):
+    """Measurement stored as an exact integer number of nanometres.
+
+    Conversions between units and addition or subtraction are exact integer
+    operations. `value` is derived from the nanometres for display only.
+
+    Args:
+        value (float): Value of the measurement, quantized to the nearest nanometre
+        unit (str or Unit, optional): Unit of the measurement. Defaults to 'in'.
+    """
+
+    __slots__ = ('_nm',)
+
+    def __init__(self, value: Union[float, int], unit: Optional[Union[str, Unit]] = None) -> None:
+        super().__init__(value, unit)
+        self._nm: int = to_nanometres(self._value, self._unit._unit)
+        self._value = from_nanometres(self._nm, self._unit._unit)
+
+    @classmethod
+    def from_nanometres(cls, nanometres: int, unit: Optional[Union[str, Unit]] = None) -> "FixedMeasurement":
+        """Build a measurement from an integer number of nanometres.
+
+        Args:
+            nanometres (int): Exact size in nanometres
+            unit (str or Unit, optional): Unit to express the value in. Defaults to 'in'.
+        """
+        unit = _as_unit(unit)
+        self = _new_object(cls)
+        self._nm = int(nanometres)
+        self._unit = unit
+        self._value = from_nanometres(self._nm, unit._unit)
+        return self
+
+    @property
+    def nanometres(self) -> int:
+        return self._nm
+
+    def _canonical_key(self) -> int:
+        return round(self._nm / KEY_NANOMETRES)
+
+    def __repr__(self) -> str:
+        return f"FixedMeasurement<{self.value} {self.unit}>"
+
+    def __add__(self, other: Union[int, float, Measurement]) -> Measurement:
+        if isinstance(other, (int, float)):
+            other = to_nanometres(float(other), self._unit._unit)
+        elif isinstance(other, Measurement):
+            other = other.nanometres
+        else:
+            raise ValueError(f"Cannot add FixedMeasurement to {type(other)}.")
+        return FixedMeasurement.from_nanometres(self._nm + other, self._unit)
+
+    def __sub__(self, other: Union[int, float, Measurement]) -> Measurement:
+        if isinstance(other, (int, float)):
+            other = to_nanometres(float(other), self._unit._unit)
+        elif isinstance(other, Measurement):
+            other = other.nanometres
+        else:
+            raise ValueError(f"Cannot subtract FixedMeasurement from {type(other)}.")
+        return FixedMeasurement.from_nanometres(self._nm - other, self._unit)
+
+    def __mul__(self, other: Union[int, float, Measurement]) -> Measurement:
+        if isinstance(other, int):
+            return FixedMeasurement.from_nanometres(self._nm * other, self._unit)
+        return super().__mul__(other)
+
+    def __floordiv__(self, other: Union[int, float, Measurement]) -> Measurement:
+        if isinstance(other, int):
+            return FixedMeasurement.from_nanometres(self._nm // other, self._unit)
+        return super().__floordiv__(other)
+
+    def convert(self, to: str) -> "FixedMeasurement":
+        """Express the measurement in another unit. The nanometres are unchanged.
+
+        Args:
+            to (str): Unit to convert to
+
+        Returns:
+            FixedMeasurement: The same length expressed in `to`
+        """
+        if to == self._unit._unit:
+            return self
+        if _hooks:
+            started = perf_counter()
+            result = FixedMeasurement.from_nanometres(self._nm, _as_unit(to))
+            _emit("convert", perf_counter() - started, value=self, result=result)
+            return result
+        return FixedMeasurement.from_nanometres(self._nm, _as_unit(to))
+
+
+class MeasurementArray:
+    """Column of measurements sharing one unit, backed by a float64 buffer.
+
+    Arithmetic follows `Measurement`: the right-hand operand is converted to
+    this array's unit first, and the result keeps this array's unit.
+
+    Args:
+        values (array-like): Values of the measurements
+        unit (str or Unit, optional): Unit of every value. Defaults to 'in'.
+    """
+
+    def __init__(self, values: ArrayLike, unit: Optional[Union[str, Unit]] = None) -> None:
+        self._unit: Unit = _as_unit(unit)
+        array = np.ascontiguousarray(values, dtype=np.float64)
+        if array.ndim != 1:
+            raise ValueError(f"Values must be one-dimensional. Got {array.ndim} dimensions.")
+        self._values: np.ndarray = array
+        # The buffer may be the caller's array or shared with other arrays. It
+        # is copied before the first in-place operator writes to it.
+        self._owned: bool = False
+
+    @property
+    def unit(self) -> Unit:
+        return self._unit
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Measurement]:
+        unit = self._unit
+        for value in self._values.tolist():
+            yield Measurement._make(value, unit)
+
+    def __getitem__(self, index: Union[int, slice, ArrayLike]) -> Union[Measurement, "MeasurementArray"]:
+        if isinstance(index, (int, np.integer)):
+            return Measurement._make(float(self._values[index]), self._unit)
+        return MeasurementArray(self._values[index], self._unit)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if dtype is None or np.dtype(dtype) == self._values.dtype:
+            return self._values.copy() if copy else self._values
+        return self._values.astype(dtype)
+
+    def __str__(self) -> str:
+        return f"{self._values} {self._unit}"
+
+    def __repr__(self) -> str:
+        return f"MeasurementArray<{len(self)} values {self._unit}>"
+
+    def _operand(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"], action: str):
+        """Return `other` as a float or array expressed in this array's unit."""
+        if isinstance(other, (int, float)):
+            return float(other)
+        if isinstance(other, Measurement):
+            if self._unit != other.unit:
+                other = other.convert(str(self._unit))
+            return other.value
+        if isinstance(other, MeasurementArray):
+            if self._unit != other.unit:
+                other = other.convert(str(self._unit))
+            return other.values
+        if isinstance(other, np.ndarray) and other.dtype.kind in "iuf":
+            return other.astype(np.float64, copy=False)
+        raise ValueError(f"Cannot {action} {type(other)}.")
+
+    def __add__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return MeasurementArray(self._values + self._operand(other, "add MeasurementArray to"), self._unit)
+
+    def __sub__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return MeasurementArray(self._values - self._operand(other, "subtract MeasurementArray from"), self._unit)
+
+    def __mul__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return MeasurementArray(self._values * self._operand(other, "multiply MeasurementArray by"), self._unit)
+
+    def __truediv__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return MeasurementArray(self._values / self._operand(other, "divide MeasurementArray by"), self._unit)
+
+    def __floordiv__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return MeasurementArray(self._values // self._operand(other, "floor divide MeasurementArray by"), self._unit)
+
+    def _inplace(self, ufunc: np.ufunc, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"], action: str) -> "MeasurementArray":
+        """Apply `ufunc` into this array's own buffer, made on first use."""
+        operand = self._operand(other, action)
+        if self._owned:
+            ufunc(self._values, operand, out=self._values)
+        else:
+            self._values = ufunc(self._values, operand)
+            self._owned = True
+        return self
+
+    # In-place operators update the buffer without allocating, for accumulation
+    # loops. The first one copies it, so the caller's array and other arrays
+    # sharing it are never changed.
+    def __iadd__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return self._inplace(np.add, other, "add MeasurementArray to")
+
+    def __isub__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return self._inplace(np.subtract, other, "subtract MeasurementArray from")
+
+    def __imul__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return self._inplace(np.multiply, other, "multiply MeasurementArray by")
+
+    def __itruediv__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return self._inplace(np.true_divide, other, "divide MeasurementArray by")
+
+    def __ifloordiv__(self, other: Union[int, float, ArrayLike, Measurement, "MeasurementArray"]) -> "MeasurementArray":
+        return self._inplace(np.floor_divide, other, "floor divide MeasurementArray by")
+
+    def convert(self, to: str) -> "MeasurementArray":
+        """Converts every value to the specified unit.
+
+        Matches `Measurement.convert` element by element, rounding included.
+
+        Args:
+            to (str): Unit to convert to
+
+        Returns:
+            MeasurementArray: Converted measurements with the new unit
+        """
+        if to == self._unit._unit:
+            # A new array over the same buffer, so in-place operators on it leave this one alone.
+            return MeasurementArray(self._values, self._unit)
+        if _hooks:
+            started = perf_counter()
+            result = MeasurementArray(convert_array(self._values, self._unit._unit, to), to)
+            _emit("convert", perf_counter() - started, items=len(result), unit=self._unit._unit, to=to)
+            return result
+        return MeasurementArray(convert_array(self._values, self._unit._unit, to), to)
+
+
+class ParsedColumn(NamedTuple):
+    """Columnar result of `Measurement.parse_many`.
+
+    `values[i]` is in the unit written in row i, `UNITS[units[i]]`. Rows that
+    failed to parse with `errors="coerce"` are listed in `invalid` and hold NaN.
+    """
+    values: np.ndarray
+    units: np.ndarray
+    invalid: np.ndarray
+
+    def convert(self, to: Optional[Union[str, Unit]] = 'in') -> MeasurementArray:
+        """Every row in one unit, matching `Measurement.parse(text).convert(to)` row by row.
+
+        Args:
+            to (str or Unit, optional): Unit to convert to. Defaults to 'in'.
+
+        Returns:
+            MeasurementArray: Converted values, NaN for invalid rows
+        """
+        target = _as_unit(to)._unit
+        result = self.values.copy()
+        for index, name in enumerate(UNITS):
+            if name == target:
+                continue
+            rows = self.units == index
+            if rows.all():
+                return MeasurementArray(convert_array(self.values, name, target), target)
+            if rows.any():
+                result[rows] = convert_array(self.values[rows], name, target)
+        return MeasurementArray(result, target)
+
 if __name__ == '__main__':
     from typing import List
     from rich.prompt import FloatPrompt, Prompt
     from rich.box import ROUNDED
     from rich.table import Table
+    from rich.text import Text
     from rich_gradient import Gradient
 
+    from hole_pad_calc import get_console
+
+    console = get_console()
+
     value = FloatPrompt.ask(
         "Enter a value",
         console=console,
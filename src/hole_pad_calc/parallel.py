@@ -0,0 +1,195 @@
+"""Multi-process execution of `RectCalc.batch` for large pin libraries.
+
+Array inputs are copied once into shared memory; each worker computes a
+contiguous slice in place with the same `RectCalc.batch` math as the serial
+path, so results are identical and output order is deterministic.
+"""
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc.rect_calc import HoleMismatchError, RectBatch, RectCalc
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+RULE_ATTRIBUTES = ("TOLERANCE", "CLEARANCE", "ANNULAR_RING", "ALLOWANCE")
+
+
+class WorkerStats(NamedTuple):
+    """Throughput of one worker process."""
+    pid: int
+    chunks: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+class ParallelResult(NamedTuple):
+    batch: RectBatch
+    workers: List[WorkerStats]
+
+
+def summarize(timings: Iterable[Tuple[int, int, float]]) -> List[WorkerStats]:
+    """Aggregate `(pid, rows, seconds)` per chunk into per-worker stats, ordered by pid."""
+    totals: Dict[int, List[float]] = {}
+    for pid, rows, seconds in timings:
+        total = totals.setdefault(pid, [0, 0, 0.0])
+        total[0] += 1
+        total[1] += rows
+        total[2] += seconds
+    return [WorkerStats(pid, int(c), int(r), s) for pid, (c, r, s) in sorted(totals.items())]
+
+
+def rule_constants() -> Tuple[float, ...]:
+    """The `RectCalc` rule constants, to be re-applied in worker processes."""
+    return tuple(getattr(RectCalc, name) for name in RULE_ATTRIBUTES)
+
+
+def apply_rules(rules: Tuple[float, ...]) -> None:
+    """Worker initializer: make `RectCalc` use the parent's rule constants."""
+    for name, value in zip(RULE_ATTRIBUTES, rules):
+        setattr(RectCalc, name, value)
+
+
+def ordered_map(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    workers: int,
+    *,
+    max_pending: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[object, ...] = (),
+) -> Iterator[R]:
+    """Like `map`, across processes, keeping at most `max_pending` items in flight.
+
+    Unlike `ProcessPoolExecutor.map`, items are consumed lazily, so a streamed
+    input never has to fit in memory. Results are yielded in input order.
+    """
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as pool:
+        pending: Deque[Future] = deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Worker-side views of the shared input and output arrays.
+_shared: Dict[str, np.ndarray] = {}
+_blocks: List[SharedMemory] = []
+
+
+def _attach(block: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=block, track=False)
+    except TypeError:  # Python < 3.13 has no track argument.
+        return SharedMemory(name=block)
+
+
+def _init_worker(layout: Dict[str, Tuple[str, Tuple[int, ...]]], rules: Tuple[float, ...]) -> None:
+    apply_rules(rules)
+    for name, (block, shape) in layout.items():
+        memory = _attach(block)
+        _blocks.append(memory)
+        _shared[name] = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+
+
+def _batch_slice(task: Tuple[int, int, str, str]) -> Tuple[int, int, float]:
+    start, stop, unit, backend = task
+    began = perf_counter()
+    inputs = {name: _shared[name][start:stop] for name in ("lengths", "widths", "holes") if name in _shared}
+    try:
+        result = RectCalc.batch(
+            inputs.get("lengths"), inputs.get("widths"), holes=inputs.get("holes"), unit=unit, backend=backend
+        )
+    except HoleMismatchError as error:
+        # The index counts from the start of this slice; report it in the caller's array.
+        raise error.offset(start) from None
+    _shared["output"][:, start:stop] = np.stack(result)
+    return os.getpid(), stop - start, perf_counter() - began
+
+
+def parallel_batch(
+    lengths: Optional[ArrayLike] = None,
+    widths: Optional[ArrayLike] = None,
+    *,
+    holes: Optional[ArrayLike] = None,
+    unit: str = "in",
+    backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+) -> ParallelResult:
+    """`RectCalc.batch` split across worker processes.
+
+    Args:
+        lengths, widths, holes, unit, backend: As for `RectCalc.batch`.
+        workers (int, optional): Worker processes. Defaults to `os.cpu_count()`.
+        chunk_size (int, optional): Pins per task. Defaults to 100,000.
+
+    Returns:
+        ParallelResult: The same `RectBatch` as the serial call, plus per-worker stats.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be at least 1.")
+    backend = RectCalc._backend(backend)
+    inputs = {
+        name: np.asarray(values, dtype=np.float64)
+        for name, values in (("lengths", lengths), ("widths", widths), ("holes", holes))
+        if values is not None
+    }
+    if not inputs:
+        raise ValueError("Length and/or width or hole must be provided.")
+    shape = np.broadcast_shapes(*(array.shape for array in inputs.values()))
+    size = int(np.prod(shape))
+    tasks = [(start, min(start + chunk_size, size), unit, backend) for start in range(0, size, chunk_size)]
+
+    if workers == 1 or len(tasks) <= 1:
+        began = perf_counter()
+        batch = RectCalc.batch(
+            inputs.get("lengths"), inputs.get("widths"), holes=inputs.get("holes"), unit=unit, backend=backend
+        )
+        return ParallelResult(batch, summarize([(os.getpid(), size, perf_counter() - began)]))
+    # Workers split flat arrays; the flat index of an element matches `RectCalc.batch` error indices.
+    inputs = {name: np.broadcast_to(array, shape).ravel() for name, array in inputs.items()}
+
+    blocks: List[SharedMemory] = []
+    try:
+        layout: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        arrays: Dict[str, np.ndarray] = {}
+        for name, block_shape in [(name, (size,)) for name in inputs] + [("output", (5, size))]:
+            block = SharedMemory(create=True, size=max(8, int(np.prod(block_shape)) * 8))
+            blocks.append(block)
+            layout[name] = (block.name, block_shape)
+            arrays[name] = np.ndarray(block_shape, dtype=np.float64, buffer=block.buf)
+        for name, array in inputs.items():
+            arrays[name][...] = array
+        timings = list(
+            ordered_map(
+                _batch_slice,
+                tasks,
+                min(workers, len(tasks)),
+                initializer=_init_worker,
+                initargs=(layout, rule_constants()),
+            )
+        )
+        batch = RectBatch(*(column.reshape(shape) for column in arrays["output"].copy()))
+        del arrays
+        return ParallelResult(batch, summarize(timings))
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -1,25 +1,164 @@
 from math import sqrt
-from typing import Optional, Tuple
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple, Union
 
-from rich.box import ROUNDED
-from rich.console import Console
-from rich.prompt import Confirm, FloatPrompt, Prompt
-from rich.table import Table
-from rich.text import Text
-from rich_gradient import Gradient
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc import _emit, _hooks, get_console
 
 # Importing the Measurement class from measurement.py
-from hole_pad_calc.measurement import Measurement
+from hole_pad_calc import fixed
+from hole_pad_calc.cache import RectCache
+from hole_pad_calc.measurement import FixedMeasurement, Measurement, MeasurementArray
+from hole_pad_calc.unit import (
+    NANOMETRES,
+    UNIT_INDEX,
+    Unit,
+    _round_array,
+    convert_value,
+    from_nanometres,
+    to_nanometres,
+)
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+INCHES = Unit("in")
+MILS = Unit("mil")
+
+
+class RectBatch(NamedTuple):
+    """Vectorized results of `RectCalc.batch`.
+
+    Every array is in inches and has the broadcast shape of the inputs. The
+    arrays are new, so changing one changes neither the inputs nor the others.
+    """
+    length: np.ndarray
+    width: np.ndarray
+    hypo: np.ndarray
+    hole_size: np.ndarray
+    pad_size: np.ndarray
+
+
+class HoleMismatchError(ValueError):
+    """A provided hole inconsistent with the one calculated for its pin by `RectCalc.batch`.
+
+    Attributes:
+        index (int): Flat position of the first inconsistent hole
+        calculated (float): Hole calculated at that position, in inches
+    """
+
+    def __init__(self, index: int, calculated: float) -> None:
+        self.index = index
+        self.calculated = calculated
+        super().__init__(
+            f"Provided hole size at index {index} is not consistent with calculated hole size {calculated} in."
+        )
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, float]]:
+        return (type(self), (self.index, self.calculated))
+
+    def offset(self, start: int) -> "HoleMismatchError":
+        """The same error for an array in which the checked elements start at `start`."""
+        return HoleMismatchError(self.index + start, self.calculated)
+
+
+class Rule(NamedTuple):
+    """Hole and pad rule for one density level, in inches.
+
+    The hole is the pin diagonal plus `clearance`, rounded to whole mils. The
+    pad is the hole plus `annular_ring` plus the fabrication `allowance`.
+    """
+    clearance: float
+    annular_ring: float
+    allowance: float
+
+
+def _to_inches(values: ArrayLike, unit: str) -> np.ndarray:
+    """Convert an array of any shape to inches the same way `Measurement.convert("in")` does."""
+    array = np.asarray(values, dtype=np.float64)
+    return MeasurementArray(array.ravel(), unit).convert("in").values.reshape(array.shape)
+
+
+def _pin_inches(lengths: ArrayLike, widths: ArrayLike, unit: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Lengths and widths in inches, broadcast together, in new arrays.
+
+    Inch input is used as given, so it is copied: results never share memory
+    with the caller's arrays or with each other.
+    """
+    length_in, width_in = np.broadcast_arrays(_to_inches(lengths, unit), _to_inches(widths, unit))
+    return np.array(length_in), np.array(width_in)
+
+
+def _round_hole(value: float) -> Measurement:
+    """A hole of `value` inches rounded to whole mils, in inches."""
+    hole_mil = int(round(Measurement._make(value, INCHES).convert("mil").value, 0))
+    return Measurement._make(float(hole_mil), MILS).convert("in")
+
+
+def _hole_array(hypo: np.ndarray, clearance: float) -> np.ndarray:
+    """Hole sizes in inches: diagonal plus clearance, rounded to whole mils like `calc_hole`."""
+    hole_mil = MeasurementArray((hypo + clearance).ravel(), "in").convert("mil")
+    hole_mil = MeasurementArray(_round_array(hole_mil.values, 0), "mil")
+    return hole_mil.convert("in").values.reshape(hypo.shape)
+
+
+# Attributes computed from `length` and `width` on first access, in dependency
+# order: the hole builds on the hypotenuse and the pad on the hole.
+DERIVED = ("hypo", "hole_size", "pad_size")
+
+
+class _Input:
+    """A `RectCalc` input. Assigning it drops every value derived from the pin."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.key = "_" + name
+
+    def __get__(self, obj: Optional["RectCalc"], owner: Optional[type] = None) -> Measurement:
+        if obj is None:
+            return self  # type: ignore[return-value]
+        try:
+            return obj.__dict__[self.key]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj: "RectCalc", value: Measurement) -> None:
+        state = obj.__dict__
+        state[self.key] = value
+        for name in DERIVED:
+            state.pop(name, None)
 
 
 class RectCalc:
-    length: Measurement
-    width: Measurement
+    # Derived on first access, see __getattr__.
     hypo: Measurement
     hole_size: Measurement
     pad_size: Measurement
     PLACES = {"in": 5, "mm": 4, "mil": 3}
     TOLERANCE = 0.001
+    # Rules per density level; add entries for shop rules. Only the allowance
+    # differs between levels: it is the IPC-2221 minimum fabrication allowance
+    # for levels A, B and C. The clearance and annular ring are this
+    # calculator's own, unchanged from its single original rule, so level A
+    # reproduces the original results. These are not IPC-7251 land patterns,
+    # which also vary the hole clearance per level; add such levels as rules.
+    RULES: Dict[str, Rule] = {
+        "A": Rule(clearance=0.0059, annular_ring=0.004, allowance=0.016),
+        "B": Rule(clearance=0.0059, annular_ring=0.004, allowance=0.010),
+        "C": Rule(clearance=0.0059, annular_ring=0.004, allowance=0.008),
+    }
+    # The active rule, used by the constructor and `batch`; see `use_rule`.
+    CLEARANCE, ANNULAR_RING, ALLOWANCE = RULES["A"]
+    # Level A's allowance whatever rule is active, as in earlier releases. Use
+    # ALLOWANCE for the active rule's.
+    LEVEL_A = RULES["A"].allowance
+    BACKENDS = ("float", "fixed")
+    # Default backend; "fixed" computes in integer nanometres (see hole_pad_calc.fixed).
+    BACKEND = "float"
+    # Optional memoization of constructor results; None disables it.
+    CACHE: Optional[RectCache] = None
 
     def __init__(
         self,
@@ -27,64 +166,236 @@ class RectCalc:
         width: Optional[Measurement] = None,
         *,
         hole: Optional[Measurement] = None,
-        verbose: bool = False) -> None:
-        """Calculate the pin, hole, and pad sizes for a rectangular pin."""
+        verbose: bool = False,
+        backend: Optional[str] = None) -> None:
+        """Calculate the pin, hole, and pad sizes for a rectangular pin.
+
+        `length` and `width` are the inputs. `hypo`, `hole_size` and `pad_size`
+        are derived from them on first access. Assigning a new `length` or `width`
+        discards them so they are recomputed from the new pin.
+
+        With `verbose`, the stages of this construction are logged to the
+        console through a `hole_pad_calc.trace.ConsoleSubscriber`.
+        """
+        if verbose:
+            from hole_pad_calc.trace import ConsoleSubscriber, traced
+
+            with traced(ConsoleSubscriber(stages=("hypotenuse", "hole", "pad"))):
+                self.__init__(length, width, hole=hole, backend=backend)
+                self.pad_size
+            self.verbose = True
+            return
         self.verbose: bool = verbose
+        self.backend: str = self._backend(backend)
+        # A hole given alongside the pin is checked against it, so it is never cached.
+        if self.CACHE is not None and (hole is None or (length is None and width is None)):
+            self._init_cached(self.CACHE, length, width, hole, self.backend)
+        elif self.backend == "fixed":
+            self._init_fixed(length, width, hole)
+        else:
+            self._init_float(length, width, hole)
+
+    def _init_float(
+        self,
+        length: Optional[Measurement],
+        width: Optional[Measurement],
+        hole: Optional[Measurement]) -> None:
+        """Float constructor: convert to inches and round at each step."""
         # Validate input
         if not length and not width:
             # If no length or width is provided but hole size is:
             if hole:
                 # calculate the pin size from the hole size
-                self.hole_size = hole.convert("in")
-                self.hypo = self.hole_size - Measurement(0.0059, "in")
-                length = self.hypo / sqrt(2)
+                hypo = hole.convert("in") - Measurement(self.CLEARANCE, "in")
+                length = hypo / sqrt(2)
                 width = length
             else:
                 raise ValueError("Length and/or width or hole must be provided.")
 
-        if length or width:
-            # if length or width is provided, calculate the pin size
-            if length and width:
-                self.length = length.convert("in")
-                self.width = width.convert("in")
-                if hole:
-                    self.hole_size = hole.convert("in")
-                    self.hypo = self.calc_hypo(self.length, self.width)
-                    calculated_hole = self.calc_hole(self.length, self.width)
-                    # Check if the provided hole size is close to the calculated hole size
-                    if abs(calculated_hole.value - self.hole_size.value) > self.TOLERANCE:
-                        raise ValueError(
-                            f"Provided hole size {self.hole_size} is not consistent with "
-                            f"calculated hole size {calculated_hole}."
-                        )
-            elif length and not width:
-                self.length = length.convert("in")
-                self.width = self.length
-                if hole:
-                    self.hole_size = hole.convert("in")
-            elif width and not length:
-                self.width = width.convert("in")
-                self.length = self.width
-                if hole:
-                    self.hole_size = hole.convert("in")
-            else:
-                raise ValueError("Length and/or width must be provided")
-
-        self.hypo = self.calc_hypo()
-        self.hole_size = self.calc_hole()
-        if hole:
-            if self.verbose:
-                console.print(
-                    f"Calculated Hole Size: {self.hole_size}",
-                )
-                console.print(
-                    f"Entered Hole Size: {self.hole_size}",
+        if length and width:
+            self.length = length.convert("in")
+            self.width = width.convert("in")
+            # Check if the provided hole size is close to the calculated hole size
+            if hole and abs(self.hole_size.value - hole.convert("in").value) > self.TOLERANCE:
+                raise ValueError(
+                    f"Provided hole size {hole.convert('in')} is not consistent with "
+                    f"calculated hole size {self.hole_size}."
                 )
-        self.pad_size = self.calc_pad()
+        elif length:
+            self.length = self.width = length.convert("in")
+        else:
+            self.width = self.length = width.convert("in")
+
+    length = _Input()
+    width = _Input()
+
+    def __getattr__(self, name: str) -> Measurement:
+        """Compute a derived attribute on first access.
+
+        The value is stored in the instance `__dict__`, so later reads are plain
+        attribute lookups that never reach this method. Assigning `length` or
+        `width` removes the stored values again.
+        """
+        if name not in DERIVED:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        if self.backend == "fixed":
+            # The integer stages are cheaper than deriving them one at a time.
+            self._derive_fixed()
+            return self.__dict__[name]
+        if name == "hypo":
+            value = self.calc_hypo()
+        elif name == "hole_size":
+            value = self.calc_hole()
+        else:
+            value = self.calc_pad()
+        self.__dict__[name] = value
+        return value
+
+    def _derive_fixed(self) -> None:
+        """Store the fixed-point hypotenuse, hole and pad of the current pin."""
+        length, width = self.length, self.width
+        if _hooks:
+            started = perf_counter()
+        hypo_nm = fixed.hypo(length.nanometres, width.nanometres)
+        if _hooks:
+            now = perf_counter()
+            _emit("hypotenuse", now - started, length=length, width=width, result_nm=hypo_nm)
+            started = now
+        hole_nm = fixed.hole(hypo_nm, to_nanometres(self.CLEARANCE, "in"))
+        if _hooks:
+            now = perf_counter()
+            _emit("hole", now - started, hypo_nm=hypo_nm, result_nm=hole_nm)
+            started = now
+        pad_nm = fixed.pad(hole_nm, to_nanometres(self.ANNULAR_RING, "in"), to_nanometres(self.ALLOWANCE, "in"))
+        if _hooks:
+            _emit("pad", perf_counter() - started, hole_nm=hole_nm, result_nm=pad_nm)
+        self.hypo = FixedMeasurement.from_nanometres(hypo_nm, INCHES)
+        self.hole_size = FixedMeasurement.from_nanometres(hole_nm, INCHES)
+        self.pad_size = FixedMeasurement.from_nanometres(pad_nm, INCHES)
+
+    @classmethod
+    def _backend(cls, backend: Optional[str]) -> str:
+        backend = backend or cls.BACKEND
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"Backend must be one of {cls.BACKENDS}. Got {backend}.")
+        return backend
+
+    def _init_cached(
+        self,
+        cache: RectCache,
+        length: Optional[Measurement],
+        width: Optional[Measurement],
+        hole: Optional[Measurement],
+        backend: str) -> None:
+        """Memoized constructor: reuse the derived values for the same inputs and rule.
+
+        The float backend keys on inches through `cache.key`; the fixed backend
+        keys on exact nanometres. A miss is calculated from the point the key
+        stands for, which is the caller's own input unless the cache has a
+        quantum. The caller's length and width are always kept.
+        """
+        if length is None and width is None:
+            if hole is None:
+                raise ValueError("Length and/or width or hole must be provided.")
+            inputs: Tuple[Measurement, ...] = (hole,)
+        else:
+            inputs = (length or width, width or length)
+        if backend == "fixed":
+            parts = tuple([m.nanometres for m in inputs])
+        else:
+            parts = tuple([
+                cache.key(m.value if m.unit is INCHES else convert_value(m.value, m.unit._unit, "in"))
+                for m in inputs
+            ])
+
+        def compute() -> Tuple[Measurement, ...]:
+            if backend == "fixed":
+                points = [FixedMeasurement.from_nanometres(nm, INCHES) for nm in parts]
+            else:
+                points = [Measurement._make(cache.value(part), INCHES) for part in parts]
+            result = RectCalc.__new__(RectCalc)
+            result.verbose = False
+            result.backend = backend
+            init = result._init_fixed if backend == "fixed" else result._init_float
+            if len(points) == 1:
+                init(None, None, points[0])
+            else:
+                init(points[0], points[1], None)
+            return (result.length, result.width, result.hypo, result.hole_size, result.pad_size)
+
+        # The rule is part of the key, so changing a rule constant never returns stale results.
+        derived = cache.get((backend, self.rule(), *parts), compute)
+        # Inputs first: assigning them drops derived values.
+        if len(inputs) == 1:
+            self.length, self.width = derived[:2]
+        elif backend == "fixed":
+            self.length, self.width = (FixedMeasurement.from_nanometres(m.nanometres, INCHES) for m in inputs)
+        else:
+            self.length, self.width = (m.convert("in") for m in inputs)
+        self.hypo, self.hole_size, self.pad_size = derived[2:]
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 4096, quantum: Optional[float] = None) -> RectCache:
+        """Memoize constructor results in a new bounded LRU cache and return it."""
+        cls.CACHE = RectCache(maxsize, quantum)
+        return cls.CACHE
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Stop memoizing constructor results and drop the cache."""
+        cls.CACHE = None
 
+    @classmethod
+    def rule(cls) -> Rule:
+        """The active rule."""
+        return Rule(cls.CLEARANCE, cls.ANNULAR_RING, cls.ALLOWANCE)
+
+    @classmethod
+    def use_rule(cls, rule: Union[str, Rule]) -> Rule:
+        """Make a level from `RULES`, or a custom `Rule`, the active rule.
+
+        The in-memory cache is cleared, since its results were calculated with
+        the previous rule. The persistent cache keys results by rule already.
+
+        Returns:
+            Rule: The previously active rule, to restore it later.
+        """
+        previous = cls.rule()
+        if isinstance(rule, str):
+            try:
+                rule = cls.RULES[rule]
+            except KeyError:
+                raise ValueError(f"Unknown rule {rule!r}. Rules are {tuple(cls.RULES)}.") from None
+        cls.CLEARANCE, cls.ANNULAR_RING, cls.ALLOWANCE = rule
+        if cls.CACHE is not None:
+            cls.CACHE.clear()
+        return previous
+
+    def _init_fixed(
+        self,
+        length: Optional[Measurement],
+        width: Optional[Measurement],
+        hole: Optional[Measurement]) -> None:
+        """Fixed-point constructor: integer nanometres with no intermediate rounding."""
+        if length is None and width is None:
+            if hole is None:
+                raise ValueError("Length and/or width or hole must be provided.")
+            side_nm = fixed.side_from_hypo(hole.nanometres - to_nanometres(self.CLEARANCE, "in"))
+            self.length = self.width = FixedMeasurement.from_nanometres(side_nm, INCHES)
+        else:
+            self.length = FixedMeasurement.from_nanometres((length or width).nanometres, INCHES)
+            self.width = FixedMeasurement.from_nanometres((width or length).nanometres, INCHES)
+        if hole is not None and (length is None) == (width is None):
+            if abs(self.hole_size.nanometres - hole.nanometres) > to_nanometres(self.TOLERANCE, "in"):
+                raise ValueError(
+                    f"Provided hole size {hole} is not consistent with "
+                    f"calculated hole size {self.hole_size}."
+                )
 
     @classmethod
     def prompt(cls) -> "RectCalc":
+        from rich.prompt import FloatPrompt, Prompt
+
         mode = Prompt.ask("Generate from pin or hole size?", choices=["pin", "hole"], default="pin", show_choices=True)
         if mode == "pin":
             length_value = FloatPrompt.ask("Enter the length of the rectangle")
@@ -116,7 +427,12 @@ class RectCalc:
             hole_size = Measurement(hole_size, unit=hole_unit)
             return cls(hole=hole_size)
 
-    def __rich__(self) -> Table:
+    def __rich__(self) -> "Table":
+        from rich.box import ROUNDED
+        from rich.table import Table
+        from rich.text import Text
+        from rich_gradient import Gradient
+
         places: int = self.PLACES[str(self.length.unit)]
         table = Table(
             title=Gradient(
@@ -224,22 +540,15 @@ class RectCalc:
                 width = width.convert("in")
         assert length and width, "Length and/or width must be provided"
 
+        if _hooks:
+            started = perf_counter()
         # Calculate the hypotenuse
-        a_sq = float(length.value) ** 2
-        if self.verbose:
-            console.log(f"Length: {length}")
-            console.log(f"Length Squared: {a_sq}")
-        b_sq = float(width.value) ** 2
-        if self.verbose:
-            console.log(f"Width: {width}")
-            console.log(f"Width Squared: {b_sq}")
-        c_sq = a_sq + b_sq
-        if self.verbose:
-            console.log(f"Length Squared + Width Squared: {c_sq}")
-        hypo_value = sqrt(c_sq)
-        if self.verbose:
-            console.log(f"Hypotenuse: {hypo_value}")
-        return Measurement(hypo_value, "in")
+        a_sq = float(length.value) * float(length.value)
+        b_sq = float(width.value) * float(width.value)
+        hypo = Measurement._make(sqrt(a_sq + b_sq), INCHES)
+        if _hooks:
+            _emit("hypotenuse", perf_counter() - started, length=length, width=width, result=hypo)
+        return hypo
 
 
     def calc_hole(
@@ -247,27 +556,249 @@ class RectCalc:
         length: Optional[Measurement] = None,
         width: Optional[Measurement] = None
     ) -> Measurement:
-        if not self.hypo:
-            self.hypo = self.calc_hypo(length, width).convert("in")
-        hole_value = (float(self.hypo.value) + 0.0059)
-        hole_size = Measurement(hole_value, "in")
-        _hole_size_mil: int = int(round(hole_size.convert("mil").value, 0))
-        return Measurement(_hole_size_mil, "mil").convert("in")
+        # An explicit pin is calculated on its own; otherwise reuse this pin's hypotenuse.
+        hypo = self.calc_hypo(length, width) if length or width else self.hypo
+        if _hooks:
+            started = perf_counter()
+        hole_size = _round_hole(float(hypo.value) + self.CLEARANCE)
+        if _hooks:
+            _emit("hole", perf_counter() - started, hypo=hypo, result=hole_size)
+        return hole_size
 
     def calc_pad(
         self, length: Optional[Measurement] = None, width: Optional[Measurement] = None
     ) -> Measurement:
-        self.hole_size = self.calc_hole(length, width)
-        hole_size_tol = float(self.hole_size)
-        annular_ring = 0.004
-        level_a = 0.016
-        pad_value = hole_size_tol + annular_ring + level_a
-        self.pad_size = Measurement(pad_value, self.hole_size.unit)
-        return self.pad_size
+        hole_size = self.calc_hole(length, width) if length or width else self.hole_size
+        if _hooks:
+            started = perf_counter()
+        hole_size_tol = float(hole_size)
+        annular_ring = self.ANNULAR_RING
+        allowance = self.ALLOWANCE
+        pad_value = hole_size_tol + annular_ring + allowance
+        pad_size = Measurement._make(pad_value, hole_size.unit)
+        if _hooks:
+            _emit("pad", perf_counter() - started, hole=hole_size, result=pad_size)
+        return pad_size
+
+    @classmethod
+    def batch(
+        cls,
+        lengths: Optional[ArrayLike] = None,
+        widths: Optional[ArrayLike] = None,
+        *,
+        holes: Optional[ArrayLike] = None,
+        unit: str = "in",
+        backend: Optional[str] = None,
+    ) -> RectBatch:
+        """Calculate the pin, hole, and pad sizes for many rectangular pins at once.
+
+        Mirrors the scalar constructor: pass lengths and/or widths to size holes
+        from pins, or only holes to size square pins from holes. The results are
+        identical to building one `RectCalc` per pin.
+
+        Args:
+            lengths (array-like, optional): Pin lengths in `unit`.
+            widths (array-like, optional): Pin widths in `unit`. Defaults to `lengths`.
+                Broadcast against `lengths`, so `lengths[:, None]` and
+                `widths[None, :]` evaluate a whole grid.
+            holes (array-like, optional): Hole sizes in `unit`.
+            unit (str, optional): Unit of every input array. Defaults to 'in'.
+            backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+
+        Returns:
+            RectBatch: Length, width, hypotenuse, hole and pad arrays in inches.
+        """
+        if cls._backend(backend) == "fixed":
+            return cls._batch_fixed(lengths, widths, holes, unit)
+        # Like the scalar constructor, a provided hole is only checked against
+        # the calculated one when both pin dimensions are known (or derived).
+        check_hole = holes is not None and (lengths is None) == (widths is None)
+        if lengths is None and widths is None:
+            if holes is None:
+                raise ValueError("Length and/or width or hole must be provided.")
+            hole_in = _to_inches(holes, unit)
+            length_in = (hole_in - cls.CLEARANCE) / sqrt(2)
+            width_in = length_in.copy()
+        else:
+            length_in, width_in = _pin_inches(
+                lengths if lengths is not None else widths, widths if widths is not None else lengths, unit
+            )
+
+        if _hooks:
+            started = perf_counter()
+        hypo = np.sqrt(length_in * length_in + width_in * width_in)
+        if _hooks:
+            now = perf_counter()
+            _emit("hypotenuse", now - started, items=hypo.size)
+            started = now
+        hole_size = _hole_array(hypo, cls.CLEARANCE)
+        if _hooks:
+            _emit("hole", perf_counter() - started, items=hole_size.size)
+        if check_hole:
+            mismatch = cls.hole_mismatch(hole_size, holes, unit, backend="float")
+            if np.any(mismatch):
+                index = int(np.flatnonzero(mismatch)[0])
+                raise HoleMismatchError(index, float(np.broadcast_to(hole_size, mismatch.shape).flat[index]))
+        if _hooks:
+            started = perf_counter()
+        pad_size = hole_size + cls.ANNULAR_RING + cls.ALLOWANCE
+        if _hooks:
+            _emit("pad", perf_counter() - started, items=pad_size.size)
+        return RectBatch(length_in, width_in, hypo, hole_size, pad_size)
+
+    @classmethod
+    def hole_mismatch(
+        cls, calculated: ArrayLike, holes: ArrayLike, unit: str = "in", *, backend: Optional[str] = None
+    ) -> np.ndarray:
+        """Which provided holes are not consistent with the calculated ones.
+
+        This is the check `batch` applies to its `holes`, as a mask, so callers
+        can set aside the inconsistent pins instead of stopping at the first.
+
+        Args:
+            calculated (array-like): Holes from `batch`, in inches.
+            holes (array-like): Provided holes in `unit`.
+            unit (str, optional): Unit of `holes`. Defaults to 'in'.
+            backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+
+        Returns:
+            np.ndarray: True where a provided hole is off by more than `TOLERANCE`.
+        """
+        if cls._backend(backend) == "fixed":
+            calculated_nm = fixed.to_nanometres_array(calculated, "in")
+            return np.abs(calculated_nm - fixed.to_nanometres_array(holes, unit)) > to_nanometres(cls.TOLERANCE, "in")
+        return np.abs(np.asarray(calculated) - _to_inches(holes, unit)) > cls.TOLERANCE
+
+    @classmethod
+    def levels(
+        cls,
+        lengths: ArrayLike,
+        widths: Optional[ArrayLike] = None,
+        *,
+        unit: str = "in",
+        backend: Optional[str] = None,
+        rules: Optional[Union[Mapping[str, Rule], Iterable[str]]] = None,
+    ) -> Dict[str, RectBatch]:
+        """Calculate holes and pads for many pins under several rules in one pass.
+
+        The hypotenuse is calculated once, and the hole once per distinct
+        clearance; only the pads are calculated per rule. Each result is
+        identical to `batch` with that rule active. The results share their
+        length, width and hypotenuse arrays, and their hole arrays where the
+        clearances match, so treat them as read-only.
+
+        Args:
+            lengths (array-like): Pin lengths in `unit`.
+            widths (array-like, optional): Pin widths in `unit`. Defaults to `lengths`.
+            unit (str, optional): Unit of the input arrays. Defaults to 'in'.
+            backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+            rules (mapping or iterable, optional): Rules by name, or names from
+                `RULES`. Defaults to every rule in `RULES`.
+
+        Returns:
+            dict: A `RectBatch` in inches per rule name, in the order of `rules`.
+        """
+        if rules is None:
+            rules = cls.RULES
+        elif not isinstance(rules, Mapping):
+            names = list(rules)
+            unknown = [name for name in names if name not in cls.RULES]
+            if unknown:
+                raise ValueError(f"Unknown rule {unknown[0]!r}. Rules are {tuple(cls.RULES)}.")
+            rules = {name: cls.RULES[name] for name in names}
+        widths = lengths if widths is None else widths
+        fixed_point = cls._backend(backend) == "fixed"
+        scale = NANOMETRES[UNIT_INDEX["in"]]
+        if fixed_point:
+            length_nm, width_nm = np.broadcast_arrays(
+                fixed.to_nanometres_array(lengths, unit), fixed.to_nanometres_array(widths, unit)
+            )
+        else:
+            length_in, width_in = _pin_inches(lengths, widths, unit)
+        if _hooks:
+            started = perf_counter()
+        if fixed_point:
+            hypo_nm = fixed.hypo_array(length_nm, width_nm)
+            length_in, width_in, hypo = length_nm / scale, width_nm / scale, hypo_nm / scale
+        else:
+            hypo = np.sqrt(length_in * length_in + width_in * width_in)
+        if _hooks:
+            _emit("hypotenuse", perf_counter() - started, items=hypo.size)
+
+        # Hole sizes in inches (and nanometres for "fixed") per distinct clearance.
+        holes: Dict[float, Tuple[np.ndarray, Optional[np.ndarray]]] = {}
+        results: Dict[str, RectBatch] = {}
+        for name, rule in rules.items():
+            if rule.clearance not in holes:
+                if _hooks:
+                    started = perf_counter()
+                if fixed_point:
+                    hole_nm = fixed.hole_array(hypo_nm, to_nanometres(rule.clearance, "in"))
+                    holes[rule.clearance] = (hole_nm / scale, hole_nm)
+                else:
+                    holes[rule.clearance] = (_hole_array(hypo, rule.clearance), None)
+                if _hooks:
+                    _emit("hole", perf_counter() - started, items=hypo.size, rule=name)
+            hole_size, hole_nm = holes[rule.clearance]
+            if _hooks:
+                started = perf_counter()
+            if fixed_point:
+                pad_nm = hole_nm + to_nanometres(rule.annular_ring, "in") + to_nanometres(rule.allowance, "in")
+                pad_size = pad_nm / scale
+            else:
+                pad_size = hole_size + rule.annular_ring + rule.allowance
+            if _hooks:
+                _emit("pad", perf_counter() - started, items=hypo.size, rule=name)
+            results[name] = RectBatch(length_in, width_in, hypo, hole_size, pad_size)
+        return results
+
+    @classmethod
+    def _batch_fixed(
+        cls,
+        lengths: Optional[ArrayLike],
+        widths: Optional[ArrayLike],
+        holes: Optional[ArrayLike],
+        unit: str,
+    ) -> RectBatch:
+        """Fixed-point `batch`: int64 nanometres, converted to inches only for the result."""
+        clearance = to_nanometres(cls.CLEARANCE, "in")
+        if lengths is None and widths is None:
+            if holes is None:
+                raise ValueError("Length and/or width or hole must be provided.")
+            length_nm = fixed.side_from_hypo_array(fixed.to_nanometres_array(holes, unit) - clearance)
+            width_nm = length_nm
+        else:
+            length_nm = fixed.to_nanometres_array(lengths if lengths is not None else widths, unit)
+            width_nm = fixed.to_nanometres_array(widths if widths is not None else lengths, unit)
+            length_nm, width_nm = np.broadcast_arrays(length_nm, width_nm)
+        if _hooks:
+            started = perf_counter()
+        hypo_nm = fixed.hypo_array(length_nm, width_nm)
+        if _hooks:
+            now = perf_counter()
+            _emit("hypotenuse", now - started, items=hypo_nm.size)
+            started = now
+        hole_nm = fixed.hole_array(hypo_nm, clearance)
+        if _hooks:
+            _emit("hole", perf_counter() - started, items=hole_nm.size)
+        if holes is not None and (lengths is None) == (widths is None):
+            mismatch = np.abs(hole_nm - fixed.to_nanometres_array(holes, unit)) > to_nanometres(cls.TOLERANCE, "in")
+            if np.any(mismatch):
+                index = int(np.flatnonzero(mismatch)[0])
+                raise HoleMismatchError(
+                    index, from_nanometres(int(np.broadcast_to(hole_nm, mismatch.shape).flat[index]), "in")
+                )
+        if _hooks:
+            started = perf_counter()
+        pad_nm = hole_nm + to_nanometres(cls.ANNULAR_RING, "in") + to_nanometres(cls.ALLOWANCE, "in")
+        if _hooks:
+            _emit("pad", perf_counter() - started, items=pad_nm.size)
+        scale = NANOMETRES[UNIT_INDEX["in"]]
+        return RectBatch(length_nm / scale, width_nm / scale, hypo_nm / scale, hole_nm / scale, pad_nm / scale)
 
 
 if __name__ == "__main__":
-    console = Console()
+    console = get_console()
 
     # Clear the console
     console.line(9)
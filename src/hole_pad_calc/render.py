@@ -0,0 +1,207 @@
+"""Streaming text output for many results.
+
+`RectCalc.__rich__` builds a styled table per calculation and converts every
+value one by one, which suits a single result but is far slower than the math
+for thousands of them. This module renders results in chunks instead. Each
+chunk's mm and mil columns are converted in bulk with `convert_array`, and
+the rows are formatted with one format string:
+
+    write_plain(RectCalc.batch(lengths, widths, unit="mm"), sys.stdout)
+    print_rich(store.chunks(), unit=store.unit, page_rows=40)
+
+`write_plain` writes fixed-width text and needs no rich import. `print_rich`
+writes the same rows in pages, colored like `RectCalc.__rich__`. Output starts
+at once and memory stays bounded whatever the number of rows.
+"""
+from itertools import cycle, islice
+from operator import mod
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.unit import PLACES_BY_INDEX, UNIT_INDEX, UNITS, _invalid_unit, convert_array
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+Results = Union[RectBatch, Iterable[RectBatch], Iterable[RectCalc]]
+
+# Field, header name and color per column. The colors are those of `RectCalc.__rich__`.
+COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("length", "length", "#00aaff"),
+    ("width", "width", "#ffaa00"),
+    ("hypo", "hypo", "#00ff00"),
+    ("hole_size", "hole", "#ffff00"),
+    ("pad_size", "pad", "#ff9900"),
+)
+# Values are right-aligned in columns at least this wide, like `RectCalc.__rich__`.
+WIDTH = 12
+CHUNK_ROWS = 4096
+PAGE_ROWS = 50
+
+
+def _gather(measurements: Sequence[Measurement], unit: str) -> np.ndarray:
+    """Values of `measurements` in `unit`, converted in bulk per source unit."""
+    values = np.array([m.value for m in measurements], dtype=np.float64)
+    units = np.array([UNIT_INDEX[m.unit.unit] for m in measurements], dtype=np.int8)
+    for index, source in enumerate(UNITS):
+        rows = units == index
+        if source != unit and rows.any():
+            values[rows] = convert_array(values[rows], source, unit)
+    return values
+
+
+def chunks(results: Results, chunk_rows: int = CHUNK_ROWS, unit: str = "in") -> Iterator[RectBatch]:
+    """Split results into flat `RectBatch` chunks of at most `chunk_rows` rows.
+
+    Args:
+        results: A `RectBatch` of any shape, an iterable of them such as
+            `ResultStore.chunks()`, or an iterable of `RectCalc`.
+        chunk_rows (int, optional): Rows per chunk. Defaults to 4096.
+        unit (str, optional): Unit `RectCalc` values are gathered in. Batches
+            are passed through as they are. Defaults to 'in'.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be positive. Got {chunk_rows}.")
+    if isinstance(results, RectBatch):
+        results = (results,)
+    items = iter(results)
+    for item in items:
+        if isinstance(item, RectBatch):
+            flat = RectBatch(*(np.ravel(column) for column in item))
+            for start in range(0, len(flat.length), chunk_rows):
+                yield RectBatch(*(column[start:start + chunk_rows] for column in flat))
+        elif isinstance(item, RectCalc):
+            calcs = [item, *islice(items, chunk_rows - 1)]
+            yield RectBatch(*(_gather([getattr(calc, field) for calc in calcs], unit) for field in RectBatch._fields))
+        else:
+            raise ValueError(f"Cannot render {type(item)}. Expected RectBatch or RectCalc.")
+
+
+def _check_units(units: Sequence[str]) -> None:
+    for name in units:
+        if name not in UNIT_INDEX:
+            raise _invalid_unit(name)
+
+
+def _columns(batch: RectBatch, unit: str, units: Sequence[str]) -> List[List[float]]:
+    """Every field in every unit of `units`, unit-major, as lists ready for formatting."""
+    columns = []
+    for target in units:
+        for values in batch:
+            if target != unit:
+                values = convert_array(np.asarray(values, dtype=np.float64), unit, target)
+            columns.append(values.tolist())
+    return columns
+
+
+def header(units: Sequence[str] = UNITS) -> str:
+    """Fixed-width header line, e.g. `length_in` ... `pad_mil`, matching `write_plain` rows."""
+    _check_units(units)
+    return " ".join(f"{f'{name}_{unit}':>{WIDTH}}" for unit in units for _, name, _ in COLUMNS)
+
+
+def write_plain(
+    results: Results,
+    file: TextIO,
+    *,
+    unit: str = "in",
+    units: Sequence[str] = UNITS,
+    chunk_rows: int = CHUNK_ROWS,
+    show_header: bool = True,
+) -> int:
+    """Write results as fixed-width text, one chunk per `write` call.
+
+    Values are printed to the places of their unit: 5 for inches, 4 for mm
+    and 3 for mils.
+
+    Args:
+        results: See `chunks`.
+        file (TextIO): Destination, e.g. `sys.stdout`.
+        unit (str, optional): Unit of `RectBatch` values. Defaults to 'in'.
+        units (sequence of str, optional): Units to show, each as five columns. Defaults to in, mm and mil.
+        chunk_rows (int, optional): Rows converted and written at a time. Defaults to 4096.
+        show_header (bool, optional): Write a header line first. Defaults to True.
+
+    Returns:
+        int: Rows written
+    """
+    _check_units([unit, *units])
+    row = " ".join(f"%{WIDTH}.{PLACES_BY_INDEX[UNIT_INDEX[target]]}f" for target in units for _ in COLUMNS)
+    if show_header:
+        file.write(header(units) + "\n")
+    written = 0
+    for batch in chunks(results, chunk_rows, unit):
+        lines = map(row.__mod__, zip(*_columns(batch, unit, units)))
+        file.write("\n".join(lines) + "\n")
+        written += len(batch.length)
+    return written
+
+
+def _styled(console: "Console", text: str, style: str) -> str:
+    """`text` wrapped in the escape codes of `style` on `console`, or as-is without color."""
+    from rich.console import COLOR_SYSTEMS
+    from rich.style import Style
+
+    if console.color_system is None:
+        return text
+    return Style.parse(style).render(text, color_system=COLOR_SYSTEMS[console.color_system])
+
+
+def print_rich(
+    results: Results,
+    console: Optional["Console"] = None,
+    *,
+    unit: str = "in",
+    units: Sequence[str] = UNITS,
+    page_rows: int = PAGE_ROWS,
+    title: Optional[str] = "Rectangular Hole Calculator",
+    pause: bool = False,
+) -> int:
+    """Print results in colored pages of `page_rows` rows, each written as soon as it is formatted.
+
+    Columns are styled like `RectCalc.__rich__`. The style escape codes are
+    rendered once and built into the row format strings, so a page costs
+    about as much as `write_plain` rather than a rich layout per cell.
+    Without color, e.g. when the console is a file, the rows are exactly
+    those of `write_plain`.
+
+    Args:
+        results: See `chunks`.
+        console (Console, optional): Defaults to the shared console.
+        unit (str, optional): Unit of `RectBatch` values. Defaults to 'in'.
+        units (sequence of str, optional): Units to show. Defaults to in, mm and mil.
+        page_rows (int, optional): Rows per page; each page starts with the header. Defaults to 50.
+        title (str, optional): Title above the first page.
+        pause (bool, optional): On a terminal, wait for Enter after each page;
+            'q' stops. Defaults to False.
+
+    Returns:
+        int: Rows printed
+    """
+    if console is None:
+        from hole_pad_calc import get_console
+
+        console = get_console()
+    _check_units([unit, *units])
+    cells = [(f"%{WIDTH}.{PLACES_BY_INDEX[UNIT_INDEX[target]]}f", color) for target in units for _, _, color in COLUMNS]
+    rows = [
+        _styled(console, " ", background).join(_styled(console, fmt, f"b {color} {background}") for fmt, color in cells)
+        for background in ("on #000000", "on #222222")
+    ]
+    names = [f"{f'{name}_{target}':>{WIDTH}}" for target in units for _, name, _ in COLUMNS]
+    head = " ".join(_styled(console, name, f"b #000000 on {color}") for name, (_, color) in zip(names, cells))
+    printed = 0
+    for batch in chunks(results, page_rows, unit):
+        if printed == 0 and title:
+            console.print(title, style="b", markup=False, highlight=False)
+        # Rows alternate between the two backgrounds.
+        lines = map(mod, cycle(rows), zip(*_columns(batch, unit, units)))
+        console.file.write(head + "\n" + "\n".join(lines) + "\n")
+        printed += len(batch.length)
+        if pause and console.is_terminal:
+            if console.input("-- Enter for more, q to stop -- ").strip().lower() == "q":
+                break
+    return printed
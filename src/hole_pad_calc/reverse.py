@@ -0,0 +1,120 @@
+"""Reverse lookup: which pins on a length × width grid give a hole or pad size?
+
+`PinIndex.build` evaluates the grid once with `sweep` and sorts every pin by
+hole size. The pad is the hole plus a constant, so the same order is sorted by
+pad too. A range query is two binary searches, and its result is a slice of
+the sorted columns: O(log n) plus the number of matches, without copying.
+
+The index saves as a result store (see `hole_pad_calc.store`). `PinIndex.load`
+memory-maps it, so reopening even a large index is immediate.
+"""
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.store import ResultStore, write_store
+from hole_pad_calc.sweep import sweep
+from hole_pad_calc.unit import NANOMETRES, UNIT_INDEX, to_nanometres
+
+_NM_PER_INCH = NANOMETRES[UNIT_INDEX["in"]]
+
+
+class PinIndex:
+    """Pins of a grid sorted by hole size, answering hole and pad range queries.
+
+    Build one with `PinIndex.build` or `PinIndex.load`. Results are `RectBatch`
+    slices in inches, ordered by hole size, and by length then width within
+    one hole size.
+
+    Args:
+        batch (RectBatch): 1-D columns already sorted by `hole_size`.
+        backend (str): Backend the holes were calculated with.
+    """
+
+    def __init__(self, batch: RectBatch, backend: str) -> None:
+        self.batch = batch
+        self.backend = backend
+        self._store: Optional[ResultStore] = None
+
+    @classmethod
+    def build(
+        cls,
+        lengths: ArrayLike,
+        widths: ArrayLike,
+        *,
+        unit: str = "in",
+        backend: Optional[str] = None,
+    ) -> "PinIndex":
+        """Index every length and width combination.
+
+        Args:
+            lengths (array-like): Pin lengths in `unit`, e.g. from `sweep.axis`.
+            widths (array-like): Pin widths in `unit`.
+            unit (str, optional): Unit of both axes. Defaults to 'in'.
+            backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+        """
+        backend = RectCalc._backend(backend)
+        columns = [np.ravel(column) for column in sweep(lengths, widths, unit=unit, backend=backend).batch()]
+        order = np.argsort(columns[3], kind="stable")
+        return cls(RectBatch(*(column[order] for column in columns)), backend)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PinIndex":
+        """Memory-map an index written by `save`."""
+        store = ResultStore(path)
+        holes = store.column("hole_size")
+        if store.unit != "in" or np.any(holes[1:] < holes[:-1]):
+            store.close()
+            raise ValueError(f"{path} is not a pin index: holes are not sorted inches.")
+        index = cls(store[:], store.header.backend)
+        index._store = store
+        return index
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index as a result store."""
+        write_store(path, self.batch, "in", self.backend)
+
+    def close(self) -> None:
+        """Release the mapping of a loaded index."""
+        if self._store is not None:
+            self.batch = RectBatch(*(np.empty(0) for _ in RectBatch._fields))
+            self._store.close()
+            self._store = None
+
+    def __enter__(self) -> "PinIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.batch.hole_size)
+
+    def _range(self, column: np.ndarray, low: float, high: Optional[float], unit: str) -> RectBatch:
+        # Sizes are compared at nanometre resolution, so a query in any unit
+        # matches the holes (whole mils) and pads it names exactly.
+        high = low if high is None else high
+        start = np.searchsorted(column, (to_nanometres(low, unit) - 0.5) / _NM_PER_INCH, side="left")
+        stop = np.searchsorted(column, (to_nanometres(high, unit) + 0.5) / _NM_PER_INCH, side="right")
+        return RectBatch(*(values[start:stop] for values in self.batch))
+
+    def holes(self, low: float, high: Optional[float] = None, unit: str = "in") -> RectBatch:
+        """Pins whose hole size is between `low` and `high` inclusive.
+
+        Args:
+            low (float): Smallest hole size in `unit`.
+            high (float, optional): Largest hole size in `unit`. Defaults to `low`,
+                an exact match. `holes(0, 40, "mil")` finds every pin that fits a 40 mil drill.
+            unit (str, optional): Unit of `low` and `high`. Defaults to 'in'.
+
+        Returns:
+            RectBatch: Matching pins in inches, as views of the index.
+        """
+        return self._range(self.batch.hole_size, low, high, unit)
+
+    def pads(self, low: float, high: Optional[float] = None, unit: str = "in") -> RectBatch:
+        """Pins whose pad size is between `low` and `high` inclusive. See `holes`."""
+        return self._range(self.batch.pad_size, low, high, unit)
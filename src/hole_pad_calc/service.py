@@ -0,0 +1,406 @@
+"""Local HTTP/JSON calculation service with request micro-batching.
+
+Tools that need hole and pad sizes can ask a running service instead of
+embedding the math. The service uses only asyncio and the standard library
+and binds to localhost by default, so it runs fully offline:
+
+    hole-pad-calc serve --port 8765
+
+    POST /pin   {"length": 1.27, "width": 0.64, "unit": "mm"}
+    POST /hole  {"hole": [30, 40], "unit": "mil", "output_unit": "mm"}
+    GET  /stats
+    GET  /health
+
+`length`, `width` and `hole` are numbers or lists of numbers. `width`
+defaults to `length`, and `output_unit` defaults to `unit`. Each response has
+`length`, `width`, `hypo`, `hole_size` and `pad_size` in `output_unit`, shaped
+like the request.
+
+Requests are queued rather than calculated one at a time. A batcher task
+takes the first queued request, optionally waits `max_delay` seconds for more,
+then drains up to `max_batch` rows. It groups them by kind and units and runs `RectCalc.batch`
+once per group. `/stats` reports latency percentiles per endpoint, queue
+depth and batch sizes. `LocalClient` sends requests through the same handler
+without a socket, for tests and in-process use.
+"""
+import asyncio
+import json
+from collections import deque
+from time import perf_counter
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.unit import UNIT_INDEX, convert_array
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_BATCH = 65_536
+MAX_DELAY = 0.0
+MAX_BODY = 16 * 1024 * 1024
+# Latencies kept per endpoint for the percentiles in /stats.
+LATENCY_WINDOW = 10_000
+PERCENTILES = (50, 90, 99)
+ENDPOINTS = ("/pin", "/hole", "/stats", "/health")
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+Payload = Dict[str, object]
+
+
+class ServiceError(ValueError):
+    """A request the service rejects, with the HTTP status to answer with."""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class ServiceStats(NamedTuple):
+    """Counters reported by `/stats`. Latencies are in milliseconds, measured inside the service."""
+    requests: int
+    errors: int
+    batches: int
+    mean_batch_requests: float
+    mean_batch_rows: float
+    queue_depth: int
+    max_queue_depth: int
+    latency_ms: Dict[str, Dict[str, float]]
+
+
+class _Pending(NamedTuple):
+    key: Tuple[str, str, str]  # kind, unit, output unit
+    values: Tuple[np.ndarray, ...]  # lengths and widths, or holes
+    scalar: bool
+    future: "asyncio.Future[Payload]"
+
+
+def _unit(payload: Payload, name: str, default: str) -> str:
+    unit = payload.get(name, default)
+    if not isinstance(unit, str) or unit not in UNIT_INDEX:
+        raise ServiceError(f"Invalid {name}: {unit}. Must be 'in', 'mm', or 'mil'.")
+    return unit
+
+
+def _numbers(payload: Payload, name: str) -> Tuple[np.ndarray, bool]:
+    """`payload[name]` as a 1-D float64 array, and whether it was a single number."""
+    value = payload.get(name)
+    scalar = not isinstance(value, list)
+    items = [value] if scalar else value
+    if not items or not all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in items):
+        raise ServiceError(f"{name!r} must be a number or a non-empty list of numbers.")
+    try:
+        array = np.array(items, dtype=np.float64)
+    except (OverflowError, TypeError):
+        raise ServiceError(f"{name!r} must be within the float range.") from None
+    if not np.all(np.isfinite(array)):
+        raise ServiceError(f"{name!r} must be finite.")
+    return array, scalar
+
+
+def _calculate(key: Tuple[str, str, str], values: Tuple[np.ndarray, ...], backend: str) -> RectBatch:
+    """One vectorized calculation, with every column converted to the output unit."""
+    kind, unit, output_unit = key
+    if kind == "pin":
+        result = RectCalc.batch(values[0], values[1], unit=unit, backend=backend)
+    else:
+        result = RectCalc.batch(holes=values[0], unit=unit, backend=backend)
+    if output_unit == "in":
+        return result
+    return RectBatch(*(convert_array(column, "in", output_unit) for column in result))
+
+
+class Service:
+    """Micro-batching calculation service.
+
+    Use as an async context manager, which starts and stops the batcher:
+
+        async with Service() as service:
+            server = await service.listen(port=0)
+            ...
+
+    Args:
+        max_batch (int, optional): Most rows calculated per batch. Defaults to 65,536.
+        max_delay (float, optional): Seconds to wait for more requests after the
+            first one is queued. Defaults to 0: requests that arrive while a batch
+            is calculated form the next batch.
+        backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH, max_delay: float = MAX_DELAY, backend: Optional[str] = None) -> None:
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be positive. Got {max_batch}.")
+        if max_delay < 0:
+            raise ValueError(f"max_delay must not be negative. Got {max_delay}.")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.backend = RectCalc._backend(backend)
+        self._queue: Optional["asyncio.Queue[_Pending]"] = None
+        self._batcher: Optional["asyncio.Task[None]"] = None
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._requests = 0
+        self._errors = 0
+        self._batches = 0
+        self._batched_requests = 0
+        self._batched_rows = 0
+        self._max_queue_depth = 0
+
+    async def __aenter__(self) -> "Service":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the batcher task on the running event loop."""
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the batcher. Requests still queued fail with `CancelledError`."""
+        if self._batcher is None:
+            return
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        self._batcher = None
+
+    def client(self) -> "LocalClient":
+        return LocalClient(self)
+
+    async def listen(self, host: str = HOST, port: int = PORT) -> asyncio.AbstractServer:
+        """Accept HTTP connections on `host:port`. Port 0 picks a free port."""
+        await self.start()
+        return await asyncio.start_server(self._connection, host, port)
+
+    def stats(self) -> ServiceStats:
+        latency = {
+            endpoint: {
+                **{f"p{q}": float(value) * 1e3 for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES))},
+                "max": max(samples) * 1e3,
+                "count": len(samples),
+            }
+            for endpoint, samples in self._latencies.items()
+            if samples
+        }
+        batches = self._batches or 1
+        return ServiceStats(
+            requests=self._requests,
+            errors=self._errors,
+            batches=self._batches,
+            mean_batch_requests=self._batched_requests / batches,
+            mean_batch_rows=self._batched_rows / batches,
+            queue_depth=0 if self._queue is None else self._queue.qsize(),
+            max_queue_depth=self._max_queue_depth,
+            latency_ms=latency,
+        )
+
+    async def handle(self, method: str, path: str, body: bytes = b"") -> Tuple[int, Payload]:
+        """Answer one request. Returns the HTTP status and the JSON payload."""
+        started = perf_counter()
+        self._requests += 1
+        try:
+            payload = await self._route(method, path, body)
+            status = 200
+        except ServiceError as error:
+            status, payload = error.status, {"error": str(error)}
+        except Exception as error:
+            status, payload = 500, {"error": f"{type(error).__name__}: {error}"}
+        if status != 200:
+            self._errors += 1
+        endpoint = f"{method} {path}" if path in ENDPOINTS else "other"
+        samples = self._latencies.setdefault(endpoint, deque(maxlen=LATENCY_WINDOW))
+        samples.append(perf_counter() - started)
+        return status, payload
+
+    async def _route(self, method: str, path: str, body: bytes) -> Payload:
+        if path in ("/pin", "/hole"):
+            if method != "POST":
+                raise ServiceError(f"{path} needs POST.", 405)
+            try:
+                payload = json.loads(body)
+            except (ValueError, UnicodeDecodeError) as error:
+                raise ServiceError(f"Invalid JSON: {error}") from None
+            if not isinstance(payload, dict):
+                raise ServiceError("The request body must be a JSON object.")
+            return await self.calculate(path[1:], payload)
+        if path in ("/stats", "/health"):
+            if method != "GET":
+                raise ServiceError(f"{path} needs GET.", 405)
+            return self.stats()._asdict() if path == "/stats" else {"status": "ok"}
+        raise ServiceError(f"No endpoint {path}.", 404)
+
+    async def calculate(self, kind: str, payload: Payload) -> Payload:
+        """Queue one "pin" or "hole" request and wait for its batch.
+
+        Raises:
+            ServiceError: If the payload is invalid.
+        """
+        if self._batcher is None:
+            raise RuntimeError("The service is not running. Use `async with Service()` or `start()`.")
+        unit = _unit(payload, "unit", "in")
+        key = (kind, unit, _unit(payload, "output_unit", unit))
+        if kind == "pin":
+            lengths, scalar = _numbers(payload, "length")
+            widths, width_scalar = _numbers(payload, "width") if "width" in payload else (lengths, scalar)
+            if scalar != width_scalar or len(lengths) != len(widths):
+                raise ServiceError("'length' and 'width' must have the same shape.")
+            values = (lengths, widths)
+        else:
+            holes, scalar = _numbers(payload, "hole")
+            values = (holes,)
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Pending(key, values, scalar, future))
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            pending = [await self._queue.get()]
+            # Even with no delay, yielding once lets requests that are already being handled join the batch.
+            await asyncio.sleep(self.max_delay)
+            rows = len(pending[0].values[0])
+            while rows < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                pending.append(item)
+                rows += len(item.values[0])
+            self._batches += 1
+            self._batched_requests += len(pending)
+            self._batched_rows += rows
+            try:
+                self._answer(pending)
+            except Exception as error:
+                # Keep serving; the requests of this batch get the error.
+                for item in pending:
+                    if not item.future.done():
+                        item.future.set_exception(error)
+
+    def _answer(self, pending: List[_Pending]) -> None:
+        groups: Dict[Tuple[str, str, str], List[_Pending]] = {}
+        for item in pending:
+            groups.setdefault(item.key, []).append(item)
+        for key, items in groups.items():
+            values = tuple(np.concatenate(columns) for columns in zip(*(item.values for item in items)))
+            try:
+                result = _calculate(key, values, self.backend)
+            except ValueError as error:
+                # One bad request must not fail the rest of its group; retry them one by one.
+                if len(items) > 1:
+                    for item in items:
+                        self._answer([item])
+                else:
+                    items[0].future.set_exception(ServiceError(str(error)))
+                continue
+            start = 0
+            for item in items:
+                stop = start + len(item.values[0])
+                if not item.future.done():
+                    columns = {name: column[start:stop].tolist() for name, column in zip(RectBatch._fields, result)}
+                    if item.scalar:
+                        columns = {name: column[0] for name, column in columns.items()}
+                    item.future.set_result({"unit": key[2], **columns})
+                start = stop
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection until it closes."""
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, body, keep_alive, error = request
+                if error is not None:
+                    status, payload = error.status, {"error": str(error)}
+                    self._errors += 1
+                    keep_alive = False
+                else:
+                    status, payload = await self.handle(method, path, body)
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as error:
+            # Anything else, e.g. a request line over the stream limit, still gets an answer.
+            self._errors += 1
+            writer.write(_response(500, {"error": f"{type(error).__name__}: {error}"}, False))
+        finally:
+            writer.close()
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, bytes, bool, Optional[ServiceError]]]:
+    """Read one request: method, path, body, keep-alive and any framing error. None at end of stream."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        return "", "", b"", False, ServiceError("Malformed request line.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        return method, target, b"", False, ServiceError("Invalid Content-Length.")
+    if length > MAX_BODY:
+        return method, target, b"", False, ServiceError(f"Request bodies are limited to {MAX_BODY} bytes.", 413)
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], body, keep_alive, None
+
+
+def _response(status: int, payload: Payload, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class LocalClient:
+    """In-process client. Requests go through `Service.handle`, with JSON encoding but no socket."""
+
+    def __init__(self, service: Service) -> None:
+        self.service = service
+
+    async def get(self, path: str) -> Tuple[int, Payload]:
+        status, payload = await self.service.handle("GET", path)
+        return status, json.loads(json.dumps(payload))
+
+    async def post(self, path: str, payload: Union[Payload, List[object]]) -> Tuple[int, Payload]:
+        status, result = await self.service.handle("POST", path, json.dumps(payload).encode())
+        return status, json.loads(json.dumps(result))
+
+
+async def serve(host: str = HOST, port: int = PORT, **options: object) -> None:
+    """Run a service until cancelled. `options` are passed to `Service`."""
+    async with Service(**options) as service:
+        server = await service.listen(host, port)
+        async with server:
+            await server.serve_forever()
@@ -0,0 +1,213 @@
+"""Pin-shape kernels: hole and pad sizes for rectangular, round and oblong leads.
+
+Every shape sizes its hole from the diameter of the smallest circle around
+the lead: the diagonal of a rectangle, the diameter of a round lead, or the
+overall length of an oblong (stadium) lead. The hole and pad then follow the
+active `RectCalc` rule. Each kernel has a scalar `calc` and a vectorized
+`batch`. `RECT` delegates both to `RectCalc`.
+
+`batch` evaluates a mixed list of shapes by grouping the rows by shape, so
+each kernel runs once over all of its rows:
+
+    batch(["rect", "round", "rect"], [20, 30, 25], [10, 30, 12], unit="mil")
+"""
+from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Dict, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc import _emit, _hooks, fixed
+from hole_pad_calc.measurement import FixedMeasurement, Measurement
+from hole_pad_calc.rect_calc import INCHES, RectBatch, RectCalc, _hole_array, _round_hole, _to_inches
+from hole_pad_calc.unit import NANOMETRES, UNIT_INDEX, to_nanometres
+
+Number = Union[float, int, np.ndarray]
+
+
+class PinSize(NamedTuple):
+    """Scalar kernel result. `diameter` is the circle around the lead the hole is sized from."""
+    diameter: Measurement
+    hole_size: Measurement
+    pad_size: Measurement
+
+
+class PinKernel(ABC):
+    """Base kernel. Subclasses set `name` and define `diameter`.
+
+    A subclass without `diameter` cannot be instantiated, so it never reaches `register`.
+    """
+
+    name = ""
+
+    @staticmethod
+    @abstractmethod
+    def diameter(length: Number, width: Number) -> Number:
+        """Enclosing diameter of a lead. Works on floats, integer nanometres and arrays."""
+
+    def calc(self, length: Measurement, width: Optional[Measurement] = None, *, backend: Optional[str] = None) -> PinSize:
+        """Diameter, hole and pad of one lead, in inches, with the active `RectCalc` rule."""
+        width = length if width is None else width
+        if RectCalc._backend(backend) == "fixed":
+            diameter_nm = self.diameter(length.nanometres, width.nanometres)
+            hole_nm = fixed.hole(diameter_nm, to_nanometres(RectCalc.CLEARANCE, "in"))
+            pad_nm = fixed.pad(hole_nm, to_nanometres(RectCalc.ANNULAR_RING, "in"), to_nanometres(RectCalc.ALLOWANCE, "in"))
+            return PinSize(*(FixedMeasurement.from_nanometres(nm, INCHES) for nm in (diameter_nm, hole_nm, pad_nm)))
+        diameter = self.diameter(float(length.convert("in").value), float(width.convert("in").value))
+        hole_size = _round_hole(diameter + RectCalc.CLEARANCE)
+        pad_size = Measurement._make(float(hole_size) + RectCalc.ANNULAR_RING + RectCalc.ALLOWANCE, INCHES)
+        return PinSize(Measurement._make(diameter, INCHES), hole_size, pad_size)
+
+    def hole(self, length: Measurement, width: Optional[Measurement] = None, *, backend: Optional[str] = None) -> Measurement:
+        return self.calc(length, width, backend=backend).hole_size
+
+    def pad(self, length: Measurement, width: Optional[Measurement] = None, *, backend: Optional[str] = None) -> Measurement:
+        return self.calc(length, width, backend=backend).pad_size
+
+    def batch(
+        self,
+        lengths: ArrayLike,
+        widths: Optional[ArrayLike] = None,
+        *,
+        unit: str = "in",
+        backend: Optional[str] = None,
+    ) -> RectBatch:
+        """Vectorized `calc`. `hypo` holds the enclosing diameters; every array is in inches."""
+        widths = lengths if widths is None else widths
+        if RectCalc._backend(backend) == "fixed":
+            length_nm, width_nm = np.broadcast_arrays(
+                fixed.to_nanometres_array(lengths, unit), fixed.to_nanometres_array(widths, unit)
+            )
+            if _hooks:
+                started = perf_counter()
+            diameter_nm = np.array(self.diameter(length_nm, width_nm), dtype=np.int64)
+            hole_nm = fixed.hole_array(diameter_nm, to_nanometres(RectCalc.CLEARANCE, "in"))
+            pad_nm = hole_nm + to_nanometres(RectCalc.ANNULAR_RING, "in") + to_nanometres(RectCalc.ALLOWANCE, "in")
+            if _hooks:
+                _emit("hole", perf_counter() - started, items=hole_nm.size, shape=self.name)
+            scale = NANOMETRES[UNIT_INDEX["in"]]
+            return RectBatch(length_nm / scale, width_nm / scale, diameter_nm / scale, hole_nm / scale, pad_nm / scale)
+        length_in, width_in = np.broadcast_arrays(_to_inches(lengths, unit), _to_inches(widths, unit))
+        if _hooks:
+            started = perf_counter()
+        diameter = np.array(self.diameter(length_in, width_in), dtype=np.float64)
+        hole_size = _hole_array(diameter, RectCalc.CLEARANCE)
+        pad_size = hole_size + RectCalc.ANNULAR_RING + RectCalc.ALLOWANCE
+        if _hooks:
+            _emit("hole", perf_counter() - started, items=hole_size.size, shape=self.name)
+        return RectBatch(length_in, width_in, diameter, hole_size, pad_size)
+
+
+class RectKernel(PinKernel):
+    """Rectangular leads, calculated by `RectCalc`."""
+
+    name = "rect"
+
+    @staticmethod
+    def diameter(length: Number, width: Number) -> Number:
+        return np.sqrt(length * length + width * width)
+
+    def calc(self, length: Measurement, width: Optional[Measurement] = None, *, backend: Optional[str] = None) -> PinSize:
+        calc = RectCalc(length, width, backend=backend)
+        return PinSize(calc.hypo, calc.hole_size, calc.pad_size)
+
+    def batch(
+        self,
+        lengths: ArrayLike,
+        widths: Optional[ArrayLike] = None,
+        *,
+        unit: str = "in",
+        backend: Optional[str] = None,
+    ) -> RectBatch:
+        return RectCalc.batch(lengths, widths, unit=unit, backend=backend)
+
+
+class RoundKernel(PinKernel):
+    """Round leads. `length` is the lead diameter; `width` is ignored."""
+
+    name = "round"
+
+    @staticmethod
+    def diameter(length: Number, width: Number) -> Number:
+        return length
+
+
+class OblongKernel(PinKernel):
+    """Oblong (stadium) leads: a rectangle with semicircular ends. The overall length spans the hole."""
+
+    name = "oblong"
+
+    @staticmethod
+    def diameter(length: Number, width: Number) -> Number:
+        return np.maximum(length, width) if isinstance(length, np.ndarray) else max(length, width)
+
+
+RECT = RectKernel()
+ROUND = RoundKernel()
+OBLONG = OblongKernel()
+
+# Kernels by shape name. Add custom shapes with `register`.
+SHAPES: Dict[str, PinKernel] = {kernel.name: kernel for kernel in (RECT, ROUND, OBLONG)}
+
+
+def register(kernel: PinKernel) -> PinKernel:
+    """Add `kernel` to `SHAPES` under `kernel.name`, replacing any kernel of that name."""
+    if not kernel.name:
+        raise ValueError("A pin kernel needs a name.")
+    SHAPES[kernel.name] = kernel
+    return kernel
+
+
+def kernel(shape: str) -> PinKernel:
+    """The kernel registered for `shape`."""
+    try:
+        return SHAPES[shape]
+    except KeyError:
+        raise ValueError(f"Unknown pin shape {shape!r}. Shapes are {tuple(SHAPES)}.") from None
+
+
+def batch(
+    shapes: Union[str, Sequence[str], np.ndarray],
+    lengths: ArrayLike,
+    widths: Optional[ArrayLike] = None,
+    *,
+    unit: str = "in",
+    backend: Optional[str] = None,
+) -> RectBatch:
+    """Hole and pad sizes for a mix of pin shapes.
+
+    Rows are grouped by shape and each kernel's `batch` runs once over its
+    group. The results are scattered back into input order.
+
+    Args:
+        shapes (str or sequence of str): Shape name per row, or one name for every row.
+        lengths (array-like): Pin lengths (round: diameters) in `unit`.
+        widths (array-like, optional): Pin widths in `unit`. Defaults to `lengths`.
+        unit (str, optional): Unit of the input arrays. Defaults to 'in'.
+        backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+
+    Returns:
+        RectBatch: 1-D arrays in inches, in input order. `hypo` holds the enclosing diameters.
+    """
+    lengths = np.asarray(lengths, dtype=np.float64).ravel()
+    widths = lengths if widths is None else np.asarray(widths, dtype=np.float64).ravel()
+    if isinstance(shapes, str):
+        return kernel(shapes).batch(lengths, widths, unit=unit, backend=backend)
+    shapes = np.asarray(shapes)
+    if not len(shapes) == len(lengths) == len(widths):
+        raise ValueError("shapes, lengths and widths must have the same length.")
+    # One vectorized comparison per registered shape; sorting the names would cost far more.
+    groups = [(shape_kernel, np.flatnonzero(shapes == name)) for name, shape_kernel in SHAPES.items()]
+    groups = [(shape_kernel, rows) for shape_kernel, rows in groups if len(rows)]
+    if sum(len(rows) for _, rows in groups) != len(shapes):
+        unknown = np.isin(shapes, list(SHAPES), invert=True)
+        kernel(str(shapes[np.flatnonzero(unknown)[0]]))
+    if len(groups) == 1:
+        return groups[0][0].batch(lengths, widths, unit=unit, backend=backend)
+    result = RectBatch(*(np.empty(len(lengths)) for _ in RectBatch._fields))
+    for shape_kernel, rows in groups:
+        group = shape_kernel.batch(lengths[rows], widths[rows], unit=unit, backend=backend)
+        for column, values in zip(result, group):
+            column[rows] = values
+    return result
@@ -0,0 +1,213 @@
+"""Persistent `RectCalc.batch` results, shared across runs and processes.
+
+    with SQLiteCache("results.db") as cache:
+        result = cache.batch(lengths, widths, unit="mm")
+
+Results live in a local SQLite file with the rule constants that produced them.
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc import fixed
+from hole_pad_calc.cache import _scale
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.unit import convert_array
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rules (
+    id INTEGER PRIMARY KEY,
+    clearance REAL NOT NULL,
+    annular_ring REAL NOT NULL,
+    level_a REAL NOT NULL,  -- the active rule's allowance; the name predates ALLOWANCE
+    quantum REAL NOT NULL,
+    UNIQUE (clearance, annular_ring, level_a, quantum)
+);
+CREATE TABLE IF NOT EXISTS results (
+    rule_id INTEGER NOT NULL REFERENCES rules (id) ON DELETE CASCADE,
+    backend TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    a INTEGER NOT NULL,
+    b INTEGER NOT NULL,
+    length REAL NOT NULL,
+    width REAL NOT NULL,
+    hypo REAL NOT NULL,
+    hole REAL NOT NULL,
+    pad REAL NOT NULL,
+    PRIMARY KEY (rule_id, backend, mode, a, b)
+) WITHOUT ROWID;
+"""
+
+SELECT_BATCH = """
+SELECT keys.key, r.length, r.width, r.hypo, r.hole, r.pad
+FROM json_each(?) AS keys
+CROSS JOIN results AS r
+    ON r.rule_id = ? AND r.backend = ? AND r.mode = ?
+    AND r.a = json_extract(keys.value, '$[0]')
+    AND r.b = json_extract(keys.value, '$[1]')
+"""
+
+INSERT_RESULT = """
+INSERT OR IGNORE INTO results (rule_id, backend, mode, a, b, length, width, hypo, hole, pad)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class SQLiteCache:
+    """Persistent `RectCalc.batch` results in a local SQLite file.
+
+    Each result is stored with the rule constants (clearance, annular ring and
+    density level) that produced it; changing any of them selects a different
+    rule set, so older entries are never returned. `prune` deletes them.
+
+    The database runs in WAL mode so several worker processes can read it while
+    one writes. Open one `SQLiteCache` per process. Every batch is looked up
+    with a single query.
+
+    Inputs are keyed like `RectCache`: the float backend on the exact inch
+    value, or on its multiple of `quantum` if one is given, and the fixed
+    backend on exact nanometres. A miss is calculated from the caller's own
+    value, so without a quantum results are identical to `RectCalc.batch`.
+
+    Args:
+        path (str or Path): SQLite database file, created if missing.
+        quantum (float, optional): Quantization step in inches, see `RectCache`.
+            Defaults to None, which keys on exact values.
+        timeout (float, optional): Seconds to wait for a lock held by another process.
+    """
+
+    def __init__(self, path: Union[str, Path], quantum: Optional[float] = None, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.quantum: Optional[float] = quantum
+        self._scale: Optional[float] = None if quantum is None else _scale(quantum)
+        self._connection = sqlite3.connect(self.path, timeout=timeout)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+        self._rule_ids: Dict[Tuple[float, ...], int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __enter__(self) -> "SQLiteCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def rules(self) -> Tuple[float, float, float, float]:
+        """The current rule constants and quantum that results are keyed on. Exact keys store a quantum of 0."""
+        return (RectCalc.CLEARANCE, RectCalc.ANNULAR_RING, RectCalc.ALLOWANCE, self.quantum or 0.0)
+
+    def _rule_id(self) -> int:
+        rules = self.rules()
+        rule_id = self._rule_ids.get(rules)
+        if rule_id is None:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO rules (clearance, annular_ring, level_a, quantum) VALUES (?, ?, ?, ?)",
+                    rules,
+                )
+            (rule_id,) = self._connection.execute(
+                "SELECT id FROM rules WHERE clearance = ? AND annular_ring = ? AND level_a = ? AND quantum = ?",
+                rules,
+            ).fetchone()
+            self._rule_ids[rules] = rule_id
+        return rule_id
+
+    def _keys(self, values: np.ndarray, unit: str, backend: str) -> np.ndarray:
+        """Integer keys of 1-D input values for `backend`."""
+        if backend == "fixed":
+            return fixed.to_nanometres_array(values, unit)
+        inches = values if unit == "in" else convert_array(values, unit, "in")
+        if self._scale is None:
+            # The bits of the exact float, so equal keys mean equal inputs.
+            return np.ascontiguousarray(inches).view(np.int64)
+        return np.rint(inches * self._scale).astype(np.int64)
+
+    def batch(
+        self,
+        lengths: Optional[ArrayLike] = None,
+        widths: Optional[ArrayLike] = None,
+        *,
+        holes: Optional[ArrayLike] = None,
+        unit: str = "in",
+        backend: Optional[str] = None,
+    ) -> RectBatch:
+        """Cached `RectCalc.batch`. Takes the same arguments and returns the same values.
+
+        A hole given together with pins is checked against them, so that
+        combination is computed directly and not cached.
+        """
+        backend = RectCalc._backend(backend)
+        if lengths is None and widths is None:
+            if holes is None:
+                raise ValueError("Length and/or width or hole must be provided.")
+            mode = "hole"
+            inputs: Tuple[np.ndarray, ...] = (np.asarray(holes, dtype=np.float64),)
+        elif holes is None:
+            mode = "pin"
+            inputs = np.broadcast_arrays(
+                np.asarray(lengths if lengths is not None else widths, dtype=np.float64),
+                np.asarray(widths if widths is not None else lengths, dtype=np.float64),
+            )
+        else:
+            return RectCalc.batch(lengths, widths, holes=holes, unit=unit, backend=backend)
+        shape = inputs[0].shape
+        flat = [np.ravel(values) for values in inputs]
+        a = self._keys(flat[0], unit, backend)
+        b = self._keys(flat[1], unit, backend) if mode == "pin" else np.zeros_like(a)
+
+        keys, first, inverse = np.unique(np.stack([a, b], axis=1), axis=0, return_index=True, return_inverse=True)
+        table = np.full((len(keys), 5), np.nan)
+        rule_id = self._rule_id()
+        rows = self._connection.execute(
+            SELECT_BATCH, (json.dumps(keys.tolist()), rule_id, backend, mode)
+        ).fetchall()
+        if rows:
+            found = np.array(rows, dtype=np.float64)
+            table[found[:, 0].astype(np.intp)] = found[:, 1:]
+        missing = np.flatnonzero(np.isnan(table[:, 0]))
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if len(missing):
+            # Calculate from the first input with each key, not from the key.
+            source = first[missing]
+            if mode == "hole":
+                computed = RectCalc.batch(holes=flat[0][source], unit=unit, backend=backend)
+            else:
+                computed = RectCalc.batch(flat[0][source], flat[1][source], unit=unit, backend=backend)
+            table[missing] = np.stack(computed, axis=1)
+            with self._connection:
+                self._connection.executemany(
+                    INSERT_RESULT,
+                    (
+                        (rule_id, backend, mode, int(key[0]), int(key[1]), *row)
+                        for key, row in zip(keys[missing].tolist(), table[missing].tolist())
+                    ),
+                )
+        result = table[inverse.reshape(-1)]
+        return RectBatch(*(np.ascontiguousarray(column).reshape(shape) for column in result.T))
+
+    def prune(self) -> int:
+        """Delete results computed with rule constants other than the current ones.
+
+        Returns:
+            int: Number of deleted results.
+        """
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM results WHERE rule_id != ?", (self._rule_id(),))
+            self._connection.execute("DELETE FROM rules WHERE id NOT IN (SELECT DISTINCT rule_id FROM results)")
+        self._rule_ids.clear()
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return count
@@ -0,0 +1,197 @@
+"""Binary columnar store for `RectCalc.batch` results, read through `mmap`.
+
+Layout (little-endian)::
+
+    header   64 bytes  HEADER: magic, version, column count, unit, backend,
+                       row count, then TOLERANCE, CLEARANCE, ANNULAR_RING, ALLOWANCE
+    columns  float64   length, width, hypo, hole_size, pad_size; each column
+                       holds every row before the next column starts
+
+`StoreWriter` spools appended chunks per column in temporary files and
+assembles the store on close, so results never have to fit in memory.
+`ResultStore` maps the file and returns columns and row slices as read-only
+views of the mapping, without copying.
+"""
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.unit import UNIT_INDEX, _invalid_unit, convert_array
+
+MAGIC = b"HPCSTORE"
+VERSION = 1
+HEADER = struct.Struct("<8sHH4s8sQ4d")
+COLUMNS: Tuple[str, ...] = RectBatch._fields
+DTYPE = np.dtype("<f8")
+
+
+class StoreHeader(NamedTuple):
+    unit: str
+    backend: str
+    rows: int
+    tolerance: float
+    clearance: float
+    annular_ring: float
+    allowance: float
+
+
+class StoreWriter:
+    """Write `RectBatch` chunks to a result store.
+
+    Args:
+        path (str or Path): Store file. Replaced atomically when the writer closes.
+        unit (str, optional): Unit of the stored values. Defaults to 'in'. Other
+            units are converted and rounded like `Measurement.convert`.
+        backend (str, optional): Backend recorded in the header. Defaults to `RectCalc.BACKEND`.
+    """
+
+    def __init__(self, path: Union[str, Path], unit: str = "in", backend: Optional[str] = None) -> None:
+        if unit not in UNIT_INDEX:
+            raise _invalid_unit(unit)
+        self.path = Path(path)
+        self.unit = unit
+        self.backend = RectCalc._backend(backend)
+        self.rows = 0
+        self._spools: List[BinaryIO] = [tempfile.TemporaryFile() for _ in COLUMNS]
+        self._closed = False
+
+    def __enter__(self) -> "StoreWriter":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def append(self, batch: RectBatch) -> None:
+        """Append one chunk of results. Arrays of any shape are stored flattened."""
+        if self._closed:
+            raise ValueError("StoreWriter is closed.")
+        columns = [np.asarray(column, dtype=np.float64).ravel() for column in batch]
+        rows = len(columns[0])
+        if any(len(column) != rows for column in columns):
+            raise ValueError("Every column in a chunk must have the same length.")
+        for spool, column in zip(self._spools, columns):
+            if self.unit != "in":
+                column = convert_array(column, "in", self.unit)
+            spool.write(column.astype(DTYPE, copy=False).tobytes())
+        self.rows += rows
+
+    def close(self) -> None:
+        """Assemble the header and columns into `path`."""
+        if self._closed:
+            return
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            len(COLUMNS),
+            self.unit.encode("ascii"),
+            self.backend.encode("ascii"),
+            self.rows,
+            RectCalc.TOLERANCE,
+            RectCalc.CLEARANCE,
+            RectCalc.ANNULAR_RING,
+            RectCalc.ALLOWANCE,
+        )
+        partial = self.path.with_name(self.path.name + ".partial")
+        try:
+            with open(partial, "wb") as target:
+                target.write(header)
+                for spool in self._spools:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, target, 1 << 20)
+            os.replace(partial, self.path)
+        finally:
+            self.abort()
+            if partial.exists():
+                partial.unlink()
+
+    def abort(self) -> None:
+        """Discard the spooled chunks without writing `path`."""
+        for spool in self._spools:
+            spool.close()
+        self._closed = True
+
+
+def write_store(path: Union[str, Path], batch: RectBatch, unit: str = "in", backend: Optional[str] = None) -> None:
+    """Write one `RectBatch` to a result store."""
+    with StoreWriter(path, unit, backend) as writer:
+        writer.append(batch)
+
+
+class ResultStore:
+    """Read-only, memory-mapped view of a result store.
+
+    `store.column("pad_size")` and `store[a:b]` return views of the mapping;
+    nothing is copied until the values are used. `store[i]` returns one row as
+    a `RectBatch` of floats.
+
+    Args:
+        path (str or Path): Store file written by `StoreWriter`.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a result store.")
+        magic, version, columns, unit, backend, rows, *rules = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or columns != len(COLUMNS):
+            raise ValueError(f"{self.path} is not a version {VERSION} result store.")
+        if len(self._map) != HEADER.size + columns * rows * DTYPE.itemsize:
+            raise ValueError(f"{self.path} is truncated: expected {rows} rows.")
+        self.header = StoreHeader(
+            unit.rstrip(b"\0").decode("ascii"), backend.rstrip(b"\0").decode("ascii"), rows, *rules
+        )
+        self._columns = [
+            np.frombuffer(self._map, dtype=DTYPE, count=rows, offset=HEADER.size + index * rows * DTYPE.itemsize)
+            for index in range(columns)
+        ]
+
+    @property
+    def unit(self) -> str:
+        return self.header.unit
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping. Views still in use keep it open until they are freed."""
+        self._columns = []
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __len__(self) -> int:
+        return self.header.rows
+
+    def column(self, name: str) -> np.ndarray:
+        """One column as a read-only view."""
+        try:
+            return self._columns[COLUMNS.index(name)]
+        except ValueError:
+            raise KeyError(f"No column {name!r}. Columns are {COLUMNS}.") from None
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> RectBatch:
+        """One row as floats, a slice as views, or an index array as copies."""
+        if isinstance(index, (int, np.integer)):
+            return RectBatch(*(float(column[index]) for column in self._columns))
+        return RectBatch(*(column[index] for column in self._columns))
+
+    def chunks(self, size: int = 65_536) -> Iterator[RectBatch]:
+        """Iterate over the rows in slices of `size`."""
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
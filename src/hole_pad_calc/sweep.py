@@ -0,0 +1,122 @@
+"""Length × width design grids evaluated in one broadcast batch."""
+import csv
+from pathlib import Path
+from typing import NamedTuple, Optional, TextIO, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from hole_pad_calc.rect_calc import RectBatch, RectCalc
+from hole_pad_calc.unit import UNIT_INDEX, _invalid_unit, convert_array
+
+# Rows written per `writerows` call when streaming a grid to CSV.
+CSV_CHUNK = 65_536
+
+
+class Sweep(NamedTuple):
+    """Results of `sweep`.
+
+    `hypo`, `hole_size` and `pad_size` are in inches with shape
+    `(len(lengths), len(widths))`: row i is `lengths[i]`, column j is `widths[j]`.
+    """
+    lengths: np.ndarray
+    widths: np.ndarray
+    unit: str
+    hypo: np.ndarray
+    hole_size: np.ndarray
+    pad_size: np.ndarray
+    backend: str = "float"
+
+    def batch(self) -> RectBatch:
+        """The grid as a `RectBatch` in inches, with the axes copied out to the grid shape.
+
+        The axes are converted to inches by `RectCalc.batch` with the sweep's
+        backend, exactly as for the results.
+        """
+        shape = self.hypo.shape
+        lengths = RectCalc.batch(self.lengths, unit=self.unit, backend=self.backend).length
+        widths = RectCalc.batch(self.widths, unit=self.unit, backend=self.backend).length
+        return RectBatch(
+            np.array(np.broadcast_to(lengths[:, None], shape)),
+            np.array(np.broadcast_to(widths[None, :], shape)),
+            self.hypo,
+            self.hole_size,
+            self.pad_size,
+        )
+
+    def records(self, unit: Optional[str] = None) -> np.ndarray:
+        """The grid as a structured array with one record per pin.
+
+        Args:
+            unit (str, optional): Unit of every field. Defaults to the sweep's input unit.
+
+        Returns:
+            np.ndarray: Shape `(len(lengths), len(widths))`, fields length, width,
+                hypo, hole and pad.
+        """
+        unit = unit or self.unit
+        fields = ("length", "width", "hypo", "hole", "pad")
+        records = np.empty(self.hypo.shape, dtype=[(name, np.float64) for name in fields])
+        records["length"] = convert_array(self.lengths, self.unit, unit)[:, None]
+        records["width"] = convert_array(self.widths, self.unit, unit)[None, :]
+        for name, values in (("hypo", self.hypo), ("hole", self.hole_size), ("pad", self.pad_size)):
+            records[name] = convert_array(values, "in", unit)
+        return records
+
+
+def axis(start: float, stop: float, step: float) -> np.ndarray:
+    """Evenly spaced values from `start` to `stop` inclusive.
+
+    Values are computed as `start + i * step` and rounded to 10 decimal places,
+    so steps such as 0.1 do not accumulate error.
+    """
+    if step <= 0:
+        raise ValueError(f"Step must be positive. Got {step}.")
+    if stop < start:
+        raise ValueError(f"Stop must not be less than start. Got {start} to {stop}.")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return np.round(start + step * np.arange(count, dtype=np.float64), 10)
+
+
+def sweep(
+    lengths: ArrayLike,
+    widths: ArrayLike,
+    *,
+    unit: str = "in",
+    backend: Optional[str] = None,
+) -> Sweep:
+    """Calculate hole and pad sizes for every length and width combination.
+
+    The grid is evaluated with one broadcast `RectCalc.batch` call, so each
+    axis is converted once and every cell matches `RectCalc(length, width)`.
+
+    Args:
+        lengths (array-like): Pin lengths in `unit`, e.g. from `axis`.
+        widths (array-like): Pin widths in `unit`.
+        unit (str, optional): Unit of both axes. Defaults to 'in'.
+        backend (str, optional): "float" or "fixed". Defaults to `RectCalc.BACKEND`.
+
+    Returns:
+        Sweep: The axes and 2-D hypotenuse, hole and pad arrays.
+    """
+    if unit not in UNIT_INDEX:
+        raise _invalid_unit(unit)
+    lengths = np.asarray(lengths, dtype=np.float64).ravel()
+    widths = np.asarray(widths, dtype=np.float64).ravel()
+    backend = RectCalc._backend(backend)
+    batch = RectCalc.batch(lengths[:, None], widths[None, :], unit=unit, backend=backend)
+    return Sweep(lengths, widths, unit, batch.hypo, batch.hole_size, batch.pad_size, backend)
+
+
+def write_csv(result: Sweep, destination: TextIO, unit: Optional[str] = None, delimiter: str = ",") -> None:
+    """Write one row per pin: length, width, hypo, hole and pad in `unit`."""
+    records = result.records(unit).ravel()
+    writer = csv.writer(destination, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(records.dtype.names)
+    for start in range(0, len(records), CSV_CHUNK):
+        writer.writerows(records[start:start + CSV_CHUNK].tolist())
+
+
+def write_npy(result: Sweep, path: Union[str, Path], unit: Optional[str] = None) -> None:
+    """Save the structured `records` grid with `np.save`. Reload with `np.load(path)`."""
+    np.save(path, result.records(unit))
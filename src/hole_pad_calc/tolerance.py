@@ -0,0 +1,202 @@
+"""Monte Carlo tolerance analysis: how often does a real pin interfere with its hole?
+
+The hole is sized once from the nominal pin with `RectCalc`. Pin lengths and
+widths (and optionally the finished hole) are then sampled from their
+tolerance distributions, and the clearance `hole - diagonal` is accumulated
+chunk by chunk. A pin interferes when its diagonal is larger than the hole.
+
+Each chunk draws from its own child of one `np.random.SeedSequence`, so a
+seeded run gives the same report whatever the chunk order or worker count.
+Percentiles come from a fine fixed-range histogram. They are accurate to one
+bin, `(hi - lo) / bins`, reported as `resolution`. Moments, extremes and the
+interference count are exact.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hole_pad_calc.measurement import Measurement
+from hole_pad_calc.parallel import ordered_map
+from hole_pad_calc.rect_calc import RectCalc
+from hole_pad_calc.unit import FACTORS, UNIT_INDEX, _invalid_unit
+
+DISTRIBUTIONS = ("normal", "uniform")
+PERCENTILES = (0.1, 1.0, 5.0, 50.0, 95.0, 99.0, 99.9)
+BINS = 1 << 16
+
+
+class ToleranceReport(NamedTuple):
+    """Clearance statistics in `unit`. Clearance is hole size minus pin diagonal."""
+    samples: int
+    unit: str
+    hole: float
+    nominal_clearance: float
+    mean: float
+    std: float
+    min: float
+    max: float
+    interference: float
+    percentiles: Dict[float, float]
+    resolution: float
+
+
+class _Model(NamedTuple):
+    """Sampling parameters in inches, shared with worker processes."""
+    length: float
+    width: float
+    hole: float
+    length_spread: float
+    width_spread: float
+    hole_spread: float
+    distribution: str
+    lo: float
+    hi: float
+    bins: int
+
+
+class _Partial(NamedTuple):
+    count: int
+    total: float
+    squares: float
+    min: float
+    max: float
+    interfering: int
+    histogram: np.ndarray
+
+
+def _draw(rng: np.random.Generator, centre: float, spread: float, size: int, distribution: str) -> np.ndarray:
+    if spread == 0:
+        return np.full(size, centre)
+    if distribution == "normal":
+        return centre + spread * rng.standard_normal(size)
+    return rng.uniform(centre - spread, centre + spread, size)
+
+
+def _sample(task: Tuple[np.random.SeedSequence, int, _Model]) -> _Partial:
+    """Draw one chunk and reduce it to sums, extremes and a histogram."""
+    seed, size, model = task
+    rng = np.random.default_rng(seed)
+    length = _draw(rng, model.length, model.length_spread, size, model.distribution)
+    width = _draw(rng, model.width, model.width_spread, size, model.distribution)
+    hole = _draw(rng, model.hole, model.hole_spread, size, model.distribution)
+    clearance = hole - np.sqrt(length * length + width * width)
+    # Moments are taken about the nominal clearance to avoid cancellation.
+    shifted = clearance - (model.lo + model.hi) / 2
+    scale = model.bins / (model.hi - model.lo)
+    # Bin 0 and the last bin collect everything below `lo` and above `hi`.
+    index = np.clip(np.floor((clearance - model.lo) * scale) + 1, 0, model.bins + 1).astype(np.intp)
+    return _Partial(
+        size,
+        float(shifted.sum()),
+        float(np.dot(shifted, shifted)),
+        float(clearance.min()),
+        float(clearance.max()),
+        int(np.count_nonzero(clearance < 0)),
+        np.bincount(index, minlength=model.bins + 2),
+    )
+
+
+def _percentile(histogram: np.ndarray, model: _Model, low: float, high: float, q: float) -> float:
+    counts = np.cumsum(histogram)
+    target = q / 100 * counts[-1]
+    index = int(np.searchsorted(counts, target))
+    if index == 0:
+        return low
+    if index > model.bins:
+        return high
+    before = counts[index - 1]
+    fraction = (target - before) / histogram[index] if histogram[index] else 0.0
+    width = (model.hi - model.lo) / model.bins
+    return min(max(model.lo + (index - 1 + float(fraction)) * width, low), high)
+
+
+def monte_carlo(
+    length: float,
+    width: Optional[float] = None,
+    *,
+    tolerance: float,
+    width_tolerance: Optional[float] = None,
+    hole_tolerance: float = 0.0,
+    unit: str = "in",
+    distribution: str = "normal",
+    sigmas: float = 3.0,
+    samples: int = 10_000_000,
+    seed: Optional[int] = None,
+    chunk_size: int = 1_000_000,
+    workers: int = 1,
+    backend: Optional[str] = None,
+    percentiles: Sequence[float] = PERCENTILES,
+    bins: int = BINS,
+) -> ToleranceReport:
+    """Sample pins around a nominal size and report clearance to the nominal hole.
+
+    Args:
+        length (float): Nominal pin length in `unit`.
+        width (float, optional): Nominal pin width in `unit`. Defaults to `length`.
+        tolerance (float): Symmetric ± tolerance on the length in `unit`.
+        width_tolerance (float, optional): ± tolerance on the width. Defaults to `tolerance`.
+        hole_tolerance (float, optional): ± tolerance on the finished hole. Defaults to 0.
+        unit (str, optional): Unit of every size and tolerance, and of the report. Defaults to 'in'.
+        distribution (str, optional): "normal", where a tolerance spans `sigmas`
+            standard deviations, or "uniform" over ± tolerance. Defaults to "normal".
+        sigmas (float, optional): Standard deviations per tolerance for "normal". Defaults to 3.
+        samples (int, optional): Number of sampled parts. Defaults to 10,000,000.
+        seed (int, optional): Seed for a reproducible run.
+        chunk_size (int, optional): Samples drawn per chunk. Defaults to 1,000,000.
+        workers (int, optional): Worker processes. Defaults to 1 (in-process).
+        backend (str, optional): Backend used to size the nominal hole.
+        percentiles (sequence of float, optional): Clearance percentiles to report.
+        bins (int, optional): Histogram bins for the percentiles. Defaults to 65,536.
+
+    Returns:
+        ToleranceReport: Clearance statistics in `unit`.
+    """
+    if unit not in UNIT_INDEX:
+        raise _invalid_unit(unit)
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Distribution must be one of {DISTRIBUTIONS}. Got {distribution}.")
+    if samples < 1 or chunk_size < 1 or workers < 1:
+        raise ValueError("samples, chunk_size and workers must be at least 1.")
+    width = length if width is None else width
+    width_tolerance = tolerance if width_tolerance is None else width_tolerance
+    if min(tolerance, width_tolerance, hole_tolerance) < 0:
+        raise ValueError("Tolerances must not be negative.")
+
+    to_inches = FACTORS[UNIT_INDEX[unit]][UNIT_INDEX["in"]]
+    hole = RectCalc(Measurement(length, unit), Measurement(width, unit), backend=backend).hole_size.value
+    divisor = sigmas if distribution == "normal" else 1.0
+    spreads = [t * to_inches / divisor for t in (tolerance, width_tolerance, hole_tolerance)]
+    nominal = hole - float(np.hypot(length * to_inches, width * to_inches))
+    # Clearance moves by at most the sum of the three deviations; cover 8 tolerances of it.
+    half_span = max(8 * divisor * sum(spreads), 1e-6)
+    model = _Model(
+        length * to_inches, width * to_inches, hole, *spreads, distribution,
+        nominal - half_span, nominal + half_span, bins,
+    )
+
+    sizes = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    tasks = [(child, size, model) for child, size in zip(np.random.SeedSequence(seed).spawn(len(sizes)), sizes)]
+    if workers > 1 and len(tasks) > 1:
+        partials: List[_Partial] = list(ordered_map(_sample, tasks, min(workers, len(tasks))))
+    else:
+        partials = [_sample(task) for task in tasks]
+
+    count = sum(p.count for p in partials)
+    offset = sum(p.total for p in partials) / count
+    variance = max(sum(p.squares for p in partials) / count - offset * offset, 0.0)
+    low, high = min(p.min for p in partials), max(p.max for p in partials)
+    histogram = np.sum([p.histogram for p in partials], axis=0)
+    scale = FACTORS[UNIT_INDEX["in"]][UNIT_INDEX[unit]]
+    return ToleranceReport(
+        samples=count,
+        unit=unit,
+        hole=hole * scale,
+        nominal_clearance=nominal * scale,
+        mean=((model.lo + model.hi) / 2 + offset) * scale,
+        std=variance ** 0.5 * scale,
+        min=low * scale,
+        max=high * scale,
+        interference=sum(p.interfering for p in partials) / count,
+        percentiles={float(q): _percentile(histogram, model, low, high, q) * scale for q in percentiles},
+        resolution=(model.hi - model.lo) / bins * scale,
+    )
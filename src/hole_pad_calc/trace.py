@@ -0,0 +1,137 @@
+"""Instrumentation hooks for the calculation stages.
+
+The scalar and batch paths report each stage they run, one of `STAGES`, to
+every subscribed hook as `hook(stage, seconds, data)`. `data` holds the stage
+inputs and result, plus `items` for vectorized calls. With no hook subscribed,
+an instrumented stage costs one truth test of `HOOKS`. The clock is only read
+when something is listening.
+
+    stats = StageStats()
+    with traced(stats):
+        RectCalc(Measurement(20, "mil"), Measurement(10, "mil"))
+    stats.report()["hypotenuse"].calls
+"""
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from hole_pad_calc import _emit, _hooks
+
+if TYPE_CHECKING:
+    import logging
+
+STAGES = ("hypotenuse", "hole", "pad", "convert")
+
+Hook = Callable[[str, float, Dict[str, object]], None]
+
+# Subscribed hooks. Instrumented modules test this list directly.
+HOOKS: List[Hook] = _hooks
+
+
+def subscribe(hook: Hook) -> Hook:
+    """Start sending stage events to `hook` and return it."""
+    HOOKS.append(hook)
+    return hook
+
+
+def unsubscribe(hook: Hook) -> None:
+    """Stop sending stage events to `hook`."""
+    HOOKS.remove(hook)
+
+
+@contextmanager
+def traced(*hooks: Hook) -> Iterator[None]:
+    """Subscribe `hooks` for the duration of a `with` block."""
+    for hook in hooks:
+        subscribe(hook)
+    try:
+        yield
+    finally:
+        for hook in hooks:
+            unsubscribe(hook)
+
+
+emit = _emit
+"""Send one stage event to every subscribed hook: `emit(stage, seconds, **data)`."""
+
+
+class StageTiming(NamedTuple):
+    calls: int
+    items: int
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        """Average seconds per item."""
+        return self.seconds / self.items if self.items else 0.0
+
+
+class StageStats:
+    """Subscriber that counts calls and items and accumulates time per stage."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def __call__(self, stage: str, seconds: float, data: Dict[str, object]) -> None:
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        self.items[stage] = self.items.get(stage, 0) + data.get("items", 1)
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.calls: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.items: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.seconds: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+
+    def report(self) -> Dict[str, StageTiming]:
+        """Calls, items and total seconds for every stage."""
+        return {stage: StageTiming(self.calls[stage], self.items[stage], self.seconds[stage]) for stage in self.calls}
+
+
+def _describe(stage: str, seconds: float, data: Dict[str, object]) -> str:
+    details = ", ".join(f"{key}={value}" for key, value in data.items())
+    return f"{stage} ({seconds * 1e6:.1f} µs): {details}"
+
+
+class LogSubscriber:
+    """Subscriber that writes each stage event to a `logging` logger.
+
+    `logging` is imported on first use, keeping it out of the core import.
+
+    Args:
+        logger (logging.Logger, optional): Defaults to the "hole_pad_calc" logger.
+        level (int, optional): Log level. Defaults to `logging.DEBUG`.
+        stages (iterable of str, optional): Only log these stages. Defaults to all.
+    """
+
+    def __init__(
+        self,
+        logger: Optional["logging.Logger"] = None,
+        level: Optional[int] = None,
+        stages: Optional[Iterable[str]] = None,
+    ) -> None:
+        import logging
+
+        self.logger = logger or logging.getLogger("hole_pad_calc")
+        self.level = logging.DEBUG if level is None else level
+        self.stages = frozenset(STAGES if stages is None else stages)
+
+    def __call__(self, stage: str, seconds: float, data: Dict[str, object]) -> None:
+        if stage in self.stages and self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s", _describe(stage, seconds, data))
+
+
+class ConsoleSubscriber:
+    """Subscriber that logs each stage event to the shared rich console.
+
+    Args:
+        stages (iterable of str, optional): Only log these stages. Defaults to all.
+    """
+
+    def __init__(self, stages: Optional[Iterable[str]] = None) -> None:
+        self.stages = frozenset(STAGES if stages is None else stages)
+
+    def __call__(self, stage: str, seconds: float, data: Dict[str, object]) -> None:
+        if stage in self.stages:
+            from hole_pad_calc import get_console
+
+            get_console().log(_describe(stage, seconds, data))
@@ -1,51 +1,176 @@
-from typing import Union
-
-from rich.text import Text
-from rich_gradient import Color, Gradient
-
-from hole_pad_calc import console
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+import numpy as np
+
+from hole_pad_calc import get_console
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+# Conversion kernel shared by Unit, Measurement and MeasurementArray.
+# FACTORS[i][j] converts a value in UNITS[i] to UNITS[j]; results are rounded
+# to PLACES_BY_INDEX[j] decimal places.
+UNITS: Tuple[str, ...] = ('in', 'mm', 'mil')
+UNIT_INDEX: Dict[str, int] = {unit: index for index, unit in enumerate(UNITS)}
+FACTORS: Tuple[Tuple[float, float, float], ...] = (
+    (1.0, 25.4, 1000.0),
+    (1 / 25.4, 1.0, 1000 / 25.4),
+    (1 / 1000, 25.4 / 1000, 1.0),
+)
+PLACES_BY_INDEX: Tuple[int, ...] = (5, 4, 3)
+# Exact size of one unit in integer nanometres, for the fixed-point backend.
+NANOMETRES: Tuple[int, ...] = (25_400_000, 1_000_000, 25_400)
+# Spellings accepted by `Measurement.parse`, lower case, mapped to UNITS.
+UNIT_ALIASES: Dict[str, str] = {
+    'in': 'in', 'inch': 'in', 'inches': 'in', '"': 'in',
+    'mm': 'mm',
+    'mil': 'mil', 'mils': 'mil', 'thou': 'mil',
+}
+
+
+def _round_array(values: np.ndarray, places: int) -> np.ndarray:
+    """Round an array exactly like the builtin `round(value, places)`."""
+    scale = 10.0 ** places
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    # `values * scale` is itself rounded, so it can create or hide a tie that
+    # the exact value does not have. Defer those rare elements to the builtin.
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(scaled))
+    for index in np.flatnonzero(near_tie):
+        rounded.flat[index] = round(float(values.flat[index]), places)
+    return rounded
+
+
+def _invalid_unit(unit: object) -> ValueError:
+    return ValueError(f"Invalid unit: {unit}. Must be 'in', 'mm', or 'mil'.")
+
+
+def convert_value(value: float, from_unit: str, to_unit: str) -> float:
+    """Convert one value between units, rounded to the target unit's places.
+
+    Args:
+        value (float): Value to convert
+        from_unit (str): Unit of `value`
+        to_unit (str): Unit to convert to
+
+    Returns:
+        float: Converted value
+    """
+    try:
+        row = UNIT_INDEX[from_unit]
+        column = UNIT_INDEX[to_unit]
+    except KeyError as error:
+        raise _invalid_unit(error.args[0]) from None
+    return round(value * FACTORS[row][column], PLACES_BY_INDEX[column])
+
+
+def convert_array(values: np.ndarray, from_unit: str, to_unit: str) -> np.ndarray:
+    """Convert a float64 array between units, matching `convert_value` element by element.
+
+    Args:
+        values (np.ndarray): Values to convert
+        from_unit (str): Unit of `values`
+        to_unit (str): Unit to convert to
+
+    Returns:
+        np.ndarray: Converted values
+    """
+    try:
+        row = UNIT_INDEX[from_unit]
+        column = UNIT_INDEX[to_unit]
+    except KeyError as error:
+        raise _invalid_unit(error.args[0]) from None
+    return _round_array(values * FACTORS[row][column], PLACES_BY_INDEX[column])
+
+
+def to_nanometres(value: float, unit: str) -> int:
+    """Quantize a value to the nearest whole nanometre.
+
+    Args:
+        value (float): Value to convert
+        unit (str): Unit of `value`
+
+    Returns:
+        int: Value in nanometres
+    """
+    try:
+        return round(value * NANOMETRES[UNIT_INDEX[unit]])
+    except KeyError:
+        raise _invalid_unit(unit) from None
+
+
+def from_nanometres(nanometres: int, unit: str) -> float:
+    """Express an integer number of nanometres in `unit` without intermediate rounding.
+
+    Args:
+        nanometres (int): Value in nanometres
+        unit (str): Unit to convert to
+
+    Returns:
+        float: Value in `unit`
+    """
+    try:
+        return nanometres / NANOMETRES[UNIT_INDEX[unit]]
+    except KeyError:
+        raise _invalid_unit(unit) from None
 
 
 class Unit:
-    VALID_UNITS = ['in', 'mm', 'mil']
+    VALID_UNITS = list(UNITS)
     CONVERSIONS = {
-            'in': {'mm': 25.4, 'mil': 1000},
-            'mm': {'in': 1 / 25.4, 'mil': 1000 / 25.4},
-            'mil': {'in': 1 / 1000, 'mm': 25.4 / 1000}
-        }
-    PLACES = { 'in': 5, 'mm': 4, 'mil': 3}
+        unit: {to: FACTORS[row][column] for column, to in enumerate(UNITS) if to != unit}
+        for row, unit in enumerate(UNITS)
+    }
+    PLACES = dict(zip(UNITS, PLACES_BY_INDEX))
     COLORS = {
         'in': '#ff5fff',
         'mm': '#00ff00',
         'mil': '#5f00ff'
     }
 
-    def __init__(self, unit: Union[str, 'Unit'] = 'in') -> None:
-        self._unit: str = ''
-        self.unit = unit  # This uses the property setter for validation
+    __slots__ = ('_unit',)
+    _INSTANCES: Dict[str, 'Unit'] = {}
 
-    def __str__(self) -> str:
-        return self.unit
+    def __new__(cls, unit: Union[str, 'Unit'] = 'in') -> 'Unit':
+        # Units are interned: there is exactly one instance per valid unit.
+        if isinstance(unit, str):
+            instance = cls._INSTANCES.get(unit)
+            if instance is not None:
+                return instance
+        elif isinstance(unit, Unit):
+            return unit
+        raise _invalid_unit(unit)
 
+    def __str__(self) -> str:
+        return self._unit
 
     def __eq__(self, other: Union[str, "Unit"]) -> bool:
-        if not isinstance(other, (str, Unit)):
-            raise NotImplementedError("Cannot compare Unit with non-string or non-Unit type.")
+        if other is self:
+            return True
+        if isinstance(other, str):
+            return self._unit == other
         if isinstance(other, Unit):
-            return self.unit == other.unit
-        return str(self.unit) == other
+            return False
+        raise NotImplementedError("Cannot compare Unit with non-string or non-Unit type.")
 
     def __ne__(self, other: Union[str, "Unit"]) -> bool:
-        if not isinstance(other, (str, Unit)):
-            raise NotImplementedError("Cannot compare Unit with non-string or non-Unit type.")
-        if isinstance(other, Unit):
-            return self.unit != other.unit
-        return str(self.unit) != other
+        return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(self.unit)
+        return hash(self._unit)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (Unit, (self._unit,))
+
+    def __copy__(self) -> 'Unit':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Unit':
+        return self
+
+    def __rich__(self) -> "Text":
+        from rich.text import Text
 
-    def __rich__(self) -> Text:
         color = self.COLORS[self.unit]
         return Text(self.unit, style=f"i {color}")
 
@@ -53,34 +178,8 @@ class Unit:
     def unit(self) -> str:
         return self._unit
 
-    @unit.setter
-    def unit(self, value: Union[str, 'Unit']) -> None:
-        if isinstance(value, Unit):
-            value = value.unit
-        if value not in self.VALID_UNITS:
-            raise ValueError(f"Invalid unit: {value}. Must be 'in', 'mm', or 'mil'.")
-        self._unit = value
-
-
     def convert(self, value: float|int, to_unit: str) -> float:
-        if to_unit not in self.VALID_UNITS:
-            raise ValueError(f"Units must be one of {self.VALID_UNITS}")
-        self_unit = self.unit
-
-        # Convert int to float
-        if isinstance(value, int):
-            value = float(value)
-
-        # Determine the number of decimal places to round to
-        places = self.PLACES[to_unit]
-
-        # If the units are the same, return the rounded value
-        if self_unit == to_unit:
-            return round(value, places)
-
-        # Convert the value to the new unit
-        conversion = self.CONVERSIONS[self_unit][to_unit]
-        return round((value * conversion), places)
+        return convert_value(float(value), self._unit, to_unit)
 
     def __repr__(self) -> str:
         return f"Unit(unit='{self.unit}')"
@@ -90,6 +189,10 @@ class Unit:
         from rich.box import ROUNDED
         from rich.table import Table
         from rich.prompt import FloatPrompt, Prompt
+        from rich.text import Text
+        from rich_gradient import Gradient
+
+        console = get_console()
 
         # Prompt
         console.clear()
@@ -132,5 +235,12 @@ class Unit:
 
 
 
+for _name in Unit.VALID_UNITS:
+    _instance = object.__new__(Unit)
+    _instance._unit = _name
+    Unit._INSTANCES[_name] = _instance
+del _name, _instance
+
+
 if __name__ == '__main__':
     Unit.example()
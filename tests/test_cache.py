@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from hole_pad_calc.cache import RectCache
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+
+@pytest.fixture
+def cache():
+    cache = RectCalc.enable_cache(maxsize=2)
+    yield cache
+    RectCalc.disable_cache()
+
+def test_lru_eviction_and_counters():
+    cache = RectCache(maxsize=2)
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('b', lambda: 2) == 2
+    assert cache.get('a', lambda: 0) == 1
+    cache.get('c', lambda: 3)
+    assert cache.get('b', lambda: 4) == 4
+    assert cache.info() == (1, 4, 2, 2, 2)
+
+def test_clear_resets_counters():
+    cache = RectCache()
+    cache.get('a', lambda: 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().misses == 0
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RectCache(maxsize=0)
+    with pytest.raises(ValueError):
+        RectCache(quantum=0)
+
+def test_rect_calc_cached_matches_uncached(cache):
+    cached = RectCalc(Measurement(1.23, 'mm'), Measurement(0.5, 'mm'))
+    RectCalc(Measurement(1.23, 'mm'), Measurement(0.5, 'mm'))
+    RectCalc.CACHE = None
+    uncached = RectCalc(Measurement(1.23, 'mm'), Measurement(0.5, 'mm'))
+    assert cache.hits == 1
+    assert cached.hypo.value == uncached.hypo.value
+    assert cached.pad_size.value == uncached.pad_size.value
+
+def test_rect_calc_cache_keys_on_inches(cache):
+    RectCalc(Measurement(25.4, 'mm'))
+    RectCalc(Measurement(1000, 'mil'))
+    assert cache.info()[:2] == (1, 1)
+
+def test_rect_calc_hole_with_pin_is_not_cached(cache):
+    RectCalc(Measurement(0.02), Measurement(0.02), hole=Measurement(0.034))
+    assert cache.info().misses == 0
+
+def test_tolerance_quantum_coalesces_inputs():
+    cache = RectCache(quantum=RectCalc.TOLERANCE)
+    assert cache.quantize(0.0201) == cache.quantize(0.0199) == 20
+    assert cache.snap(20) == 0.02
+
+def test_cached_matches_uncached_off_grid(cache):
+    # Off the 0.00001 in grid: snapping these to it changes the hole.
+    pins = [(0.13910292408615257, 0.04629137747525968)]
+    pins += [tuple(pin) for pin in np.random.default_rng(7).uniform(0.005, 0.2, (200, 2))]
+    cache.maxsize = len(pins)
+    for unit in ('in', 'mm'):
+        for length, width in pins:
+            pin = (Measurement(length, unit), Measurement(width, unit))
+            cached, again = RectCalc(*pin), RectCalc(*pin)
+            RectCalc.CACHE = None
+            uncached = RectCalc(*pin)
+            RectCalc.CACHE = cache
+            for name in ('length', 'width', 'hypo', 'hole_size', 'pad_size'):
+                assert getattr(cached, name).value == getattr(again, name).value == getattr(uncached, name).value
+    assert cache.hits == 2 * len(pins)
+
+def test_cache_keys_on_the_active_rule(cache, monkeypatch):
+    pin = Measurement(0.02), Measurement(0.02)
+    RectCalc(*pin)
+    monkeypatch.setattr(RectCalc, 'ALLOWANCE', 0.5)
+    cached = RectCalc(*pin).pad_size.value
+    RectCalc.CACHE = None
+    assert cached == RectCalc(*pin).pad_size.value > 0.5
+    assert cache.hits == 0
+
+def test_quantum_keeps_inputs_and_snaps_to_the_grid():
+    cache = RectCalc.enable_cache(quantum=RectCalc.TOLERANCE)
+    try:
+        first = RectCalc(Measurement(0.0401), Measurement(0.0401))
+        second = RectCalc(Measurement(0.0404), Measurement(0.0404))
+        assert (first.length.value, second.length.value) == (0.0401, 0.0404)
+        assert first.width.value == 0.0401 and second.width.value == 0.0404
+        RectCalc.CACHE = None
+        expected = RectCalc(Measurement(0.04), Measurement(0.04))
+        assert first.pad_size.value == second.pad_size.value == expected.pad_size.value
+        assert first.hypo.value == expected.hypo.value
+        assert cache.info()[:2] == (1, 1)
+    finally:
+        RectCalc.disable_cache()
@@ -0,0 +1,68 @@
+import io
+import pytest
+from hole_pad_calc.cli import main, run_batch
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+
+INPUT = """name,length,width,unit,hole
+A,0.5,0.3,mm,
+B,20,,mil,
+C,,,mil,40
+D,abc,1,mm,
+E,0.02,0.02,in,0.5
+"""
+
+def _run(text, **kwargs):
+    output, errors = io.StringIO(), io.StringIO()
+    failed = run_batch(io.StringIO(text), output, errors, chunk_size=2, **kwargs)
+    return failed, output.getvalue().splitlines(), errors.getvalue().splitlines()
+
+def test_batch_results_match_rect_calc():
+    failed, lines, _ = _run(INPUT)
+    assert lines[0] == 'name,length,width,unit,hole,hypo_in,hole_in,pad_in'
+    expected = RectCalc(Measurement(0.5, 'mm'), Measurement(0.3, 'mm'))
+    assert lines[1].split(',')[-2:] == [repr(expected.hole_size.value), repr(expected.pad_size.value)]
+    assert lines[3].split(',')[-2:] == ['0.04', '0.06']
+
+def test_malformed_rows_are_reported_per_row():
+    failed, lines, errors = _run(INPUT)
+    assert failed == 2
+    assert len(lines) == 6
+    assert lines[4].endswith(',,,')
+    assert errors[0].startswith('line 5:')
+    assert errors[1].startswith('line 6:')
+
+def test_output_unit_and_tsv(tmp_path):
+    source = tmp_path / 'pins.tsv'
+    source.write_text('length\twidth\n20\t10\n')
+    target = tmp_path / 'out.tsv'
+    assert main(['batch', str(source), '-o', str(target), '--unit', 'mil', '--output-unit', 'mil']) == 0
+    assert target.read_text().splitlines()[1].split('\t')[-2:] == ['28.0', '48.0']
+
+def test_missing_columns():
+    with pytest.raises(ValueError):
+        _run('name,size\nA,1\n')
+
+def test_workers_keep_order_and_line_numbers():
+    serial = _run(INPUT)
+    assert _run(INPUT, workers=2) == serial
+
+def test_non_finite_and_non_positive_values_are_malformed(recwarn):
+    failed, lines, errors = _run('length,width,unit\nnan,1,mm\ninf,1,mm\n1,-inf,mm\n-1,1,mm\n0,1,mm\n1,1,mm\n')
+    assert failed == 5
+    assert [error.split(':')[0] for error in errors] == [f'line {n}' for n in range(2, 7)]
+    assert 'must be a positive number' in errors[0]
+    assert not lines[-1].endswith(',,,')
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+def test_mismatched_holes_keep_the_group_batched():
+    failed, lines, errors = _run('length,width,hole,unit\n20,10,28,mil\n20,10,99,mil\n20,10,28,\n', unit='mil')
+    assert failed == 1
+    assert lines[1].split(',')[-2:] == ['0.028', '0.048']
+    assert lines[2].endswith(',,,')
+    assert errors == ['line 3: Provided hole size is not consistent with calculated hole size 0.028 in.']
+
+def test_short_malformed_rows_are_padded_to_the_header():
+    failed, lines, errors = _run('name,length,width,unit\nA,1\nB,1,1,mm\n')
+    assert failed == 1
+    assert lines[1] == 'A,1,,,,,'
+    assert len(lines[1].split(',')) == len(lines[2].split(','))
@@ -0,0 +1,67 @@
+import io
+import numpy as np
+import pytest
+from hole_pad_calc.cli import run_batch
+from hole_pad_calc.drills import DrillInventory, DrillUsage
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+
+def test_load_sorts_merges_and_reads_units(tmp_path):
+    path = tmp_path / 'drills.txt'
+    path.write_text('# stocked bits\n0.75 mm\n\n0.028\n28 mil  # same bit\n0.5,mm\n')
+    drills = DrillInventory.load(path)
+    assert len(drills) == 3
+    assert drills.sizes.tolist() == pytest.approx([0.5 / 25.4, 0.028, 0.75 / 25.4])
+    path.write_text('0.5 furlong\n')
+    with pytest.raises(ValueError, match='line 1'):
+        DrillInventory.load(path)
+
+def test_snap_moves_up_to_the_next_drill():
+    drills = DrillInventory([20, 28, 31], 'mil')
+    assert drills.snap(Measurement(28, 'mil')).value == 0.028
+    assert drills.snap(Measurement(0.0281, 'in')).value == 0.031
+    assert drills.snap(Measurement(0.1, 'mm')).value == 0.02
+    with pytest.raises(ValueError):
+        drills.snap(Measurement(32, 'mil'))
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_apply_matches_scalar_and_batch(backend):
+    drills = DrillInventory([0.5, 0.7, 0.8, 1.0, 1.2], 'mm')
+    lengths, widths = np.array([10, 20, 25, 30]), np.array([5, 10, 12, 20])
+    batch = drills.apply(RectCalc.batch(lengths, widths, unit='mil', backend=backend))
+    for i, (length, width) in enumerate(zip(lengths.tolist(), widths.tolist())):
+        calc = RectCalc(Measurement(length, 'mil'), Measurement(width, 'mil'), backend=backend)
+        row = drills.apply(calc)
+        assert row.hole_size == batch.hole_size[i] >= calc.hole_size.value
+        assert row.pad_size == pytest.approx(batch.pad_size[i])
+        assert row.pad_size == pytest.approx(row.hole_size + RectCalc.ANNULAR_RING + RectCalc.ALLOWANCE)
+
+def test_counts_and_usage():
+    drills = DrillInventory([20, 28, 31], 'mil')
+    counts = drills.counts([0.015, 0.02, 0.028, 0.021])
+    assert counts.tolist() == [2, 2, 0]
+    assert drills.usage(counts, 'mil') == [DrillUsage(20.0, 2), DrillUsage(28.0, 2), DrillUsage(31.0, 0)]
+
+def test_batch_cli_snaps_and_reports_usage():
+    drills = DrillInventory([28, 40], 'mil')
+    output, errors, usage = io.StringIO(), io.StringIO(), []
+    text = 'length,width\n20,10\n25,20\n100,100\n'
+    failed = run_batch(io.StringIO(text), output, errors, unit='mil', output_unit='mil', drills=drills, usage=usage)
+    lines = output.getvalue().splitlines()
+    assert failed == 1
+    assert lines[1].split(',')[-2:] == ['28.0', '48.0']
+    assert lines[2].split(',')[-2:] == ['40.0', '60.0']
+    assert lines[3].endswith(',,,')
+    assert errors.getvalue().startswith('line 4:')
+    assert usage == [DrillUsage(28.0, 1), DrillUsage(40.0, 1)]
+
+def test_batch_cli_sets_aside_undrillable_rows_in_one_batch(monkeypatch):
+    calls = []
+    batch = RectCalc.batch.__func__
+    monkeypatch.setattr(RectCalc, 'batch', classmethod(lambda cls, *a, **k: calls.append(1) or batch(cls, *a, **k)))
+    drills = DrillInventory([28, 40], 'mil')
+    output, errors = io.StringIO(), io.StringIO()
+    text = 'length,width\n20,10\n100,100\n25,20\n'
+    assert run_batch(io.StringIO(text), output, errors, unit='mil', output_unit='mil', drills=drills) == 1
+    assert len(calls) == 1
+    assert [line.split(',')[-1] for line in output.getvalue().splitlines()[1:]] == ['48.0', '', '60.0']
+    assert errors.getvalue() == 'line 3: Hole 0.147 in is larger than the largest drill, 0.04 in.\n'
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from hole_pad_calc.expr import lazy
+from hole_pad_calc.measurement import Measurement, MeasurementArray
+
+def test_scalar_expression_matches_eager():
+    a, b, c, d = Measurement(1, 'in'), Measurement(2, 'mm'), Measurement(3, 'mil'), Measurement(0.5, 'in')
+    la, lb, lc, ld = lazy(a, b, c, d)
+    expression = (la + lb) * lc - ld
+    assert repr(expression).startswith('(((Measurement<1.0 in> + ')
+    result = expression.evaluate()
+    assert isinstance(result, Measurement) and str(result.unit) == 'in'
+    assert result.value == ((a + b) * c - d).value
+    assert (lb / 2 + 1).evaluate().value == (b / 2 + 1).value
+    assert (2 * lb).evaluate().value == 4.0 and str((2 - lb).evaluate().unit) == 'mm'
+    assert (lb // 3).evaluate().value == 0.0
+
+def test_array_expression_matches_eager():
+    x = MeasurementArray(np.linspace(0.1, 3, 1000), 'mm')
+    y = MeasurementArray(np.linspace(0.1, 3, 1000) / 25.4, 'in')
+    z = MeasurementArray(np.linspace(1, 2, 1000), 'mm')
+    lx, ly, lz = lazy(x, y, z)
+    result = ((lx + ly) * lz - ly / (lz + 1)).evaluate()
+    assert isinstance(result, MeasurementArray) and str(result.unit) == 'mm'
+    assert np.array_equal(result.values, ((x + y) * z - y / (z + 1)).values)
+    mixed = (lazy(Measurement(1, 'mm')) + x).evaluate()
+    assert np.array_equal(mixed.values, 1 + x.values)
+
+def test_long_accumulation_and_errors():
+    total = lazy(Measurement(0, 'mm'))
+    for _ in range(5000):
+        total = total + Measurement(0.001, 'in')
+    assert total.evaluate().value == pytest.approx(127.0)
+    with pytest.raises(ValueError):
+        (lazy(2) + 3).evaluate()
+    with pytest.raises(ValueError):
+        lazy(Measurement(1)) + 'a'
+
+def test_in_place_measurement_array():
+    values = np.zeros(3)
+    pads = MeasurementArray(values, 'mm')
+    pads += Measurement(1, 'in')
+    pads *= 2
+    pads -= MeasurementArray([1, 2, 3], 'mm')
+    assert pads.values.tolist() == [49.8, 48.8, 47.8]
+    assert values.tolist() == [0.0, 0.0, 0.0]
+    buffer = pads.values
+    pads += 1
+    assert pads.values is buffer
+    frozen = np.ones(2)
+    frozen.flags.writeable = False
+    view = MeasurementArray(frozen, 'mm')
+    view /= 2
+    view //= 0.2
+    assert view.values.tolist() == [2.0, 2.0] and frozen.tolist() == [1.0, 1.0]
+    with pytest.raises(ValueError):
+        pads += 'a'
+
+def test_in_place_never_writes_to_shared_buffers():
+    raw = np.array([1.0, 2.0])
+    pads = MeasurementArray(raw, 'in')
+    acc = pads.convert('in')
+    acc += Measurement(1, 'in')
+    assert acc.values.tolist() == [2.0, 3.0]
+    assert raw.tolist() == pads.values.tolist() == [1.0, 2.0]
+    part = pads[:1]
+    part *= 4
+    assert part.values.tolist() == [4.0] and pads.values.tolist() == [1.0, 2.0]
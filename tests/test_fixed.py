@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from hole_pad_calc import fixed
+from hole_pad_calc.measurement import FixedMeasurement, Measurement
+from hole_pad_calc.rect_calc import RectCalc
+
+def test_fixed_measurement_conversion_is_exact():
+    m = FixedMeasurement(1.27, 'mm')
+    assert m.nanometres == 1_270_000
+    assert m.convert('mil').nanometres == 1_270_000
+    assert m.convert('mil').convert('in').convert('mm').value == 1.27
+
+def test_fixed_measurement_arithmetic():
+    m = FixedMeasurement(1, 'in') + Measurement(25.4, 'mm')
+    assert isinstance(m, FixedMeasurement)
+    assert m.nanometres == 50_800_000
+    assert (m - 1).value == 1.0
+    assert (m * 3).nanometres == 152_400_000
+
+def test_round_sqrt():
+    assert fixed.round_sqrt(24) == 5
+    assert fixed.round_sqrt(30) == 5
+    assert fixed.round_sqrt(31) == 6
+    values = np.array([0, 24, 30, 31, 10**18], dtype=np.int64)
+    assert list(fixed.round_sqrt_array(values)) == [fixed.round_sqrt(int(v)) for v in values]
+
+def test_hole_rounds_half_to_even_mils():
+    assert fixed.hole(0, 12_700) == 0
+    assert fixed.hole(25_400, 12_700) == 50_800
+    assert fixed.hole(0, 12_701) == 25_400
+
+def test_rect_calc_fixed_backend():
+    rect_calc = RectCalc(Measurement(0.5, 'mm'), Measurement(0.3, 'mm'), backend='fixed')
+    assert isinstance(rect_calc.hole_size, FixedMeasurement)
+    assert rect_calc.hole_size.nanometres % fixed.NM_PER_MIL == 0
+    assert rect_calc.pad_size.nanometres == rect_calc.hole_size.nanometres + 101_600 + 406_400
+
+def test_batch_fixed_matches_scalar_fixed():
+    lengths = [0.5, 0.65, 1.27]
+    widths = [0.3, 0.3, 0.64]
+    batch = RectCalc.batch(lengths, widths, unit='mm', backend='fixed')
+    for i, (length, width) in enumerate(zip(lengths, widths)):
+        rect_calc = RectCalc(Measurement(length, 'mm'), Measurement(width, 'mm'), backend='fixed')
+        assert batch.hole_size[i] == rect_calc.hole_size.value
+        assert batch.pad_size[i] == rect_calc.pad_size.value
+
+def test_global_backend(monkeypatch):
+    monkeypatch.setattr(RectCalc, 'BACKEND', 'fixed')
+    assert isinstance(RectCalc(hole=Measurement(40, 'mil')).hole_size, FixedMeasurement)
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        RectCalc(Measurement(1.0, 'mm'), backend='decimal')
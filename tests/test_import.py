@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+# Modules the calculation core must not import: rendering, the service and the
+# persistent cache load them on demand. The import time budget is checked by
+# benchmarks/bench_import.py, since wall-clock timings are too noisy to assert on.
+HEAVY_MODULES = ("rich", "rich_gradient", "asyncio", "sqlite3", "json", "multiprocessing")
+
+
+def _loaded(module):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+def test_core_import_does_not_load_heavy_modules():
+    loaded = _loaded("hole_pad_calc.rect_calc")
+    assert "hole_pad_calc" in loaded
+    assert not loaded.intersection(HEAVY_MODULES)
+
+def test_console_is_created_lazily():
+    import hole_pad_calc
+    assert hole_pad_calc.get_console() is hole_pad_calc.console
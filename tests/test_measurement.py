@@ -1,5 +1,6 @@
 import pytest
-from hole_pad_calc.measurement import Measurement
+import numpy as np
+from hole_pad_calc.measurement import FixedMeasurement, Measurement, MeasurementArray, ParseError
 from hole_pad_calc.unit import Unit
 from rich.text import Text
 
@@ -84,3 +85,143 @@ def test_rich_text():
     m = Measurement(10.5, 'in')
     result = m.rich()
     assert isinstance(result, Text)
+
+def test_measurement_array_initialization():
+    ma = MeasurementArray([1, 2.5], 'mm')
+    assert ma.values.dtype == np.float64
+    assert ma.values.flags['C_CONTIGUOUS']
+    assert str(ma.unit) == 'mm'
+    assert len(ma) == 2
+
+def test_measurement_array_invalid_unit():
+    with pytest.raises(ValueError):
+        MeasurementArray([1.0], 'invalid')
+
+def test_measurement_array_addition_converts_right_operand():
+    ma = MeasurementArray([1, 2], 'in')
+    result = ma + MeasurementArray([25.4, 50.8], 'mm')
+    assert list(result.values) == [2.0, 4.0]
+    assert str(result.unit) == 'in'
+
+def test_measurement_array_arithmetic_matches_measurement():
+    values = [10.0, 7.5, 3.25]
+    ma = MeasurementArray(values, 'mm')
+    other = Measurement(0.1, 'in')
+    for op in ('__add__', '__sub__', '__mul__', '__truediv__', '__floordiv__'):
+        result = getattr(ma, op)(other)
+        expected = [getattr(Measurement(v, 'mm'), op)(other).value for v in values]
+        assert list(result.values) == expected
+
+def test_measurement_array_conversion_matches_measurement():
+    values = [0.5, 0.65, 1.27, 25.4]
+    converted = MeasurementArray(values, 'mm').convert('mil')
+    assert list(converted.values) == [Measurement(v, 'mm').convert('mil').value for v in values]
+
+def test_measurement_array_slicing_and_iteration():
+    ma = MeasurementArray([1.0, 2.0, 3.0], 'mil')
+    assert isinstance(ma[1:], MeasurementArray)
+    assert list(ma[1:].values) == [2.0, 3.0]
+    item = ma[0]
+    assert isinstance(item, Measurement)
+    assert item.value == 1.0
+    assert [m.value for m in ma] == [1.0, 2.0, 3.0]
+
+def test_measurement_is_immutable():
+    m = Measurement(1.0, 'in')
+    with pytest.raises(AttributeError):
+        m.value = 2.0
+    with pytest.raises(AttributeError):
+        m.unit = 'mm'
+    assert not hasattr(m, '__dict__')
+
+def test_measurement_shares_interned_unit():
+    assert Measurement(1.0, 'mm').unit is Measurement(2.0, Unit('mm')).unit
+
+def test_measurement_make():
+    m = Measurement._make(1.5, Unit('mil'))
+    assert m.value == 1.5
+    assert m.unit is Unit('mil')
+
+@pytest.mark.parametrize('text, value, unit', [
+    ('1.27 mm', 1.27, 'mm'),
+    ('40mil', 40.0, 'mil'),
+    ('0.05"', 0.05, 'in'),
+    (' 2 Inches ', 2.0, 'in'),
+    ('-1e-3 thou', -0.001, 'mil'),
+    ('.5', 0.5, 'in'),
+])
+def test_parse(text, value, unit):
+    m = Measurement.parse(text)
+    assert (m.value, str(m.unit)) == (value, unit)
+
+def test_parse_default_unit_and_errors():
+    assert str(Measurement.parse('12', 'mm').unit) == 'mm'
+    assert isinstance(FixedMeasurement.parse('1 mm'), FixedMeasurement)
+    for text in ('', 'mm', '1.2.3', '1 2', '2 cm'):
+        with pytest.raises(ValueError):
+            Measurement.parse(text)
+
+def test_parse_many_matches_parse():
+    texts = ['1.27mm', '40 mil', '0.05', '1.', '.5 MM', '3 thou', '7e2 mil']
+    column = Measurement.parse_many(texts, 'mil')
+    assert column.units.dtype == np.int8 and len(column.invalid) == 0
+    for unit in ('in', 'mm', 'mil'):
+        expected = [Measurement.parse(text, 'mil').convert(unit).value for text in texts]
+        assert column.convert(unit).values.tolist() == expected
+    assert Measurement.parse_many(np.array(['1', '2 mm'])).values.tolist() == [1.0, 2.0]
+
+def test_parse_many_reports_row_positions():
+    with pytest.raises(ParseError) as info:
+        Measurement.parse_many(['1', 'x', '2 cm', None, '1\n2'] + ['y'] * 6)
+    assert [row for row, _ in info.value.rows] == [1, 2, 3, 4] + list(range(5, 11))
+    assert 'row 2: Invalid unit: cm' in str(info.value) and 'and 5 more' in str(info.value)
+    column = Measurement.parse_many(['1', 'x', '3'], errors='coerce')
+    assert column.invalid.tolist() == [1]
+    assert np.isnan(column.values[1]) and column.values[2] == 3.0
+
+def test_equality_is_unit_normalized():
+    m = Measurement(1.0, 'mm')
+    assert m == m.convert('in') == m.convert('mil')
+    assert Measurement(1.27, 'mm') == Measurement(50, 'mil') == FixedMeasurement(0.05, 'in')
+    assert Measurement(50, 'mil') != Measurement(50.5, 'mil')
+    assert m != 1.0 and not m == 'mm'
+    nan = Measurement(float('nan'))
+    assert nan != nan
+
+def test_measurement_equals_its_conversions():
+    m = Measurement(0.495435, 'in')
+    assert m.key == 49544 and m.convert('mm').key == 49543
+    assert m == m.convert('mm') and m.convert('mm') == m
+    assert m <= m.convert('mm') and not m > m.convert('mm') and not m.convert('mm') < m
+    rng = np.random.default_rng(5)
+    for unit, scale in (('in', 1.0), ('mm', 25.4), ('mil', 1000.0)):
+        for value in rng.uniform(0.001, 3.0, 2_000) * scale:
+            m = Measurement(float(value), unit)
+            for to in ('in', 'mm', 'mil'):
+                assert m == m.convert(to), (m, to)
+
+def test_same_unit_equality_is_a_grid():
+    assert Measurement(0.0000049, 'in') != Measurement(0.0000051, 'in')
+    assert Measurement(0.0000051, 'in') == Measurement(0.0000149, 'in')
+
+def test_unique_merges_conversions_across_a_step():
+    m = Measurement(0.495435, 'in')
+    pins = [m, m.convert('mm'), Measurement(20, 'mil'), m.convert('mil'), Measurement(0.508, 'mm')]
+    assert len(set(pins)) == 3
+    assert Measurement.unique(pins) == [m, Measurement(20, 'mil')]
+    assert Measurement.unique(pins)[0] is m
+
+def test_ordering_and_hashing():
+    pins = [Measurement(1, 'mm'), Measurement(0.03, 'in'), Measurement(20, 'mil'), Measurement(0.0394, 'in')]
+    assert [str(m.unit) for m in sorted(pins)] == ['mil', 'in', 'mm', 'in']
+    assert Measurement(20, 'mil') < Measurement(1, 'mm') <= Measurement(0.0394, 'in')
+    assert Measurement(2, 'mm') > Measurement(78, 'mil') >= Measurement(1.9812, 'mm')
+    assert len({Measurement(1.27, 'mm'), Measurement(0.05, 'in'), Measurement(50, 'mil')}) == 1
+    assert {m.convert('mm'): m for m in pins}[Measurement(30, 'mil')] is pins[1]
+    with pytest.raises(TypeError):
+        Measurement(1.0) < 1.0
+
+def test_key_is_computed_once():
+    m = Measurement(1.0, 'mm')
+    assert m.key == 3937 and m.key is m.key
+    assert FixedMeasurement(1.0, 'mm').key == m.key
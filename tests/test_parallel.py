@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from hole_pad_calc.parallel import parallel_batch
+from hole_pad_calc.rect_calc import HoleMismatchError, RectCalc
+
+def _pins(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.1, 3.0, n), rng.uniform(0.1, 3.0, n)
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_parallel_matches_serial(backend):
+    lengths, widths = _pins(10_000)
+    result = parallel_batch(lengths, widths, unit='mm', backend=backend, workers=3, chunk_size=1_000)
+    serial = RectCalc.batch(lengths, widths, unit='mm', backend=backend)
+    for got, expected in zip(result.batch, serial):
+        np.testing.assert_array_equal(got, expected)
+
+def test_worker_stats_cover_every_row():
+    lengths, widths = _pins(5_000)
+    result = parallel_batch(lengths, widths, workers=2, chunk_size=1_000)
+    assert sum(worker.rows for worker in result.workers) == 5_000
+    assert sum(worker.chunks for worker in result.workers) == 5
+    assert all(worker.rows_per_second > 0 for worker in result.workers)
+
+def test_holes_and_broadcast_width():
+    holes = np.linspace(0.02, 0.2, 3_000)
+    result = parallel_batch(holes=holes, workers=2, chunk_size=500)
+    np.testing.assert_array_equal(result.batch.pad_size, RectCalc.batch(holes=holes).pad_size)
+    lengths, _ = _pins(3_000)
+    result = parallel_batch(lengths, 0.5, unit='mm', workers=2, chunk_size=500)
+    np.testing.assert_array_equal(result.batch.hole_size, RectCalc.batch(lengths, 0.5, unit='mm').hole_size)
+
+def test_workers_use_current_rules():
+    lengths, widths = _pins(4_000)
+    original = RectCalc.ALLOWANCE
+    RectCalc.ALLOWANCE = 0.008
+    try:
+        result = parallel_batch(lengths, widths, workers=2, chunk_size=1_000)
+        np.testing.assert_array_equal(result.batch.pad_size, RectCalc.batch(lengths, widths).pad_size)
+    finally:
+        RectCalc.ALLOWANCE = original
+
+def test_worker_errors_propagate():
+    with pytest.raises(ValueError):
+        parallel_batch([1.0] * 4, [1.0] * 4, holes=[0.001] * 4, workers=2, chunk_size=2)
+
+def test_worker_error_index_is_in_the_callers_array():
+    lengths, widths = _pins(4_000)
+    holes = RectCalc.batch(lengths, widths).hole_size
+    holes[2_345] += 0.01
+    with pytest.raises(HoleMismatchError, match='at index 2345 ') as info:
+        parallel_batch(lengths, widths, holes=holes, workers=2, chunk_size=1_000)
+    assert info.value.index == 2345
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        parallel_batch([1.0], [1.0], workers=0)
+
+def test_grid_and_scalar_inputs():
+    lengths, widths = np.linspace(0.5, 2.0, 50)[:, None], np.linspace(0.2, 1.0, 40)[None, :]
+    result = parallel_batch(lengths, widths, unit='mm', workers=2, chunk_size=500)
+    serial = RectCalc.batch(lengths, widths, unit='mm')
+    for got, expected in zip(result.batch, serial):
+        assert got.shape == (50, 40)
+        np.testing.assert_array_equal(got, expected)
+    for workers in (1, 2):
+        result = parallel_batch(0.5, 0.3, unit='mm', workers=workers)
+        assert result.batch.hole_size.shape == ()
+        assert result.batch.hole_size == RectCalc.batch(0.5, 0.3, unit='mm').hole_size
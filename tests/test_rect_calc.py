@@ -1,5 +1,5 @@
 import pytest
-from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.rect_calc import RectCalc, Measurement, Rule
 import pytest
 from hole_pad_calc.rect_calc import RectCalc, Measurement
 
@@ -95,5 +95,97 @@ def test_text_assembly(rect_calc):
         assert str(text_assembled[2]) == "111.80 mm"
         assert str(text_assembled[3]) == "20.00 mm"
         assert str(text_assembled[4]) == "10.00 mm"
+def test_batch_matches_scalar_from_pin():
+    lengths = [0.5, 0.65, 1.27, 2.0]
+    widths = [0.5, 0.3, 0.64, 0.25]
+    batch = RectCalc.batch(lengths, widths, unit='mm')
+    for i, (length, width) in enumerate(zip(lengths, widths)):
+        rect_calc = RectCalc(Measurement(length, 'mm'), Measurement(width, 'mm'))
+        assert batch.hypo[i] == rect_calc.hypo.value
+        assert batch.hole_size[i] == rect_calc.hole_size.value
+        assert batch.pad_size[i] == rect_calc.pad_size.value
+
+def test_batch_matches_scalar_from_hole():
+    holes = [30, 40, 55.5]
+    batch = RectCalc.batch(holes=holes, unit='mil')
+    for i, hole in enumerate(holes):
+        rect_calc = RectCalc(hole=Measurement(hole, 'mil'))
+        assert batch.length[i] == rect_calc.length.value
+        assert batch.hole_size[i] == rect_calc.hole_size.value
+        assert batch.pad_size[i] == rect_calc.pad_size.value
+
+def test_batch_width_defaults_to_length():
+    batch = RectCalc.batch([0.02, 0.03])
+    assert list(batch.width) == [0.02, 0.03]
+
+def test_batch_inconsistent_hole():
+    with pytest.raises(ValueError):
+        RectCalc.batch([0.02], [0.02], holes=[0.1])
+
+def test_batch_invalid_unit():
+    with pytest.raises(ValueError):
+        RectCalc.batch([1.0], unit='cm')
+
+def test_batch_results_own_their_memory():
+    import numpy as np
+    lengths = np.array([0.02, 0.03])
+    for batch in (RectCalc.batch(lengths), RectCalc.batch(lengths, 0.01), RectCalc.batch(holes=lengths + 0.03)):
+        assert not np.shares_memory(batch.length, lengths)
+        assert not np.shares_memory(batch.length, batch.width)
+    for batch in RectCalc.levels(lengths).values():
+        assert not np.shares_memory(batch.length, lengths)
+
+def test_derived_attributes_are_lazy():
+    calc = RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil'))
+    assert 'pad_size' not in vars(calc)
+    pad = calc.pad_size
+    assert 'hole_size' in vars(calc) and calc.pad_size is pad
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_assigning_an_input_recomputes_derived_values(backend):
+    calc = RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil'), backend=backend)
+    calc.pad_size
+    calc.width = RectCalc(Measurement(40, 'mil'), backend=backend).width
+    fresh = RectCalc(Measurement(20, 'mil'), Measurement(40, 'mil'), backend=backend)
+    assert calc.hypo.value == fresh.hypo.value
+    assert calc.hole_size.value == fresh.hole_size.value
+    assert calc.pad_size.value == fresh.pad_size.value
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        RectCalc(Measurement(20, 'mil')).diameter
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_levels_match_batch_per_rule(backend):
+    lengths, widths = [10, 20.5, 33], [5, 10, 12.7]
+    levels = RectCalc.levels(lengths, widths, unit='mil', backend=backend)
+    assert list(levels) == ['A', 'B', 'C']
+    assert levels['A'].hole_size is levels['C'].hole_size
+    for name, result in levels.items():
+        previous = RectCalc.use_rule(name)
+        try:
+            expected = RectCalc.batch(lengths, widths, unit='mil', backend=backend)
+        finally:
+            RectCalc.use_rule(previous)
+        for field in expected._fields:
+            assert getattr(result, field).tolist() == getattr(expected, field).tolist()
+
+def test_custom_rules_and_use_rule():
+    shop = Rule(clearance=0.01, annular_ring=0.005, allowance=0.02)
+    levels = RectCalc.levels([20], [10], unit='mil', rules={'shop': shop, 'A': RectCalc.RULES['A']})
+    assert levels['shop'].hole_size[0] == 0.032
+    assert levels['shop'].pad_size[0] == pytest.approx(0.057)
+    assert levels['A'].pad_size[0] == 0.048
+    previous = RectCalc.use_rule('C')
+    try:
+        assert RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil')).pad_size.value == pytest.approx(0.04)
+    finally:
+        RectCalc.use_rule(previous)
+    assert RectCalc.rule() == RectCalc.RULES['A']
+    with pytest.raises(ValueError):
+        RectCalc.use_rule('D')
+    with pytest.raises(ValueError):
+        RectCalc.levels([20], rules=['A', 'D'])
+
 if __name__ == '__main__':
     pytest.main()
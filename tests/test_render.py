@@ -0,0 +1,56 @@
+import io
+import numpy as np
+import pytest
+from rich.console import Console
+from hole_pad_calc.cli import main
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.render import header, print_rich, write_plain
+from hole_pad_calc.store import write_store
+
+def test_plain_rows_match_measurement_convert():
+    calc = RectCalc(Measurement(1.27, 'mm'), Measurement(0.64, 'mm'))
+    output = io.StringIO()
+    assert write_plain(RectCalc.batch([1.27], [0.64], unit='mm'), output) == 1
+    head, row = output.getvalue().splitlines()
+    assert head == header() and head.split()[0] == 'length_in' and len(head) == len(row)
+    fields = ('length', 'width', 'hypo', 'hole_size', 'pad_size')
+    expected = [
+        round(getattr(calc, field).convert(unit).value, places)
+        for unit, places in (('in', 5), ('mm', 4), ('mil', 3))
+        for field in fields
+    ]
+    assert [float(value) for value in row.split()] == expected
+
+def test_plain_streams_in_chunks_and_accepts_calcs():
+    batch = RectCalc.batch(np.linspace(10, 40, 10).reshape(2, 5), unit='mil')
+    output = io.StringIO()
+    assert write_plain(batch, output, unit='in', units=['mil'], chunk_rows=3, show_header=False) == 10
+    lines = output.getvalue().splitlines()
+    calcs = [RectCalc(Measurement(v, 'mil')) for v in np.linspace(10, 40, 10).tolist()]
+    from_calcs = io.StringIO()
+    write_plain(calcs, from_calcs, units=['mil'], chunk_rows=4, show_header=False)
+    assert from_calcs.getvalue().splitlines() == lines
+    with pytest.raises(ValueError):
+        write_plain(batch, output, units=['cm'])
+    with pytest.raises(ValueError):
+        write_plain([1.0], output)
+
+def test_rich_pages():
+    batch = RectCalc.batch([20, 30, 40], [10, 15, 20], unit='mil')
+    plain, text = io.StringIO(), io.StringIO()
+    write_plain(batch, plain, units=['mm'])
+    assert print_rich(batch, Console(file=text), units=['mm'], page_rows=2) == 3
+    lines = text.getvalue().splitlines()
+    assert lines[0] == 'Rectangular Hole Calculator'
+    assert lines[1:] == [lines[1], *plain.getvalue().splitlines()[1:3], lines[1], plain.getvalue().splitlines()[3]]
+    colored = io.StringIO()
+    print_rich(batch, Console(file=colored, force_terminal=True, color_system='truecolor'), units=['mm'], title=None)
+    assert '\x1b[' in colored.getvalue() and '0.5080' in colored.getvalue()
+
+def test_show_command(tmp_path, capsys):
+    path = tmp_path / 'grid.hpcs'
+    write_store(path, RectCalc.batch([20, 30], [10, 15], unit='mil'), unit='mil')
+    assert main(['show', str(path), '--units', 'mil']) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ['length_mil', 'width_mil', 'hypo_mil', 'hole_mil', 'pad_mil']
+    assert lines[1].split()[3:] == ['28.000', '48.000']
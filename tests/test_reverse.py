@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.reverse import PinIndex
+from hole_pad_calc.store import write_store
+from hole_pad_calc.sweep import axis
+
+@pytest.fixture(scope='module')
+def index():
+    return PinIndex.build(axis(5, 40, 0.5), axis(5, 40, 0.5), unit='mil')
+
+def test_hole_query_matches_brute_force(index):
+    found = index.holes(40, unit='mil')
+    assert len(found.length) > 0
+    expected = [
+        (length, width)
+        for length in axis(5, 40, 0.5).tolist()
+        for width in axis(5, 40, 0.5).tolist()
+        if RectCalc(Measurement(length, 'mil'), Measurement(width, 'mil')).hole_size.value == 0.04
+    ]
+    assert list(zip(np.round(found.length * 1000, 6).tolist(), np.round(found.width * 1000, 6).tolist())) == expected
+    assert np.all(found.hole_size == 0.04)
+
+def test_ranges_and_units(index):
+    fits = index.holes(0, 40, 'mil')
+    assert fits.hole_size.max() == 0.04
+    assert len(fits.hole_size) == np.count_nonzero(index.batch.hole_size <= 0.04)
+    assert len(index.holes(1.016, unit='mm').hole_size) == len(index.holes(40, unit='mil').hole_size)
+    pads = index.pads(60, 62, 'mil')
+    assert np.all((pads.pad_size >= 0.06 - 1e-12) & (pads.pad_size <= 0.062 + 1e-12))
+    assert np.array_equal(pads.length, index.holes(40, 42, 'mil').length)
+    assert len(index.holes(1, unit='in').hole_size) == 0
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / 'pins.hpcs'
+    index.save(path)
+    with PinIndex.load(path) as loaded:
+        assert len(loaded) == len(index)
+        assert loaded.backend == index.backend
+        assert np.array_equal(loaded.holes(30, 35, 'mil').width, index.holes(30, 35, 'mil').width)
+
+def test_load_rejects_unsorted_stores(tmp_path):
+    path = tmp_path / 'batch.hpcs'
+    write_store(path, RectCalc.batch([40, 10], [40, 10], unit='mil'))
+    with pytest.raises(ValueError):
+        PinIndex.load(path)
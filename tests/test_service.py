@@ -0,0 +1,123 @@
+import asyncio
+import json
+import pytest
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.service import Service
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+def test_pin_and_hole_requests():
+    async def scenario():
+        async with Service() as service:
+            client = service.client()
+            pin = await client.post('/pin', {'length': 1.27, 'width': 0.64, 'unit': 'mm'})
+            holes = await client.post('/hole', {'hole': [30, 40], 'unit': 'mil', 'output_unit': 'mil'})
+            return pin, holes
+    (status, pin), (hole_status, holes) = run(scenario())
+    calc = RectCalc(Measurement(1.27, 'mm'), Measurement(0.64, 'mm'))
+    assert status == hole_status == 200
+    assert pin['unit'] == 'mm' and pin['pad_size'] == calc.pad_size.convert('mm').value
+    assert pin['hole_size'] == calc.hole_size.convert('mm').value
+    assert holes['hole_size'] == [30.0, 40.0]
+    assert holes['pad_size'] == [RectCalc(hole=Measurement(h, 'mil')).pad_size.convert('mil').value for h in (30, 40)]
+
+def test_concurrent_requests_are_micro_batched():
+    async def scenario():
+        async with Service(max_delay=0.01) as service:
+            client = service.client()
+            results = await asyncio.gather(*(
+                client.post('/pin', {'length': 10 + i, 'width': 5, 'unit': 'mil'}) for i in range(200)
+            ))
+            return results, service.stats()
+    results, stats = run(scenario())
+    expected = [RectCalc(Measurement(10 + i, 'mil'), Measurement(5, 'mil')).hole_size.convert('mil').value for i in range(200)]
+    assert [body['hole_size'] for _, body in results] == expected
+    assert stats.requests == 200 and stats.batches < 200
+    assert stats.mean_batch_rows > 1 and stats.max_queue_depth > 1 and stats.queue_depth == 0
+    assert set(stats.latency_ms['POST /pin']) == {'p50', 'p90', 'p99', 'max', 'count'}
+
+def test_errors_are_isolated_per_request():
+    async def scenario():
+        async with Service(max_delay=0.01) as service:
+            client = service.client()
+            good, bad = await asyncio.gather(
+                client.post('/hole', {'hole': 40, 'unit': 'mil'}),
+                client.post('/hole', {'hole': 1, 'unit': 'mil'}),
+            )
+            return good, bad, [
+                await client.post('/pin', {'length': 'x'}),
+                await client.post('/pin', {'length': [1, 2], 'width': [1]}),
+                await client.post('/pin', {'length': 1, 'unit': 'cm'}),
+                await client.get('/pin'),
+                await client.get('/missing'),
+            ], await client.get('/stats')
+    good, bad, errors, (_, stats) = run(scenario())
+    assert good[0] == 200 and good[1]['hole_size'] == 40.0
+    assert bad[0] == 400 and 'not consistent' in bad[1]['error']
+    assert [status for status, _ in errors] == [400, 400, 400, 405, 404]
+    assert stats['errors'] == 6 and 'other' in stats['latency_ms']
+
+def test_http_keep_alive():
+    async def scenario():
+        async with Service() as service:
+            server = await service.listen(port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            bodies = []
+            for payload in ({'length': [20, 30], 'unit': 'mil'}, {'hole': 0.04}):
+                body = json.dumps(payload).encode()
+                path = b'/pin' if 'length' in payload else b'/hole'
+                writer.write(b'POST ' + path + b' HTTP/1.1\r\nHost: test\r\nContent-Length: %d\r\n\r\n' % len(body) + body)
+                head = (await reader.readuntil(b'\r\n\r\n')).decode()
+                length = int(head.lower().split('content-length:')[1].split('\r\n')[0])
+                bodies.append((head.split('\r\n')[0], json.loads(await reader.readexactly(length))))
+            writer.write(b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n')
+            closing = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return bodies, closing
+    bodies, closing = run(scenario())
+    assert bodies[0][0] == 'HTTP/1.1 200 OK' and bodies[0][1]['hole_size'] == [34.0, 48.0]
+    assert bodies[1][1]['length'] == RectCalc(hole=Measurement(0.04)).length.value
+    assert closing.endswith(b'{"status": "ok"}')
+
+def test_requires_a_running_service():
+    with pytest.raises(RuntimeError):
+        run(Service().calculate('pin', {'length': 1}))
+    with pytest.raises(ValueError):
+        Service(max_batch=0)
+
+def test_malformed_values_get_a_400():
+    async def scenario():
+        async with Service() as service:
+            client = service.client()
+            return [
+                await client.post('/pin', {'length': 1, 'unit': []}),
+                await client.post('/pin', {'length': 1, 'output_unit': {}}),
+                await client.post('/pin', {'length': 10 ** 400}),
+                await client.post('/hole', {'hole': [1, -10 ** 400]}),
+            ]
+    assert [status for status, _ in run(scenario())] == [400, 400, 400, 400]
+
+def test_internal_errors_get_a_500_over_http(monkeypatch):
+    def broken(*args):
+        raise TypeError('broken')
+    monkeypatch.setattr('hole_pad_calc.service._calculate', broken)
+
+    async def scenario():
+        async with Service() as service:
+            server = await service.listen(port=0)
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+            body = b'{"length": 1}'
+            writer.write(b'POST /pin HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n' % len(body) + body)
+            response = await reader.read()
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return response, service.stats()
+    response, stats = run(scenario())
+    assert response.startswith(b'HTTP/1.1 500 Internal Server Error')
+    assert response.endswith(b'{"error": "TypeError: broken"}')
+    assert stats.errors == 1
@@ -0,0 +1,70 @@
+import io
+import numpy as np
+import pytest
+from hole_pad_calc import shapes
+from hole_pad_calc.cli import run_batch
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+
+def test_rect_kernel_is_rect_calc():
+    size = shapes.RECT.calc(Measurement(20, 'mil'), Measurement(10, 'mil'))
+    calc = RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil'))
+    assert [m.value for m in size] == [calc.hypo.value, calc.hole_size.value, calc.pad_size.value]
+    assert shapes.kernel('rect').batch([20], [10], unit='mil').pad_size.tolist() == [calc.pad_size.value]
+
+def test_round_and_oblong_use_the_enclosing_diameter():
+    assert shapes.ROUND.hole(Measurement(30, 'mil')).value == 0.036
+    assert shapes.ROUND.pad(Measurement(30, 'mil')).value == pytest.approx(0.056)
+    assert shapes.OBLONG.hole(Measurement(40, 'mil'), Measurement(20, 'mil')).value == 0.046
+    assert shapes.OBLONG.calc(Measurement(20, 'mil'), Measurement(40, 'mil')).diameter.value == 0.04
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_mixed_batch_matches_scalar_kernels(backend):
+    rng = np.random.default_rng(1)
+    names = rng.choice(['rect', 'round', 'oblong'], 200)
+    lengths, widths = rng.uniform(5, 60, 200), rng.uniform(5, 30, 200)
+    result = shapes.batch(names, lengths, widths, unit='mil', backend=backend)
+    for i, name in enumerate(names.tolist()):
+        size = shapes.kernel(name).calc(
+            Measurement(float(lengths[i]), 'mil'), Measurement(float(widths[i]), 'mil'), backend=backend
+        )
+        assert result.hole_size[i] == size.hole_size.value
+        assert result.pad_size[i] == pytest.approx(size.pad_size.value)
+        assert result.hypo[i] == pytest.approx(size.diameter.value)
+
+def test_single_shape_and_unknown_shapes():
+    assert shapes.batch('round', [30, 40], unit='mil').hole_size.tolist() == [0.036, 0.046]
+    with pytest.raises(ValueError, match='hexagon'):
+        shapes.batch(['rect', 'hexagon'], [20, 20], unit='mil')
+    with pytest.raises(ValueError):
+        shapes.batch(['rect'], [20, 30])
+
+def test_register_custom_kernel():
+    class Square(shapes.PinKernel):
+        name = 'square'
+
+        @staticmethod
+        def diameter(length, width):
+            return length * 2 ** 0.5
+
+    shapes.register(Square())
+    try:
+        result = shapes.batch(['square', 'rect'], [20, 20], [0, 20], unit='mil')
+        assert result.hole_size[0] == result.hole_size[1]
+    finally:
+        del shapes.SHAPES['square']
+
+def test_batch_cli_shape_column():
+    output, errors = io.StringIO(), io.StringIO()
+    text = 'shape,length,width,hole\nround,30,,\nrect,20,10,\noblong,40,20,\nround,30,30,40\n'
+    failed = run_batch(io.StringIO(text), output, errors, unit='mil', output_unit='mil')
+    lines = output.getvalue().splitlines()
+    assert [line.split(',')[-2] for line in lines[1:4]] == ['36.0', '28.0', '46.0']
+    assert failed == 1 and errors.getvalue().startswith('line 5:')
+
+def test_kernel_without_diameter_cannot_be_registered():
+    class Incomplete(shapes.PinKernel):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError, match='diameter'):
+        shapes.register(Incomplete())
+    assert 'incomplete' not in shapes.SHAPES
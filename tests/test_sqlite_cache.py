@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from hole_pad_calc.rect_calc import RectCalc
+from hole_pad_calc.sqlite_cache import SQLiteCache
+
+LENGTHS = [0.5, 0.65, 1.27, 0.5]
+WIDTHS = [0.3, 0.3, 0.64, 0.3]
+
+@pytest.fixture
+def cache(tmp_path):
+    with SQLiteCache(tmp_path / 'results.db') as cache:
+        yield cache
+
+def _assert_same(batch, expected):
+    for column, expected_column in zip(batch, expected):
+        assert np.array_equal(column, expected_column)
+
+def test_batch_matches_rect_calc(cache):
+    expected = RectCalc.batch(LENGTHS, WIDTHS, unit='mm')
+    _assert_same(cache.batch(LENGTHS, WIDTHS, unit='mm'), expected)
+    _assert_same(cache.batch(LENGTHS, WIDTHS, unit='mm'), expected)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+def test_batch_from_holes_and_fixed_backend(cache):
+    holes = [30, 40, 55.5]
+    _assert_same(cache.batch(holes=holes, unit='mil'), RectCalc.batch(holes=holes, unit='mil'))
+    _assert_same(
+        cache.batch(LENGTHS, WIDTHS, unit='mm', backend='fixed'),
+        RectCalc.batch(LENGTHS, WIDTHS, unit='mm', backend='fixed'),
+    )
+
+def test_one_query_per_batch(cache):
+    statements = []
+    cache._connection.set_trace_callback(statements.append)
+    cache.batch(LENGTHS, WIDTHS, unit='mm')
+    cache.batch(LENGTHS, WIDTHS, unit='mm')
+    assert len([s for s in statements if 'FROM json_each' in s]) == 2
+
+def test_shared_between_connections(tmp_path):
+    with SQLiteCache(tmp_path / 'results.db') as writer, SQLiteCache(tmp_path / 'results.db') as reader:
+        writer.batch(LENGTHS, WIDTHS, unit='mm')
+        reader.batch(LENGTHS, WIDTHS, unit='mm')
+        assert reader.misses == 0
+
+def test_rule_change_invalidates(cache, monkeypatch):
+    cache.batch(LENGTHS, WIDTHS, unit='mm')
+    monkeypatch.setattr(RectCalc, 'ALLOWANCE', 0.012)
+    result = cache.batch(LENGTHS, WIDTHS, unit='mm')
+    assert cache.hits == 0
+    _assert_same(result, RectCalc.batch(LENGTHS, WIDTHS, unit='mm'))
+    assert cache.prune() == 3
+    assert len(cache) == 3
+
+def test_off_grid_and_broadcast_inputs_match_rect_calc(cache):
+    rng = np.random.default_rng(3)
+    lengths = np.append(rng.uniform(0.005, 0.2, 500), 0.13910292408615257)
+    widths = np.append(rng.uniform(0.005, 0.2, 500), 0.04629137747525968)
+    _assert_same(cache.batch(lengths, widths), RectCalc.batch(lengths, widths))
+    _assert_same(cache.batch(lengths, widths), RectCalc.batch(lengths, widths))
+    assert cache.hits == len(lengths)
+    grid = (lengths[:20, None] * 25.4, widths[None, :30] * 25.4)
+    result = cache.batch(*grid, unit='mm')
+    assert result.hole_size.shape == (20, 30)
+    _assert_same(result, RectCalc.batch(*grid, unit='mm'))
+    _assert_same(cache.batch(holes=[[30, 40], [41.3, 55.5]], unit='mil'), RectCalc.batch(holes=[[30, 40], [41.3, 55.5]], unit='mil'))
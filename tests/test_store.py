@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from hole_pad_calc.cli import main
+from hole_pad_calc.rect_calc import RectCalc
+from hole_pad_calc.store import ResultStore, StoreWriter, write_store
+
+def test_round_trip_in_chunks(tmp_path):
+    path = tmp_path / 'pins.hpcs'
+    lengths = np.linspace(0.1, 3.0, 1000)
+    with StoreWriter(path, unit='mm') as writer:
+        for chunk in np.array_split(lengths, 7):
+            writer.append(RectCalc.batch(chunk, chunk / 2, unit='mm'))
+    expected = RectCalc.batch(lengths, lengths / 2, unit='mm')
+    with ResultStore(path) as store:
+        assert len(store) == 1000
+        assert store.header.unit == 'mm'
+        assert store.header.clearance == RectCalc.CLEARANCE
+        np.testing.assert_array_equal(store.column('hypo')[:5], np.round(expected.hypo[:5] * 25.4, 4))
+
+def test_slices_are_views_and_rows_are_random_access(tmp_path):
+    path = tmp_path / 'pins.hpcs'
+    batch = RectCalc.batch(np.linspace(0.01, 0.1, 50))
+    write_store(path, batch)
+    store = ResultStore(path)
+    part = store[10:20]
+    assert part.pad_size.base is not None
+    assert not part.pad_size.flags.writeable
+    np.testing.assert_array_equal(part.pad_size, batch.pad_size[10:20])
+    row = store[42]
+    assert row.hole_size == batch.hole_size[42]
+    assert store[np.array([3, 1])].length.tolist() == batch.length[[3, 1]].tolist()
+    with pytest.raises(KeyError):
+        store.column('diameter')
+    del part
+    store.close()
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'pins.hpcs'
+    path.write_bytes(b'x' * 100)
+    with pytest.raises(ValueError):
+        ResultStore(path)
+
+def test_failed_writer_leaves_no_file(tmp_path):
+    path = tmp_path / 'pins.hpcs'
+    with pytest.raises(RuntimeError):
+        with StoreWriter(path) as writer:
+            writer.append(RectCalc.batch([0.02]))
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+def test_sweep_cli_writes_store(tmp_path):
+    path = tmp_path / 'grid.hpcs'
+    assert main(['sweep', '--length', '10:20:5', '--width', '10', '--unit', 'mil', '-o', str(path)]) == 0
+    with ResultStore(path) as store:
+        assert store.unit == 'mil'
+        assert store.column('length').tolist() == [10.0, 15.0, 20.0]
+        assert store[0].pad_size == 40.0
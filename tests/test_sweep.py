@@ -0,0 +1,58 @@
+import io
+import numpy as np
+import pytest
+from hole_pad_calc.cli import main
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.sweep import axis, sweep, write_csv
+
+def test_axis_is_inclusive_and_exact():
+    values = axis(10, 60, 0.5)
+    assert len(values) == 101
+    assert values[-1] == 60.0
+    assert axis(0.1, 0.3, 0.1).tolist() == [0.1, 0.2, 0.3]
+    with pytest.raises(ValueError):
+        axis(1, 2, 0)
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_sweep_matches_rect_calc(backend):
+    lengths, widths = axis(10, 20, 2.5), axis(5, 8, 1)
+    result = sweep(lengths, widths, unit='mil', backend=backend)
+    assert result.pad_size.shape == (5, 4)
+    for i, length in enumerate(lengths):
+        for j, width in enumerate(widths):
+            calc = RectCalc(Measurement(length, 'mil'), Measurement(width, 'mil'), backend=backend)
+            assert result.hypo[i, j] == calc.hypo.value
+            assert result.hole_size[i, j] == calc.hole_size.value
+            assert result.pad_size[i, j] == calc.pad_size.value
+
+def test_records_and_csv():
+    result = sweep([20, 30], [10], unit='mil')
+    records = result.records()
+    assert records.shape == (2, 1)
+    assert records[0, 0].tolist() == (20.0, 10.0, 22.361, 28.0, 48.0)
+    output = io.StringIO()
+    write_csv(result, output)
+    assert output.getvalue().splitlines() == [
+        'length,width,hypo,hole,pad',
+        '20.0,10.0,22.361,28.0,48.0',
+        '30.0,10.0,31.623,38.0,58.0',
+    ]
+
+def test_sweep_cli_writes_npy(tmp_path):
+    target = tmp_path / 'grid.npy'
+    assert main(['sweep', '--length', '10:60:0.5', '--width', '10,20', '--unit', 'mil', '-o', str(target)]) == 0
+    grid = np.load(target)
+    assert grid.shape == (101, 2)
+    assert grid['pad'][0, 0] == 40.0
+
+@pytest.mark.parametrize('backend', ['float', 'fixed'])
+def test_batch_axes_are_owned_and_match_rect_calc(backend):
+    lengths, widths = axis(10, 20, 2.5), axis(5, 8, 1)
+    grid = sweep(lengths, widths, unit='mm', backend=backend).batch()
+    expected = RectCalc.batch(lengths[:, None], widths[None, :], unit='mm', backend=backend)
+    assert np.array_equal(grid.length, expected.length)
+    assert np.array_equal(grid.width, expected.width)
+    assert grid.length.flags.writeable and grid.width.flags.writeable
+    assert not np.shares_memory(grid.length, grid.width)
+    grid.length[0, 0] = 0
+    assert grid.length[0, 1] != 0
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from hole_pad_calc.cli import main
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.tolerance import monte_carlo
+
+def test_zero_tolerance_is_the_nominal_clearance():
+    report = monte_carlo(20, 10, tolerance=0, unit='mil', samples=1000, seed=1)
+    calc = RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil'))
+    assert report.hole == pytest.approx(calc.hole_size.convert('mil').value)
+    assert report.nominal_clearance == pytest.approx(28 - np.hypot(20, 10))
+    assert report.std == pytest.approx(0, abs=1e-9)
+    assert report.min == pytest.approx(report.max)
+    assert report.interference == 0
+
+def test_seeded_runs_do_not_depend_on_workers():
+    options = dict(tolerance=1, hole_tolerance=2, unit='mil', samples=200_000, chunk_size=50_000, seed=7)
+    serial = monte_carlo(20, 10, **options)
+    assert serial == monte_carlo(20, 10, **options)
+    assert serial == monte_carlo(20, 10, workers=2, **options)
+    assert serial != monte_carlo(20, 10, **dict(options, seed=8))
+
+def test_statistics_match_the_samples():
+    report = monte_carlo(20, 10, tolerance=0, hole_tolerance=3, unit='mil', samples=400_000, seed=3)
+    # Only the hole varies, so clearance is normal with sigma = tolerance / 3.
+    assert report.mean == pytest.approx(report.nominal_clearance, abs=0.01)
+    assert report.std == pytest.approx(1.0, rel=0.01)
+    assert report.percentiles[50.0] == pytest.approx(report.nominal_clearance, abs=0.01)
+    assert report.percentiles[99.0] - report.percentiles[50.0] == pytest.approx(2.326, abs=0.02)
+    assert report.min <= report.percentiles[0.1] <= report.percentiles[99.9] <= report.max
+
+def test_interference_fraction():
+    # A uniform hole tolerance of twice the clearance spreads it over [-c, 3c]: a quarter interferes.
+    clearance = 28 - np.hypot(20, 10)
+    report = monte_carlo(20, 10, tolerance=0, hole_tolerance=2 * clearance, unit='mil', distribution='uniform',
+                         samples=200_000, seed=5)
+    assert report.interference == pytest.approx(0.25, abs=0.005)
+    assert report.min >= -1e-9 - clearance
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        monte_carlo(20, tolerance=1, distribution='triangular')
+    with pytest.raises(ValueError):
+        monte_carlo(20, tolerance=-1)
+    with pytest.raises(ValueError):
+        monte_carlo(20, tolerance=1, unit='ft')
+
+def test_cli(capsys):
+    assert main(['tolerance', '--length', '20', '--width', '10', '--unit', 'mil', '--tolerance', '1',
+                 '--samples', '1e4', '--seed', '1']) == 0
+    output = capsys.readouterr().out
+    assert 'samples            10,000' in output
+    assert 'hole               28.0000 mil' in output
+    assert 'interference' in output
@@ -0,0 +1,50 @@
+import logging
+import numpy as np
+from hole_pad_calc import trace
+from hole_pad_calc.rect_calc import RectCalc, Measurement
+from hole_pad_calc.trace import LogSubscriber, StageStats, traced
+
+def test_no_hooks_by_default():
+    assert trace.HOOKS == []
+
+def test_scalar_stages_are_counted():
+    stats = StageStats()
+    with traced(stats):
+        RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil')).pad_size
+    report = stats.report()
+    assert report['hypotenuse'].calls == 1
+    assert report['hole'].calls == 1
+    assert report['pad'].calls == 1
+    assert report['convert'].calls > 0
+    assert all(timing.seconds >= 0 for timing in report.values())
+    assert trace.HOOKS == []
+
+def test_fixed_and_batch_stages():
+    stats = StageStats()
+    with traced(stats):
+        RectCalc(Measurement(20, 'mil'), backend='fixed').pad_size
+        RectCalc.batch(np.full(100, 0.5), unit='mm', backend='fixed')
+        RectCalc.batch(np.full(50, 0.5), unit='mm')
+    report = stats.report()
+    assert report['hypotenuse'] == trace.StageTiming(3, 151, report['hypotenuse'].seconds)
+    assert report['pad'].items == 151
+
+def test_events_carry_results():
+    events = []
+    with traced(lambda stage, seconds, data: events.append((stage, data))):
+        calc = RectCalc(Measurement(20, 'mil'), Measurement(10, 'mil'))
+        calc.hole_size
+    hole = [data for stage, data in events if stage == 'hole']
+    assert hole[0]['result'].value == calc.hole_size.value
+
+def test_log_subscriber(caplog):
+    with caplog.at_level(logging.DEBUG, logger='hole_pad_calc'):
+        with traced(LogSubscriber(stages=['pad'])):
+            RectCalc(Measurement(20, 'mil')).pad_size
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith('pad (')
+
+def test_verbose_uses_console_subscriber(capsys):
+    RectCalc(Measurement(20, 'mil'), verbose=True)
+    assert 'hypotenuse' in capsys.readouterr().out
+    assert trace.HOOKS == []
@@ -28,3 +28,38 @@ def test_conversion_invalid():
     unit = Unit('in')
     with pytest.raises(ValueError):
         unit.convert(1, 'invalid')
+
+def test_unit_is_interned():
+    assert Unit('mm') is Unit('mm')
+    assert Unit(Unit('mil')) is Unit('mil')
+    assert len(Unit._INSTANCES) == 3
+
+def test_unit_pickle_preserves_identity():
+    import pickle
+    assert pickle.loads(pickle.dumps(Unit('in'))) is Unit('in')
+
+def test_unit_is_read_only():
+    unit = Unit('in')
+    with pytest.raises(AttributeError):
+        unit.unit = 'mm'
+
+def test_unit_and_measurement_conversions_agree():
+    from hole_pad_calc.measurement import Measurement
+    for value in (0.65, 1.27, 25.4, 123.456):
+        for from_unit in Unit.VALID_UNITS:
+            for to_unit in Unit.VALID_UNITS:
+                if from_unit == to_unit:
+                    continue
+                assert Unit(from_unit).convert(value, to_unit) == Measurement(value, from_unit).convert(to_unit).value
+
+def test_convert_array_matches_convert_value():
+    import numpy as np
+    from hole_pad_calc.unit import convert_array, convert_value
+    values = np.linspace(0.01, 50.0, 1001)
+    result = convert_array(values, 'mm', 'mil')
+    assert list(result) == [convert_value(v, 'mm', 'mil') for v in values.tolist()]
+
+def test_conversion_uses_exact_factors():
+    unit = Unit('mm')
+    assert unit.convert(25.4, 'in') == 1.0
+    assert unit.convert(254, 'mil') == 10000.0